@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: bullet-list slides through python-pptx proxies vs. one lxml parse.
+
+Compares the original create_content_slide loop (add_paragraph() plus the
+text/level/font.size setters per bullet) with the current helper, which
+renders the whole paragraph list with deck_styles.add_paragraphs. Before
+timing, it checks that both paths produce identical slide XML.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx.util import Pt
+
+import template_cache
+from create_presentation_v2 import create_content_slide
+
+
+def legacy_content_slide(prs, title, content_items, layout_idx=1):
+    """create_content_slide as it was before the lxml fast path."""
+    slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+    slide.shapes.title.text = title
+    text_frame = slide.placeholders[1].text_frame
+    text_frame.clear()
+    for item in content_items:
+        p = text_frame.add_paragraph()
+        p.text = item
+        p.level = 0
+        p.font.size = Pt(16)
+    return slide
+
+
+# Covers escaping, soft line breaks, control characters and empty lines
+EDGE_CASES = ["A & B < C > D", "line one\nline two", "tab\there", "bell\x07", "", "• “quoted” ✓"]
+
+
+def check_identical(bullets):
+    """Both paths must produce byte-identical slide XML."""
+    items = EDGE_CASES + [f"• Agenda item {i}" for i in range(bullets)]
+    legacy = legacy_content_slide(template_cache.new_presentation(), "Agenda", items)
+    fast = create_content_slide(template_cache.new_presentation(), "Agenda", items)
+    if legacy.part.blob != fast.part.blob:
+        raise SystemExit("✗ fast path XML differs from the proxy path")
+
+
+def time_path(builder, slides, bullets):
+    items = [f"• Transcript line {i}: character consistency held across frames" for i in range(bullets)]
+    prs = template_cache.new_presentation()
+    start = time.perf_counter()
+    for _ in range(slides):
+        builder(prs, "Agenda", items)
+    return (time.perf_counter() - start) / slides
+
+
+def main():
+    """Compare the two bullet-list paths across bullet counts."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=200, help="slides per case (default: 200)")
+    parser.add_argument("--bullets", nargs="+", type=int, default=[1, 5, 10, 25, 50])
+    args = parser.parse_args()
+
+    check_identical(max(args.bullets))
+    print("✓ fast path XML identical to the proxy path\n")
+    print(f"{'BULLETS':>7} {'PROXIES':>12} {'LXML':>12} {'SPEEDUP':>8}")
+    for bullets in args.bullets:
+        legacy = time_path(legacy_content_slide, args.slides, bullets)
+        fast = time_path(create_content_slide, args.slides, bullets)
+        print(f"{bullets:>7} {legacy * 1e6:>9.0f} µs {fast * 1e6:>9.0f} µs {legacy / fast:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: chart slides over large series, with and without LTTB downsampling.
+
+Builds a line chart from synthetic series of increasing length, once with
+every point and once downsampled to --max-points, and reports build time and
+the size of the chart part. Before timing, it checks that LTTB keeps the
+first and last points and the extremes of a spiky series. python-pptx's
+chart XML generation grows faster than linearly with the point count, so
+full builds above --full-limit points are skipped.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx.util import Inches
+
+import template_cache
+from deck_charts import add_chart, lttb
+
+
+def synthetic_table(points, seed=0):
+    rng = random.Random(seed)
+    xs = [i * 0.01 for i in range(points)]
+    ys = [math.sin(i / (points / 20)) + rng.gauss(0, 0.1) for i in range(points)]
+    return "t", xs, {"signal": ys}
+
+
+def check_shape(points=100_000, threshold=1000):
+    """LTTB must keep the endpoints and a spike far above the noise."""
+    _, xs, series = synthetic_table(points)
+    ys = series["signal"]
+    ys[points // 3] = 50.0
+    ys[2 * points // 3] = -50.0
+    kept = lttb(xs, ys, threshold)
+    if len(kept) != threshold or kept[0] != 0 or kept[-1] != points - 1:
+        raise SystemExit("✗ LTTB did not keep the requested number of points and both endpoints")
+    if points // 3 not in kept or 2 * points // 3 not in kept:
+        raise SystemExit("✗ LTTB dropped a spike")
+
+
+def time_chart(table, max_points, repeat):
+    best = None
+    for _ in range(repeat):
+        prs = template_cache.new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        start = time.perf_counter()
+        chart = add_chart(slide, table, Inches(0.5), Inches(1.5), Inches(9), Inches(5), max_points=max_points)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(chart.part.blob), len(chart.part.chart_workbook.xlsx_part.blob)
+
+
+def main():
+    """Compare full and downsampled chart builds across series lengths."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("--max-points", type=int, default=1000, help="LTTB threshold (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default: 3)")
+    parser.add_argument("--full-limit", type=int, default=10_000,
+                        help="largest series built without downsampling (default: 10000)")
+    args = parser.parse_args()
+
+    check_shape(max(args.points), args.max_points)
+    print("✓ LTTB keeps endpoints and spikes\n")
+    print(f"{'POINTS':>7} {'FULL':>10} {'CHART XML':>10} {'LTTB':>10} {'CHART XML':>10} {'XLSX':>9} {'SPEEDUP':>8}")
+    for points in args.points:
+        table = synthetic_table(points)
+        fast, fast_size, xlsx_size = time_chart(table, args.max_points, args.repeat)
+        lttb_columns = f"{fast * 1e3:>7.0f} ms {fast_size / 1024:>7.0f} KB {xlsx_size / 1024:>6.0f} KB"
+        if points > args.full_limit:
+            print(f"{points:>7} {'—':>10} {'—':>10} {lttb_columns} {'—':>8}")
+            continue
+        full, full_size, _ = time_chart(table, points, args.repeat)
+        print(f"{points:>7} {full * 1e3:>7.0f} ms {full_size / 1024:>7.0f} KB {lttb_columns} {full / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
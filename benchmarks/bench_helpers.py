@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for every slide helper.
+
+Runs each helper at several slide counts (10/100/1,000/10,000 by default) and,
+for the list-based helpers, several bullet counts (1 to 50). Each case records
+time per slide and, from a separate tracemalloc pass, the Python memory
+retained per slide and the traced peak (lxml's own C allocations are not
+visible to tracemalloc).
+
+Results are written to JSON so runs can be compared:
+
+    python benchmarks/bench_helpers.py -o before.json
+    python benchmarks/bench_helpers.py -o after.json --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pptx
+
+import template_cache
+from create_dark_presentation import add_rounded_rectangle, add_text_box
+from create_presentation_v2 import (add_source_footnote, create_content_slide, create_large_text_slide,
+                                    create_title_slide, create_two_column_slide)
+
+DEFAULT_SLIDES = [10, 100, 1000, 10000]
+DEFAULT_BULLETS = [1, 5, 10, 25, 50]
+# Allocation tracking is slow; it samples at most this many slides per case
+ALLOC_SAMPLE = 200
+
+BULLET = "• Character DNA injected into every prompt"
+
+
+def _bullets(count):
+    return [f"{BULLET} ({i})" for i in range(count)]
+
+
+def _blank_slides(prs, count):
+    return [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(count)]
+
+
+# Each case maps to (uses bullets, setup(prs, slides, bullets) -> args, call(prs, arg))
+HELPERS = {
+    "create_title_slide": (
+        False,
+        lambda prs, n, b: [None] * n,
+        lambda prs, _: create_title_slide(prs, "CharacterLock AI", "Persistent Character Memory"),
+    ),
+    "create_content_slide": (
+        True,
+        lambda prs, n, b: [_bullets(b)] * n,
+        lambda prs, items: create_content_slide(prs, "Our Idea: CharacterLock AI", items),
+    ),
+    "create_two_column_slide": (
+        True,
+        lambda prs, n, b: [_bullets(b)] * n,
+        lambda prs, items: create_two_column_slide(prs, "Technical Implementation", items, items),
+    ),
+    "create_large_text_slide": (
+        False,
+        lambda prs, n, b: [None] * n,
+        lambda prs, _: create_large_text_slide(prs, "Expected Impact", "85%+", "Character consistency"),
+    ),
+    "add_source_footnote": (
+        False,
+        lambda prs, n, b: _blank_slides(prs, n),
+        lambda prs, slide: add_source_footnote(slide, "* Source: AIStudios, Pyxeljam (2025)"),
+    ),
+    "add_text_box": (
+        False,
+        lambda prs, n, b: _blank_slides(prs, n),
+        lambda prs, slide: add_text_box(slide, 0.5, 0.5, 6, 0.5, "01. THE PROBLEM", 36,
+                                        bold=True, color=(204, 255, 0)),
+    ),
+    "add_rounded_rectangle": (
+        False,
+        lambda prs, n, b: _blank_slides(prs, n),
+        lambda prs, slide: add_rounded_rectangle(slide, 0.8, 3.2, 2.8, 2.5, (30, 30, 30),
+                                                 border_color=(60, 60, 60), border_width=1),
+    ),
+}
+
+
+def time_case(helper, slides, bullets):
+    """Seconds per slide for one helper/slide-count/bullet-count case."""
+    _, setup, call = HELPERS[helper]
+    prs = template_cache.new_presentation()
+    args = setup(prs, slides, bullets)
+    start = time.perf_counter()
+    for arg in args:
+        call(prs, arg)
+    return (time.perf_counter() - start) / slides
+
+
+def alloc_case(helper, slides, bullets):
+    """(bytes retained, blocks retained) per slide and the traced peak, over a bounded run."""
+    _, setup, call = HELPERS[helper]
+    slides = min(slides, ALLOC_SAMPLE)
+    prs = template_cache.new_presentation()
+    args = setup(prs, slides, bullets)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    for arg in args:
+        call(prs, arg)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    return size / slides, count / slides, peak
+
+
+def run(helpers, slide_counts, bullet_counts, track_allocs=True):
+    """Run the benchmark matrix and return a list of result records."""
+    results = []
+    for helper in helpers:
+        uses_bullets = HELPERS[helper][0]
+        for bullets in (bullet_counts if uses_bullets else [None]):
+            for slides in slide_counts:
+                per_slide = time_case(helper, slides, bullets)
+                record = {
+                    "helper": helper,
+                    "slides": slides,
+                    "bullets": bullets,
+                    "seconds_per_slide": per_slide,
+                }
+                if track_allocs:
+                    (record["retained_bytes_per_slide"], record["retained_blocks_per_slide"],
+                     record["peak_traced_bytes"]) = alloc_case(helper, slides, bullets)
+                results.append(record)
+                print(format_record(record), flush=True)
+    return results
+
+
+def case_key(record):
+    return record["helper"], record["slides"], record["bullets"]
+
+
+def format_record(record, baseline=None):
+    bullets = "-" if record["bullets"] is None else record["bullets"]
+    line = (f"{record['helper']:<26} slides={record['slides']:<6} bullets={bullets:<3} "
+            f"{record['seconds_per_slide'] * 1e6:>9.1f} µs/slide")
+    if "retained_bytes_per_slide" in record:
+        line += (f"  {record['retained_bytes_per_slide'] / 1024:>6.1f} KB/slide retained"
+                 f"  {record['retained_blocks_per_slide']:>5.0f} blocks/slide"
+                 f"  {record['peak_traced_bytes'] / 1024:>8.1f} KB peak")
+    if baseline:
+        line += f"  ({record['seconds_per_slide'] / baseline['seconds_per_slide']:.2f}x vs baseline)"
+    return line
+
+
+def main():
+    """Run the helper benchmark matrix and write JSON results."""
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for every slide helper.")
+    parser.add_argument("-o", "--output", default="bench_helpers.json", help="JSON results file")
+    parser.add_argument("--helpers", nargs="+", choices=sorted(HELPERS), default=list(HELPERS))
+    parser.add_argument("--slides", nargs="+", type=int, default=DEFAULT_SLIDES)
+    parser.add_argument("--bullets", nargs="+", type=int, default=DEFAULT_BULLETS)
+    parser.add_argument("--quick", action="store_true", help="only 10 and 100 slides")
+    parser.add_argument("--no-allocs", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--compare", metavar="JSON", help="previous results to compare against")
+    args = parser.parse_args()
+
+    slide_counts = [n for n in args.slides if n <= 100] if args.quick else args.slides
+    results = run(args.helpers, slide_counts, args.bullets, track_allocs=not args.no_allocs)
+
+    report = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "python_pptx": pptx.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = {case_key(r): r for r in json.load(f)["results"]}
+        print(f"\nCompared with {args.compare}:")
+        for record in results:
+            if case_key(record) in baseline:
+                print(format_record(record, baseline[case_key(record)]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: placing many pictures, and resizing frames cold vs. from the cache.
+
+python-pptx's add_picture() walks every part of the package on each call,
+so adding N pictures costs O(N^2). deck_images.add_picture() looks image
+parts up in a per-package index instead. Before timing, it checks that both
+produce identical slide XML. The second table times prepare_images() on
+fresh frames (decoded and resized in parallel) and again from the cache.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+from pptx.util import Inches
+
+import deck_images
+import template_cache
+
+
+def make_frames(directory, count, size=(1280, 720), seed=0):
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        image = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(image)
+        for _ in range(20):
+            x, y = rng.randrange(size[0]), rng.randrange(size[1])
+            draw.ellipse([x, y, x + 120, y + 90], fill=tuple(rng.randrange(256) for _ in range(3)))
+        path = os.path.join(directory, f"frame{index:05d}.jpg")
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def place(add, frames, per_slide=12):
+    prs = template_cache.new_presentation()
+    start = time.perf_counter()
+    for index, path in enumerate(frames):
+        if index % per_slide == 0:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+        add(slide, path, Inches(index % 4 * 2.4), Inches(index % per_slide // 4 * 2), Inches(2.2), Inches(1.6))
+    return time.perf_counter() - start, prs
+
+
+def pptx_add(slide, path, left, top, width, height):
+    return slide.shapes.add_picture(path, left, top, width, height)
+
+
+def check_identical(frames):
+    _, expected = place(pptx_add, frames + frames[:3])
+    _, actual = place(deck_images.add_picture, frames + frames[:3])
+    if [s.part.blob for s in expected.slides] != [s.part.blob for s in actual.slides]:
+        raise SystemExit("✗ indexed add_picture slide XML differs from python-pptx's")
+
+
+def main():
+    """Time picture placement and frame resizing."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pictures", nargs="+", type=int, default=[100, 500, 1000])
+    parser.add_argument("--frames", type=int, default=200, help="frames to resize (default: 200)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = make_frames(directory, max(max(args.pictures), args.frames), size=(320, 180))
+        check_identical(sources[:30])
+        print("✓ indexed add_picture XML identical to python-pptx's\n")
+
+        print(f"{'PICTURES':>8} {'PYTHON-PPTX':>12} {'INDEXED':>10} {'SPEEDUP':>8}")
+        for count in args.pictures:
+            slow, _ = place(pptx_add, sources[:count])
+            fast, _ = place(deck_images.add_picture, sources[:count])
+            print(f"{count:>8} {slow * 1e3:>9.0f} ms {fast * 1e3:>7.0f} ms {slow / fast:>7.1f}x")
+
+        frames = make_frames(directory, args.frames, seed=1)
+        cache_dir = os.path.join(directory, "cache")
+        box = deck_images.box_pixels(Inches(2.1), Inches(1.6))
+        start = time.perf_counter()
+        deck_images.prepare_images(frames, box, cache_dir=cache_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        deck_images.prepare_images(frames, box, cache_dir=cache_dir)
+        warm = time.perf_counter() - start
+        print(f"\n{'FRAMES':>8} {'COLD':>10} {'CACHED':>10}   ({os.cpu_count()} CPUs)")
+        print(f"{args.frames:>8} {cold * 1e3:>7.0f} ms {warm * 1e3:>7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
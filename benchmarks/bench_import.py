@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: importing long decks back into specs, and the memory it takes.
+
+Builds decks of growing length by repeating the slides of
+specs/characterlock_honest.json. Each deck is imported with deck_import,
+which parses one slide at a time. Its peak RSS, measured in a fresh process,
+is compared with opening the same deck in python-pptx, which parses every
+slide part up front. Before timing, it checks that the imported spec
+rebuilds every slide of the deck exactly.
+"""
+
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deck_import
+import deck_spec
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SPEC = os.path.join(REPO_DIR, "specs", "characterlock_honest.json")
+
+# Run in a fresh interpreter with the deck path as argv[1]; both load the same modules
+PEAK_RSS = """
+import io, resource, sys
+import deck_import
+from pptx import Presentation
+{run}
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+IMPORT = "deck_import.write_spec(deck_import.import_deck(sys.argv[1]), io.StringIO(), 'deck.pptx')"
+OPEN = "prs = Presentation(sys.argv[1]); [slide.shapes for slide in prs.slides]"
+
+
+def make_deck(path, slides):
+    with open(SPEC, encoding="utf-8") as f:
+        spec = json.load(f)
+    spec["slides"] = [spec["slides"][i % len(spec["slides"])] for i in range(slides)]
+    deck_spec.build_deck(deck_spec.validate_spec(spec)).save(path)
+
+
+def import_spec(path):
+    out = io.StringIO()
+    deck_import.write_spec(deck_import.import_deck(path), out, os.path.basename(path))
+    return out.getvalue()
+
+
+def check_round_trip(path):
+    spec = json.loads(import_spec(path))
+    rebuilt = io.BytesIO()
+    deck_spec.build_deck(deck_spec.validate_spec(spec)).save(rebuilt)
+    original = [deck_import.slide_key(layout, root) for _, layout, root in deck_import.read_slides(path)]
+    if original != [deck_import.slide_key(layout, root) for _, layout, root in deck_import.read_slides(rebuilt)]:
+        raise SystemExit("✗ imported spec does not rebuild the deck exactly")
+
+
+def peak_rss(run, path):
+    """Peak RSS in MB of a fresh interpreter that runs run on path."""
+    output = subprocess.run([sys.executable, "-c", PEAK_RSS.format(run=run), path], cwd=REPO_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    return int(output) / 1024
+
+
+def main():
+    """Time deck imports and compare their peak memory with opening the decks in python-pptx."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", nargs="+", type=int, default=[16, 160, 800])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for count in args.slides:
+            paths[count] = os.path.join(directory, f"deck{count}.pptx")
+            make_deck(paths[count], count)
+        check_round_trip(paths[args.slides[0]])
+        print("✓ imported spec rebuilds every slide exactly\n")
+
+        print(f"{'SLIDES':>6} {'IMPORT':>10} {'PER SLIDE':>10} {'IMPORT RSS':>10} {'PYTHON-PPTX RSS':>16}")
+        for count, path in paths.items():
+            start = time.perf_counter()
+            import_spec(path)
+            imported = time.perf_counter() - start
+            print(f"{count:>6} {imported:>8.2f} s {imported / count * 1e3:>7.1f} ms "
+                  f"{peak_rss(IMPORT, path):>7.1f} MB {peak_rss(OPEN, path):>13.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
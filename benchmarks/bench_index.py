@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: searching a corpus of decks through the index vs. opening every deck.
+
+Writes a synthetic corpus, personalized copies of specs/pilot_invite.json
+plus copies of the committed decks, then times a full index build, a no-op
+update, and queries through the index against a scan that reads every
+slide of every deck. Before timing, it checks that both find the same
+slides.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deck_index
+import deck_merge
+import deck_spec
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUERIES = ["60% of production time wasted", "Studio 7 & Partners", "consistency"]
+
+
+def make_corpus(directory, decks):
+    plan = deck_spec.compile_spec(os.path.join(REPO_DIR, "specs", "pilot_invite.json"))
+    template = deck_merge.build_template(plan)
+    committed = [os.path.join(REPO_DIR, name) for name in sorted(os.listdir(REPO_DIR)) if name.endswith(".pptx")]
+    for index in range(decks):
+        path = os.path.join(directory, f"deck{index:05d}.pptx")
+        if index % 4 == 0:
+            shutil.copy(committed[index // 4 % len(committed)], path)
+        else:
+            record = {"n": index, "studio": f"Studio {index} & Partners", "contact": f"Contact {index}",
+                      "roadmap": [f"Week {week}: milestone {week}" for week in range(1, 4)]}
+            template.write(path, record)
+
+
+def scan(directory, query):
+    """(deck, slide) pairs whose shapes contain the query as a phrase, reading every deck."""
+    terms = deck_index.tokenize(query)
+    found = set()
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        for slide, _, text in deck_index.deck_shapes(path):
+            tokens = deck_index.tokenize(text)
+            if any(tokens[i:i + len(terms)] == terms for i in range(len(tokens))):
+                found.add((path, slide))
+    return found
+
+
+def main():
+    """Compare indexed queries with a full scan."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--decks", type=int, default=1000, help="decks in the corpus (default: 1000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = os.path.join(directory, "decks")
+        index_dir = os.path.join(directory, "index")
+        os.makedirs(corpus)
+        make_corpus(corpus, args.decks)
+
+        start = time.perf_counter()
+        deck_index.update([corpus], index_dir)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        deck_index.update([corpus], index_dir)
+        noop = time.perf_counter() - start
+        print(f"index {args.decks} decks: {built:.2f}s, no-op update: {noop * 1000:.0f} ms")
+
+        for query in QUERIES:
+            indexed = {(hit["deck"], hit["slide"]) for hit in deck_index.search(query, index_dir)}
+            if indexed != scan(corpus, query):
+                raise SystemExit(f"✗ index and scan disagree on {query!r}")
+        print("✓ index and full scan find the same slides\n")
+
+        print(f"{'QUERY':<32} {'HITS':>6} {'SCAN':>10} {'INDEX':>10}")
+        for query in QUERIES:
+            start = time.perf_counter()
+            scan(corpus, query)
+            scanned = time.perf_counter() - start
+            start = time.perf_counter()
+            hits = deck_index.search(query, index_dir)
+            searched = time.perf_counter() - start
+            print(f"{query:<32} {len(hits):>6} {scanned * 1e3:>7.0f} ms {searched * 1e3:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
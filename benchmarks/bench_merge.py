@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: personalized decks built per recipient vs. merged into a template.
+
+Compares building each recipient's deck through python-pptx (the spec's
+tokens substituted, the deck built with deck_spec.build_deck) with
+deck_merge, which substitutes into the pre-serialized XML of a deck built
+once and appends the personalized slides to a pre-zipped template. Before
+timing, it checks that both paths produce identical slide XML.
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deck_merge
+import deck_spec
+
+SPEC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "specs", "pilot_invite.json")
+
+
+def recipients(count):
+    return [{deck_merge.ROW_FIELD: i + 1, "studio": f"Studio {i} & Partners", "contact": f"Contact {i}",
+             "roadmap": [f"Week {week}: milestone {week} for studio {i}" for week in range(1, 2 + i % 4)]}
+            for i in range(count)]
+
+
+def substitute(value, record):
+    """A spec value with tokens replaced, list fields expanding their list items."""
+    def replace(text):
+        return deck_merge.FIELD_TOKEN.sub(lambda m: str(record[m.group(1)]), text)
+
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            names = deck_merge.FIELD_TOKEN.findall(item)
+            lists = [name for name in names if isinstance(record[name], list)]
+            if lists:
+                items.extend(deck_merge.FIELD_TOKEN.sub(lambda m: line, item) for line in record[lists[0]])
+            else:
+                items.append(replace(item))
+        return items
+    return replace(value) if isinstance(value, str) else value
+
+
+def personalized_plan(plan, record):
+    slides = [dict(step, kwargs={key: substitute(value, record) for key, value in step["kwargs"].items()})
+              for step in plan["slides"]]
+    return dict(plan, slides=slides)
+
+
+def build_each(plan, record, path):
+    deck_spec.build_deck(personalized_plan(plan, record)).save(path)
+
+
+def slide_xml(file):
+    with zipfile.ZipFile(file) as zf:
+        return {name: zf.read(name) for name in zf.namelist() if name.startswith("ppt/slides/slide")}
+
+
+def check_identical(plan, template):
+    for record in recipients(4):
+        built, merged = io.BytesIO(), io.BytesIO()
+        build_each(plan, record, built)
+        template.write(merged, record)
+        if slide_xml(built) != slide_xml(merged):
+            raise SystemExit(f"✗ merged slide XML differs for recipient {record[deck_merge.ROW_FIELD]}")
+
+
+def main():
+    """Compare per-recipient builds with the template merge."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--decks", type=int, default=200, help="recipients to merge (default: 200)")
+    parser.add_argument("--built", type=int, default=20, help="recipients to build per deck (default: 20)")
+    args = parser.parse_args()
+
+    plan = deck_spec.compile_spec(SPEC)
+    template = deck_merge.build_template(plan)
+    check_identical(plan, template)
+    print("✓ merged slide XML identical to per-recipient builds\n")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        records = recipients(max(args.decks, args.built))
+        start = time.perf_counter()
+        for record in records[:args.built]:
+            build_each(plan, record, os.path.join(output_dir, f"built_{record['n']}.pptx"))
+        built = (time.perf_counter() - start) / args.built
+
+        paths = [os.path.join(output_dir, f"merged_{record['n']}.pptx") for record in records[:args.decks]]
+        start = time.perf_counter()
+        deck_merge.merge(template, records[:args.decks], paths, jobs=1)
+        merged = (time.perf_counter() - start) / args.decks
+
+    print(f"{'PATH':<10} {'PER DECK':>10} {'DECKS/MIN':>10}")
+    print(f"{'build':<10} {built * 1e3:>7.1f} ms {60 / built:>10,.0f}")
+    print(f"{'merge':<10} {merged * 1e3:>7.2f} ms {60 / merged:>10,.0f}   ({built / merged:.0f}x, one process)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decks per second with and without the base template cache.
+
+Each deck is the smallest realistic build: one content slide, saved to memory.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import template_cache
+from create_presentation_v2 import create_content_slide
+
+ITEMS = ["Persistent Character Memory", "Automated Consistency Validation", "Smart Regeneration"]
+
+
+def build_deck(new_presentation):
+    """Build and save one small deck."""
+    prs = new_presentation()
+    create_content_slide(prs, "Our Idea: CharacterLock AI", ITEMS)
+    prs.save(io.BytesIO())
+
+
+def run(label, new_presentation, decks):
+    """Build `decks` decks and print the throughput."""
+    build_deck(new_presentation)  # warm-up
+    start = time.perf_counter()
+    for _ in range(decks):
+        build_deck(new_presentation)
+    elapsed = time.perf_counter() - start
+    rate = decks / elapsed
+    print(f"{label:<24} {decks:>6} decks  {elapsed:>7.2f}s  {rate:>8.1f} decks/s  "
+          f"{elapsed / decks * 1000:>6.2f} ms/deck")
+    return rate
+
+
+def main():
+    """Compare uncached Presentation() against the template cache."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-n", "--decks", type=int, default=500, help="decks per run (default: 500)")
+    args = parser.parse_args()
+
+    uncached = run("Presentation() per deck", template_cache.load_base_presentation, args.decks)
+    cached = run("template cache", template_cache.new_presentation, args.decks)
+    print(f"\nSpeedup: {cached / uncached:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
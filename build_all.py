@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Build every presentation variant in one go.
+
+Discovers the create_*.py generator scripts (anything with a main() that
+builds and saves a deck) and runs them across a process pool, then prints
+per-deck wall time, peak RSS and output size.
+"""
+
+import argparse
+import ast
+import contextlib
+import glob
+import importlib.util
+import io
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover_generators(directory=REPO_DIR, pattern="create_*.py"):
+    """Find generator scripts that define a top-level main()."""
+    generators = []
+    for path in sorted(glob.glob(os.path.join(directory, pattern))):
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        if any(isinstance(node, ast.FunctionDef) and node.name == "main" for node in tree.body):
+            generators.append(path)
+    return generators
+
+
+def find_output_file(path):
+    """Return the literal `output_file = "..."` a generator saves to, if any."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "output_file" for t in node.targets)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)):
+            return node.value.value
+    return None
+
+
+def load_module(path):
+    """Import a generator script by path without running its __main__ block."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process, in bytes (0 if unknown)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def build_one(path):
+    """Run one generator's main() and measure it. Executed in a worker process."""
+    result = {
+        "generator": os.path.basename(path),
+        "output": find_output_file(path),
+        "ok": False,
+        "error": None,
+        "wall_time": 0.0,
+        "peak_rss": 0,
+        "output_size": 0,
+        "log": "",
+    }
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            load_module(path).main()
+        result["ok"] = True
+    except Exception as exc:  # report, don't take the whole build down
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    result["wall_time"] = time.perf_counter() - start
+    result["peak_rss"] = peak_rss_bytes()
+    result["log"] = log.getvalue()
+    if result["output"] and os.path.exists(result["output"]):
+        result["output_size"] = os.path.getsize(result["output"])
+    return result
+
+
+def build_all(generators, jobs=None):
+    """Build all generators across a process pool and return their results."""
+    jobs = jobs or min(len(generators), os.cpu_count() or 1)
+    # One task per child so each worker's peak RSS belongs to a single deck
+    with multiprocessing.Pool(processes=jobs, maxtasksperchild=1) as pool:
+        results = list(pool.imap_unordered(build_one, generators))
+    return sorted(results, key=lambda r: r["generator"])
+
+
+def format_size(num_bytes):
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if num_bytes < 1024 or unit == "GB":
+            return f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
+def print_report(results, total_time):
+    """Print the per-deck summary table."""
+    print(f"\n{'GENERATOR':<32} {'OUTPUT':<44} {'TIME':>8} {'PEAK RSS':>10} {'SIZE':>10}")
+    for r in results:
+        status = "" if r["ok"] else f"  FAILED: {r['error']}"
+        print(f"{r['generator']:<32} {r['output'] or '-':<44} "
+              f"{r['wall_time']:>7.2f}s {format_size(r['peak_rss']):>10} "
+              f"{format_size(r['output_size']):>10}{status}")
+    print(f"\n✓ Built {sum(r['ok'] for r in results)}/{len(results)} decks in {total_time:.2f}s")
+
+
+def main():
+    """Build all presentation variants in parallel."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("generators", nargs="*",
+                        help="generator scripts to run (default: all create_*.py)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: one per deck, up to CPU count)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print each generator's own output")
+    args = parser.parse_args()
+
+    generators = [os.path.abspath(g) for g in args.generators] or discover_generators()
+    if not generators:
+        print("No generator scripts found.")
+        return 1
+
+    start = time.perf_counter()
+    results = build_all(generators, jobs=args.jobs)
+    total_time = time.perf_counter() - start
+
+    if args.verbose:
+        for r in results:
+            print(f"--- {r['generator']} ---\n{r['log']}", end="")
+    print_report(results, total_time)
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
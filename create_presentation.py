@@ -8,6 +8,8 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 
+from deck_styles import add_paragraphs, apply_style
+
 def create_title_slide(prs, title, subtitle):
     """Create title slide."""
     slide = prs.slides.add_slide(prs.slide_layouts[0])
@@ -31,12 +33,7 @@ def create_content_slide(prs, title, content_items, layout_idx=1):
     body_shape = slide.placeholders[1]
     text_frame = body_shape.text_frame
     text_frame.clear()
-    
-    for item in content_items:
-        p = text_frame.add_paragraph()
-        p.text = item
-        p.level = 0
-        p.font.size = Pt(18)
+    add_paragraphs(text_frame, content_items, "light-bullet-large")
     
     return slide
 
@@ -49,29 +46,19 @@ def create_two_column_slide(prs, title, left_content, right_content):
     title_frame = title_shape.text_frame
     title_para = title_frame.add_paragraph()
     title_para.text = title
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.font.color.rgb = RGBColor(3, 105, 161)
+    apply_style(title_para, "light-title-accent")
     
     # Left column
     left_shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(4.5), Inches(5))
     left_frame = left_shape.text_frame
     left_frame.word_wrap = True
-    for item in left_content:
-        p = left_frame.add_paragraph()
-        p.text = item
-        p.font.size = Pt(14)
-        p.space_after = Pt(12)
+    add_paragraphs(left_frame, left_content, "light-column")
     
     # Right column
     right_shape = slide.shapes.add_textbox(Inches(5.2), Inches(1.5), Inches(4.5), Inches(5))
     right_frame = right_shape.text_frame
     right_frame.word_wrap = True
-    for item in right_content:
-        p = right_frame.add_paragraph()
-        p.text = item
-        p.font.size = Pt(14)
-        p.space_after = Pt(12)
+    add_paragraphs(right_frame, right_content, "light-column")
     
     return slide
 
@@ -109,6 +96,32 @@ def create_large_text_slide(prs, title, main_text, subtext=""):
     
     return slide
 
+def create_closing_slide(prs, headline, lines):
+    """Create closing slide with large centered headline and contact lines."""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+    
+    # Large headline
+    thank_shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2))
+    thank_frame = thank_shape.text_frame
+    thank_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+    p = thank_frame.add_paragraph()
+    p.text = headline
+    p.font.size = Pt(60)
+    p.font.bold = True
+    p.font.color.rgb = RGBColor(3, 105, 161)
+    p.alignment = PP_ALIGN.CENTER
+    
+    # Contact info
+    contact_shape = slide.shapes.add_textbox(Inches(1), Inches(4.5), Inches(8), Inches(2))
+    contact_frame = contact_shape.text_frame
+    for line in lines:
+        p = contact_frame.add_paragraph()
+        p.text = line
+        p.font.size = Pt(18)
+        p.alignment = PP_ALIGN.CENTER
+    
+    return slide
+
 def main():
     """Generate the presentation."""
     prs = Presentation()
@@ -396,33 +409,16 @@ def main():
     )
     
     # Slide 16: Thank You
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    # Large "Thank You"
-    thank_shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2))
-    thank_frame = thank_shape.text_frame
-    thank_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = thank_frame.add_paragraph()
-    p.text = "Thank You!"
-    p.font.size = Pt(60)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(3, 105, 161)
-    p.alignment = PP_ALIGN.CENTER
-    
-    # Contact info
-    contact_shape = slide.shapes.add_textbox(Inches(1), Inches(4.5), Inches(8), Inches(2))
-    contact_frame = contact_shape.text_frame
-    lines = [
-        "CharacterLock AI",
-        "From concept to consistent storyboard in 5 minutes",
-        "",
-        "Questions? Let's talk!"
-    ]
-    for line in lines:
-        p = contact_frame.add_paragraph()
-        p.text = line
-        p.font.size = Pt(18)
-        p.alignment = PP_ALIGN.CENTER
+    create_closing_slide(
+        prs,
+        "Thank You!",
+        [
+            "CharacterLock AI",
+            "From concept to consistent storyboard in 5 minutes",
+            "",
+            "Questions? Let's talk!"
+        ]
+    )
     
     # Save presentation
     output_file = "CharacterLock_AI_Presentation.pptx"
@@ -5,9 +5,13 @@ VERSION 2: Honest, source-backed claims
 """
 
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
+from pptx.util import Inches
+from pptx.enum.text import MSO_ANCHOR
+
+from deck_charts import MAX_POINTS, add_chart, load_table
+from deck_images import STORYBOARD_COLUMNS, STORYBOARD_ROWS, frame_pages, prefetch, storyboard_grid
+from deck_styles import add_paragraphs, apply_style, text_style
+from font_metrics import fit_font_size
 
 def create_title_slide(prs, title, subtitle):
     """Create title slide."""
@@ -32,17 +36,21 @@ def create_content_slide(prs, title, content_items, layout_idx=1):
     body_shape = slide.placeholders[1]
     text_frame = body_shape.text_frame
     text_frame.clear()
-    
-    for item in content_items:
-        p = text_frame.add_paragraph()
-        p.text = item
-        p.level = 0
-        p.font.size = Pt(16)
+    add_paragraphs(text_frame, content_items, "light-bullet")
     
     return slide
 
-def create_two_column_slide(prs, title, left_content, right_content):
-    """Create two-column content slide."""
+def create_two_column_slide(prs, title, left_content, right_content, autofit=False):
+    """Create two-column content slide.
+
+    With autofit, both columns shrink together from 14pt until the longer one
+    fits its 4.5in column.
+    """
+    column_style = "light-column"
+    if autofit:
+        size = min(fit_font_size(content, 4.5, 5, 14, space_after=12)
+                   for content in (left_content, right_content))
+        column_style = text_style(size, space_after=12)
     slide = prs.slides.add_slide(prs.slide_layouts[6])
     
     # Add title
@@ -50,29 +58,19 @@ def create_two_column_slide(prs, title, left_content, right_content):
     title_frame = title_shape.text_frame
     title_para = title_frame.add_paragraph()
     title_para.text = title
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
-    title_para.font.color.rgb = RGBColor(3, 105, 161)
+    apply_style(title_para, "light-title-accent")
     
     # Left column
     left_shape = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(4.5), Inches(5))
     left_frame = left_shape.text_frame
     left_frame.word_wrap = True
-    for item in left_content:
-        p = left_frame.add_paragraph()
-        p.text = item
-        p.font.size = Pt(14)
-        p.space_after = Pt(12)
+    add_paragraphs(left_frame, left_content, column_style)
     
     # Right column
     right_shape = slide.shapes.add_textbox(Inches(5.2), Inches(1.5), Inches(4.5), Inches(5))
     right_frame = right_shape.text_frame
     right_frame.word_wrap = True
-    for item in right_content:
-        p = right_frame.add_paragraph()
-        p.text = item
-        p.font.size = Pt(14)
-        p.space_after = Pt(12)
+    add_paragraphs(right_frame, right_content, column_style)
     
     return slide
 
@@ -85,8 +83,7 @@ def create_large_text_slide(prs, title, main_text, subtext=""):
     title_frame = title_shape.text_frame
     title_para = title_frame.add_paragraph()
     title_para.text = title
-    title_para.font.size = Pt(32)
-    title_para.font.bold = True
+    apply_style(title_para, "light-title")
     
     # Main text
     text_shape = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(2))
@@ -94,10 +91,7 @@ def create_large_text_slide(prs, title, main_text, subtext=""):
     text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
     p = text_frame.add_paragraph()
     p.text = main_text
-    p.font.size = Pt(44)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(3, 105, 161)
-    p.alignment = PP_ALIGN.CENTER
+    apply_style(p, "light-headline-accent")
     
     # Subtext
     if subtext:
@@ -105,19 +99,91 @@ def create_large_text_slide(prs, title, main_text, subtext=""):
         sub_frame = sub_shape.text_frame
         sub_para = sub_frame.add_paragraph()
         sub_para.text = subtext
-        sub_para.font.size = Pt(18)
-        sub_para.alignment = PP_ALIGN.CENTER
+        apply_style(sub_para, "light-subtext")
+    
+    return slide
+
+def create_chart_slide(prs, title, data, chart="line", series=None, x=None, number_format=None,
+                       max_points=MAX_POINTS):
+    """Create slide with a native chart bound to CSV/JSON/NumPy data.
+
+    Series longer than max_points are downsampled (LTTB), keeping their shape.
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    
+    # Add title
+    title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
+    title_frame = title_shape.text_frame
+    title_para = title_frame.add_paragraph()
+    title_para.text = title
+    apply_style(title_para, "light-title-accent")
+    
+    # Chart
+    add_chart(slide, load_table(data, x=x, series=series), Inches(0.5), Inches(1.5), Inches(9), Inches(5),
+              chart, number_format, max_points)
+    
+    return slide
+
+def create_storyboard_slide(prs, title, frames, columns=STORYBOARD_COLUMNS, rows=STORYBOARD_ROWS, captions=None):
+    """Create slide with a grid of storyboard frames (image paths), with optional captions.
+
+    Frames are resized and cached by deck_images; at most columns x rows are shown.
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    
+    # Add title
+    title_shape = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.8))
+    title_frame = title_shape.text_frame
+    title_para = title_frame.add_paragraph()
+    title_para.text = title
+    apply_style(title_para, "light-title-accent")
+    
+    # Frames
+    storyboard_grid(slide, frames, columns, rows, captions)
     
     return slide
 
+def create_storyboard_slides(prs, title, frames, columns=STORYBOARD_COLUMNS, rows=STORYBOARD_ROWS, captions=None):
+    """Create as many storyboard slides as the frames need, numbering the titles.
+
+    All frames are resized in one parallel batch up front.
+    """
+    pages = frame_pages(frames, columns, rows)
+    caption_pages = frame_pages(captions, columns, rows) if captions else [None] * len(pages)
+    steps = [{"helper": "create_storyboard_slide",
+              "kwargs": {"frames": page, "columns": columns, "rows": rows, "captions": page_captions}}
+             for page, page_captions in zip(pages, caption_pages)]
+    prefetch(steps)
+    slides = []
+    for number, step in enumerate(steps, 1):
+        page_title = f"{title} ({number}/{len(pages)})" if len(pages) > 1 else title
+        slides.append(create_storyboard_slide(prs, page_title, **step["kwargs"]))
+    return slides
+
 def add_source_footnote(slide, source_text):
     """Add source footnote to slide."""
     footnote_shape = slide.shapes.add_textbox(Inches(0.5), Inches(6.8), Inches(9), Inches(0.4))
     footnote_frame = footnote_shape.text_frame
     p = footnote_frame.add_paragraph()
     p.text = source_text
-    p.font.size = Pt(10)
-    p.font.color.rgb = RGBColor(100, 100, 100)
+    apply_style(p, "footnote-grey")
+
+def create_closing_slide(prs, headline, lines):
+    """Create closing slide with large centered headline and contact lines."""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    
+    thank_shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2))
+    thank_frame = thank_shape.text_frame
+    thank_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+    p = thank_frame.add_paragraph()
+    p.text = headline
+    apply_style(p, "light-closing-accent")
+    
+    contact_shape = slide.shapes.add_textbox(Inches(1), Inches(4.5), Inches(8), Inches(2))
+    contact_frame = contact_shape.text_frame
+    add_paragraphs(contact_frame, lines, "light-closing-line")
+    
+    return slide
 
 def main():
     """Generate the presentation."""
@@ -447,31 +513,16 @@ def main():
     )
     
     # Slide 16: Thank You
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    thank_shape = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(2))
-    thank_frame = thank_shape.text_frame
-    thank_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-    p = thank_frame.add_paragraph()
-    p.text = "Thank You!"
-    p.font.size = Pt(60)
-    p.font.bold = True
-    p.font.color.rgb = RGBColor(3, 105, 161)
-    p.alignment = PP_ALIGN.CENTER
-    
-    contact_shape = slide.shapes.add_textbox(Inches(1), Inches(4.5), Inches(8), Inches(2))
-    contact_frame = contact_shape.text_frame
-    lines = [
-        "CharacterLock AI",
-        "Preserving AI's 70-90% cost advantage through 85%+ character consistency",
-        "",
-        "Questions? Let's discuss!"
-    ]
-    for line in lines:
-        p = contact_frame.add_paragraph()
-        p.text = line
-        p.font.size = Pt(16)
-        p.alignment = PP_ALIGN.CENTER
+    create_closing_slide(
+        prs,
+        "Thank You!",
+        [
+            "CharacterLock AI",
+            "Preserving AI's 70-90% cost advantage through 85%+ character consistency",
+            "",
+            "Questions? Let's discuss!"
+        ]
+    )
     
     # Save presentation
     output_file = "CharacterLock_AI_Presentation_HONEST.pptx"
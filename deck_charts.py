@@ -0,0 +1,237 @@
+"""
+Data binding and downsampling for native PowerPoint charts.
+
+load_table() reads a table of series from CSV, JSON or NumPy (.npy) data, or
+from in-memory columns, records or arrays. The first column (or the one named
+by x) holds the x values or category labels; every other numeric column is a
+series.
+
+Series longer than max_points are reduced with Largest-Triangle-Three-Buckets
+(Steinarsson, 2013). LTTB keeps the peaks, dips and overall shape of a line
+while emitting a bounded number of points, so a 100k-point series turns into
+a chart part of a fixed size, built in bounded time. A line chart over
+numeric x values that had to be downsampled is drawn as an XY scatter line,
+so the kept points stay at their true x positions.
+"""
+
+import csv
+import json
+import math
+import os
+
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.util import Pt
+
+from deck_styles import ACCENT_BLUE
+
+try:
+    import numpy
+except ImportError:  # .npy data is optional
+    numpy = None
+
+MAX_POINTS = 1000
+
+CHART_TYPES = {
+    "line": XL_CHART_TYPE.LINE,
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "area": XL_CHART_TYPE.AREA,
+    "scatter": XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
+}
+
+
+# --- Loading -----------------------------------------------------------------
+
+def _number(value):
+    """value as an int or float, None for blanks and NaN; strings that aren't numbers are returned as is."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return None if isinstance(value, float) and math.isnan(value) else value
+    text = str(value).strip().replace(",", "")
+    if not text:
+        return None
+    try:
+        number = float(text)
+    except ValueError:
+        return value
+    if math.isnan(number):
+        return None
+    return int(number) if number.is_integer() and "." not in text and "e" not in text.lower() else number
+
+
+def _columns_from_records(records):
+    columns = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, [])
+    for record in records:
+        for key, values in columns.items():
+            values.append(record.get(key))
+    return columns
+
+
+def _read_columns(source):
+    """{column name: values} from a path or in-memory data."""
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".npy":
+            if numpy is None:
+                raise ValueError(f"{path}: NumPy is required for .npy data")
+            return _read_columns(numpy.load(path, allow_pickle=False))
+        if extension == ".json":
+            with open(path, encoding="utf-8") as f:
+                return _read_columns(json.load(f))
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f))
+        if not rows:
+            raise ValueError(f"{path}: no data")
+        header, rows = rows[0], rows[1:]
+        return {name: [row[i] if i < len(row) else None for row in rows] for i, name in enumerate(header)}
+
+    if numpy is not None and isinstance(source, numpy.ndarray):
+        if source.ndim == 1:
+            return {"index": list(range(len(source))), "value": source.tolist()}
+        if source.ndim == 2:
+            return {f"column {i + 1}": column for i, column in enumerate(source.T.tolist())}
+        raise ValueError(f"expected a 1-D or 2-D array, got {source.ndim} dimensions")
+    if isinstance(source, dict):
+        return {name: list(values) for name, values in source.items()}
+    if isinstance(source, (list, tuple)):
+        if source and all(isinstance(item, dict) for item in source):
+            return _columns_from_records(source)
+        return {"index": list(range(len(source))), "value": list(source)}
+    raise ValueError(f"cannot read chart data from {type(source).__name__}")
+
+
+def load_table(source, x=None, series=None):
+    """(x name, x values, {series name: values}) from CSV/JSON/.npy data or in-memory data.
+
+    x names the x or category column (default: the first); series lists the
+    columns to plot (default: every other column with numeric values).
+    """
+    columns = _read_columns(source)
+    if not columns:
+        raise ValueError("chart data has no columns")
+    names = list(columns)
+    x = names[0] if x is None else x
+    if x not in columns:
+        raise ValueError(f"chart data has no column {x!r} (columns: {', '.join(names)})")
+    xs = [_number(value) for value in columns[x]]
+    if not all(isinstance(value, (int, float)) for value in xs):
+        xs = ["" if value is None else str(value) for value in columns[x]]
+
+    wanted = series if series is not None else [name for name in names if name != x]
+    table = {}
+    for name in wanted:
+        if name not in columns:
+            raise ValueError(f"chart data has no column {name!r} (columns: {', '.join(names)})")
+        values = [_number(value) for value in columns[name]]
+        if any(isinstance(value, str) for value in values):
+            if series is not None:
+                raise ValueError(f"column {name!r} is not numeric")
+            continue  # a label column, not a series
+        table[name] = values
+    if not table:
+        raise ValueError("chart data has no numeric series")
+    return x, xs, table
+
+
+# --- Downsampling ------------------------------------------------------------
+
+def lttb(xs, ys, threshold):
+    """Indexes of the points Largest-Triangle-Three-Buckets keeps, in order.
+
+    xs and ys are equal-length sequences of numbers with no gaps. The first and
+    last points are always kept; each bucket in between keeps the point forming
+    the largest triangle with the previously kept point and the next bucket's
+    average.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    kept = [0]
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * every) + 1
+        end = int((bucket + 1) * every) + 1
+        next_end = min(int((bucket + 2) * every) + 1, n)
+        if end >= next_end:  # last bucket: the next "bucket" is the final point
+            end, next_end = min(end, n - 1), n
+        span = next_end - end
+        avg_x = sum(xs[end:next_end]) / span
+        avg_y = sum(ys[end:next_end]) / span
+        ax, ay = xs[a], ys[a]
+        dx, dy = ax - avg_x, avg_y - ay
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs(dx * (ys[j] - ay) - (ax - xs[j]) * dy)
+            if area > best_area:
+                best, best_area = j, area
+        kept.append(best)
+        a = best
+    kept.append(n - 1)
+    return kept
+
+
+def downsample(xs, ys, max_points=MAX_POINTS):
+    """Indexes of at most max_points points of (xs, ys) to keep; blank values are skipped."""
+    present = [i for i, y in enumerate(ys) if y is not None]
+    if len(present) <= max_points:
+        return present
+    kept = lttb([xs[i] for i in present], [ys[i] for i in present], max_points)
+    return [present[i] for i in kept]
+
+
+# --- Charts ------------------------------------------------------------------
+
+def chart_data(table, chart="line", max_points=MAX_POINTS, number_format=None):
+    """(python-pptx chart type, chart data) for a table from load_table()."""
+    if chart not in CHART_TYPES:
+        raise ValueError(f"unknown chart type {chart!r} (expected one of {', '.join(sorted(CHART_TYPES))})")
+    _, xs, series = table
+    numeric_x = all(isinstance(x, (int, float)) for x in xs)
+    needs_downsampling = any(sum(y is not None for y in ys) > max_points for ys in series.values())
+
+    if chart == "scatter" or (chart == "line" and numeric_x and needs_downsampling):
+        if not numeric_x:
+            raise ValueError("scatter charts need numeric x values")
+        data = XyChartData(number_format=number_format or "General")
+        for name, ys in series.items():
+            points = data.add_series(name)
+            for i in downsample(xs, ys, max_points):
+                points.add_data_point(xs[i], ys[i])
+        return CHART_TYPES["scatter"], data
+
+    # Category charts share one category axis: keep the union of every series' points
+    positions = xs if numeric_x else list(range(len(xs)))
+    keep = sorted(set().union(*(downsample(positions, ys, max_points) for ys in series.values())))
+    data = CategoryChartData(number_format=number_format or "General")
+    data.categories = [xs[i] for i in keep]
+    for name, ys in series.items():
+        data.add_series(name, [ys[i] for i in keep])
+    return CHART_TYPES[chart], data
+
+
+def add_chart(slide, table, left, top, width, height, chart="line", number_format=None,
+              max_points=MAX_POINTS):
+    """Add a native chart for a table to a slide and return the chart."""
+    chart_type, data = chart_data(table, chart, max_points, number_format)
+    chart = slide.shapes.add_chart(chart_type, left, top, width, height, data).chart
+    chart.font.size = Pt(12)
+    chart.has_legend = len(table[2]) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    first = chart.plots[0].series[0]
+    if chart_type in (XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.BAR_CLUSTERED, XL_CHART_TYPE.AREA):
+        first.format.fill.solid()
+        first.format.fill.fore_color.rgb = RGBColor(*ACCENT_BLUE)
+    else:
+        first.format.line.color.rgb = RGBColor(*ACCENT_BLUE)
+        first.smooth = False
+    return chart
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Thin client for the warm build daemon (deck_daemon.py).
+
+Imports only the standard library, so it starts in a few milliseconds; the
+build itself runs in a daemon worker that already has python-pptx and the
+template loaded.
+
+    python deck_client.py specs/characterlock_honest.json
+    python deck_client.py specs/characterlock.json --variant honest-dark -o dark.pptx
+    python deck_client.py create_presentation.py
+    python deck_client.py specs/characterlock_honest.json --stdout > deck.pptx
+    python deck_client.py --start specs/characterlock_honest.json   # launch the daemon if needed
+    python deck_client.py --stop
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(REPO_DIR, ".deck_cache", "daemon.sock")
+
+
+def request(payload, socket_path=SOCKET_PATH):
+    """Send one request; return (reply dict, PPTX bytes or None)."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(socket_path)
+        with conn.makefile("rwb") as stream:
+            stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+            blob = stream.read(reply["size"]) if "size" in reply else None
+    return reply, blob
+
+
+def start_daemon(socket_path=SOCKET_PATH, timeout=10.0):
+    """Launch deck_daemon.py in the background and wait until it answers."""
+    import subprocess  # only needed here; keeps the common path's startup small
+    log_path = os.path.join(os.path.dirname(socket_path), "daemon.log")
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    with open(log_path, "ab") as log:
+        subprocess.Popen([sys.executable, os.path.join(REPO_DIR, "deck_daemon.py"), "--socket", socket_path],
+                         stdout=log, stderr=log, stdin=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return request({"op": "ping"}, socket_path)[0]
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.05)
+    raise TimeoutError(f"daemon did not start within {timeout:.0f}s (see {log_path})")
+
+
+def main():
+    """Send a build job to the daemon."""
+    parser = argparse.ArgumentParser(description="Build decks through the warm daemon.")
+    parser.add_argument("path", nargs="?", help="deck spec or generator script")
+    parser.add_argument("-o", "--output", help="output file for spec decks (default: the spec's output)")
+    parser.add_argument("--variant", help="build one variant of the spec")
+    parser.add_argument("--stdout", action="store_true", help="write the PPTX bytes to stdout")
+    parser.add_argument("--socket", default=SOCKET_PATH, help="daemon socket path")
+    parser.add_argument("--start", action="store_true", help="start the daemon if it is not running")
+    parser.add_argument("--stop", action="store_true", help="shut the daemon down")
+    args = parser.parse_args()
+
+    if args.stop:
+        try:
+            request({"op": "shutdown"}, args.socket)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print("daemon is not running", file=sys.stderr)
+        return 0
+    if not args.path:
+        parser.error("a spec or generator path is required")
+
+    payload = {"op": "build", "path": os.path.abspath(args.path), "cwd": os.getcwd(),
+               "variant": args.variant, "bytes": args.stdout,
+               "output": os.path.abspath(args.output) if args.output else None}
+    try:
+        reply, blob = request(payload, args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not args.start:
+            print(f"✗ no daemon on {args.socket}; run deck_daemon.py or pass --start", file=sys.stderr)
+            return 2
+        start_daemon(args.socket)
+        reply, blob = request(payload, args.socket)
+
+    if not reply["ok"]:
+        print(f"✗ {reply['error']}", file=sys.stderr)
+        return 1
+    if args.stdout:
+        sys.stdout.buffer.write(blob)
+    else:
+        print(f"✓ {reply['output']} ({reply['elapsed_ms']:.0f} ms in daemon)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Warm build daemon: python-pptx imported once, workers forked ready to build.
+
+The daemon imports python-pptx and the slide helpers, and loads the base
+template. It then forks worker processes that accept build jobs on a Unix
+socket. Workers inherit everything already loaded, so a job pays neither
+interpreter startup nor imports. Pair it with the stdlib-only client in
+deck_client.py:
+
+    python deck_daemon.py -j 2 &
+    python deck_client.py specs/characterlock_honest.json
+    python deck_client.py create_presentation.py
+    python deck_client.py --stop
+
+Jobs are either a deck spec (built through the incremental slide cache,
+optionally one variant) or a generator script (re-imported from disk and
+run against the warm template). Before each job a worker reloads any shared
+helper module edited since it was loaded, through deck_watch.reload_shared(). Workers exit after --max-jobs jobs
+and the daemon forks a fresh one. POSIX only (fork and Unix sockets).
+
+Protocol: one JSON request line per connection; the reply is one JSON line,
+followed by "size" bytes of PPTX when the request asked for bytes.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+import build_all
+import deck_incremental
+import deck_spec
+import template_cache
+from deck_server import render_plan
+from deck_watch import SHARED_MODULES, reload_shared
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(REPO_DIR, ".deck_cache", "daemon.sock")
+
+
+# --- Worker side -----------------------------------------------------------
+
+def _module_mtimes():
+    return {name: os.stat(sys.modules[name].__file__).st_mtime_ns
+            for name in SHARED_MODULES if name in sys.modules}
+
+
+class Worker:
+    """One forked process serving build jobs from the shared listening socket."""
+
+    def __init__(self, server, max_jobs):
+        self.server = server
+        self.max_jobs = max_jobs
+        self.mtimes = _module_mtimes()
+
+    def refresh_modules(self):
+        """Reload shared modules edited on disk since this worker loaded them."""
+        current = _module_mtimes()
+        stale = [name for name in SHARED_MODULES if current.get(name) != self.mtimes.get(name)]
+        if stale:
+            reload_shared(stale)
+            self.mtimes = _module_mtimes()
+
+    def build_spec(self, request):
+        plan = deck_spec.compile_spec(request["path"])
+        variant = request.get("variant")
+        if variant is not None and variant not in {v["name"] for v in plan["variants"]}:
+            raise deck_spec.SpecError(f"{request['path']}: no variant named {variant!r}")
+        blob = render_plan(plan, variant)
+        output = request.get("output") or (variant and f"{variant}.pptx") or plan["output"]
+        return blob, output
+
+    def build_generator(self, request):
+        module = build_all.load_module(request["path"])
+        module.Presentation = template_cache.new_presentation
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            module.main()
+        return None, build_all.find_output_file(request["path"]), log.getvalue()
+
+    def handle(self, request):
+        op = request.get("op", "build")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "daemon": os.getppid()}, None
+        if op == "shutdown":
+            return {"ok": True, "daemon": os.getppid()}, None
+
+        start = time.perf_counter()
+        os.chdir(request.get("cwd") or REPO_DIR)
+        self.refresh_modules()
+        log = ""
+        if request["path"].endswith(".py"):
+            blob, output, log = self.build_generator(request)
+        else:
+            blob, output = self.build_spec(request)
+        reply = {"ok": True, "log": log}
+        if request.get("bytes"):
+            if blob is None:
+                with open(output, "rb") as f:
+                    blob = f.read()
+            reply["size"] = len(blob)
+        else:
+            if blob is not None:
+                with open(output, "wb") as f:
+                    f.write(blob)
+            blob = None
+            reply["output"] = os.path.abspath(output)
+        reply["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return reply, blob
+
+    def serve(self):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for _ in range(self.max_jobs):
+            conn, _ = self.server.accept()
+            request = {}
+            try:
+                with conn, conn.makefile("rwb") as stream:
+                    try:
+                        request = json.loads(stream.readline())
+                        reply, blob = self.handle(request)
+                    except Exception as exc:  # report to the client, keep serving
+                        reply, blob = {"ok": False, "error": f"{type(exc).__name__}: {exc}",
+                                       "traceback": traceback.format_exc()}, None
+                    stream.write(json.dumps(reply).encode("utf-8") + b"\n")
+                    if blob is not None:
+                        stream.write(blob)
+                    stream.flush()
+            except OSError:
+                pass  # the client hung up before reading its reply
+            if isinstance(request, dict) and request.get("op") == "shutdown":
+                os.kill(os.getppid(), signal.SIGTERM)  # after replying: the daemon stops its workers
+        os._exit(0)
+
+
+# --- Daemon side -----------------------------------------------------------
+
+def warm_up():
+    """Import and load everything workers should inherit."""
+    template_cache.base_presentation()
+    deck_incremental.base_parts()
+    deck_incremental.helpers_digest()
+    # One throwaway slide pulls in the lazily imported python-pptx modules
+    deck_spec.build_deck(deck_spec.validate_spec({"slides": [{"type": "title", "title": "", "subtitle": ""}]}))
+
+
+def serve(socket_path=SOCKET_PATH, workers=2, max_jobs=500):
+    """Listen on socket_path and keep `workers` forked workers running until SIGTERM."""
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
+    warm_up()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(64)
+
+    children = set()
+
+    def stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            # The child must never return into this loop: its finally would stop the siblings
+            try:
+                Worker(server, max_jobs).serve()
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(1)
+        children.add(pid)
+
+    for _ in range(workers):
+        spawn()
+    print(f"deck daemon {os.getpid()} listening on {socket_path} with {workers} workers", flush=True)
+    try:
+        while True:
+            pid, _ = os.wait()
+            children.discard(pid)
+            spawn()  # replace a worker that retired or crashed
+    finally:
+        for pid in children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+    return 0
+
+
+def main():
+    """Run the warm build daemon in the foreground."""
+    parser = argparse.ArgumentParser(description="Warm deck build daemon (pair with deck_client.py).")
+    parser.add_argument("-j", "--workers", type=int, default=2, help="forked workers (default: 2)")
+    parser.add_argument("--socket", default=SOCKET_PATH, help=f"Unix socket path (default: {SOCKET_PATH})")
+    parser.add_argument("--max-jobs", type=int, default=500, help="jobs per worker before it is replaced")
+    args = parser.parse_args()
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        print("✗ the build daemon needs fork() and Unix sockets", file=sys.stderr)
+        return 1
+    return serve(args.socket, args.workers, args.max_jobs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Structural diff between two PPTX files.
+
+Package parts are compared by the CRC-32 and size already stored in the zip
+directory, so identical parts are never read or parsed. Slides are aligned
+by content (slide part and relationships), so an inserted slide does not
+show up as every later slide changing. Only slides that differ are parsed.
+Their shapes are matched by name and compared by a hash of their canonical
+XML. Changed shapes are classified as text, geometry, colour or other
+formatting changes. Relationships whose target changed (layout, chart,
+picture) are listed by id.
+
+    python deck_diff.py CharacterLock_AI_Presentation.pptx CharacterLock_AI_Presentation_HONEST.pptx
+    python deck_diff.py old.pptx new.pptx --json > diff.json
+
+Exits 0 when the decks are structurally identical, 1 when they differ.
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import posixpath
+import sys
+import zipfile
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+SHAPE_TAGS = ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")
+
+
+class Deck:
+    """Lazily read view of one package: zip directory, slide order, parsed slides on demand."""
+
+    def __init__(self, path):
+        self.path = path
+        self.zip = zipfile.ZipFile(path)
+        self.infos = {info.filename: info for info in self.zip.infolist()}
+        self.slides = self._slide_order()
+
+    def _slide_order(self):
+        presentation = etree.fromstring(self.zip.read("ppt/presentation.xml"))
+        rels = etree.fromstring(self.zip.read("ppt/_rels/presentation.xml.rels"))
+        targets = {rel.get("Id"): posixpath.normpath(posixpath.join("ppt", rel.get("Target")))
+                   for rel in rels.iterfind("pr:Relationship", NS)}
+        return [targets[sld_id.get(f"{{{NS['r']}}}id")]
+                for sld_id in presentation.iterfind("p:sldIdLst/p:sldId", NS)]
+
+    def fingerprint(self, name):
+        """Cheap identity of a part from the zip directory: (CRC-32, size)."""
+        info = self.infos[name]
+        return info.CRC, info.file_size
+
+    def slide_fingerprint(self, slide):
+        """Fingerprints of a slide part and of its relationships part (None if it has none)."""
+        rels = _rels_name(slide)
+        return self.fingerprint(slide), self.fingerprint(rels) if rels in self.infos else None
+
+    def relationships(self, slide):
+        """{relationship id: "type target"} of a slide, with targets resolved to part names."""
+        rels = _rels_name(slide)
+        if rels not in self.infos:
+            return {}
+        relationships = {}
+        for rel in etree.fromstring(self.zip.read(rels)).iterfind("pr:Relationship", NS):
+            target = rel.get("Target")
+            if rel.get("TargetMode") != "External":
+                target = posixpath.normpath(posixpath.join(posixpath.dirname(slide), target))
+            relationships[rel.get("Id")] = f"{rel.get('Type').rsplit('/', 1)[-1]} {target}"
+        return relationships
+
+    def shapes(self, slide):
+        """[(shape key, shape element)] for the top-level shapes of a slide."""
+        root = etree.fromstring(self.zip.read(slide))
+        tree = root.find("p:cSld/p:spTree", NS)
+        shapes = []
+        seen = {}
+        for element in tree:
+            if etree.QName(element).localname not in SHAPE_TAGS:
+                continue
+            c_nv_pr = element.find("./*/p:cNvPr", NS)
+            name = c_nv_pr.get("name") if c_nv_pr is not None else etree.QName(element).localname
+            seen[name] = seen.get(name, 0) + 1
+            shapes.append((name if seen[name] == 1 else f"{name} #{seen[name]}", element))
+        return shapes
+
+    def close(self):
+        self.zip.close()
+
+
+def _rels_name(partname):
+    directory, name = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def _text(element):
+    return "\n".join("".join(p.itertext()) for p in element.iterfind(".//a:p", NS))
+
+
+def _preview(element):
+    return _text(element).strip()[:80]
+
+
+def _geometry(element):
+    xfrm = element.find("./p:spPr/a:xfrm", NS)
+    if xfrm is None:
+        xfrm = element.find("./p:xfrm", NS)
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+    return tuple(int(v) for v in (off.get("x"), off.get("y"), ext.get("cx"), ext.get("cy")))
+
+
+def _colors(element):
+    return sorted(c.get("val") for c in element.iter(f"{{{NS['a']}}}srgbClr"))
+
+
+def _digest(element):
+    return hashlib.sha1(etree.tostring(element, method="c14n")).digest()
+
+
+def slide_title(deck, slide):
+    """First line of text on a slide, for reports."""
+    for _, shape in deck.shapes(slide):
+        text = _text(shape).strip()
+        if text:
+            return text.splitlines()[0][:60]
+    return ""
+
+
+def diff_shapes(old_deck, old_slide, new_deck, new_slide):
+    """Shape-level changes between two versions of a slide."""
+    old_shapes, new_shapes = dict(old_deck.shapes(old_slide)), dict(new_deck.shapes(new_slide))
+    changes = []
+    for key in old_shapes:
+        if key not in new_shapes:
+            changes.append({"shape": key, "change": "removed", "text": _preview(old_shapes[key])})
+    for key, new in new_shapes.items():
+        old = old_shapes.get(key)
+        if old is None:
+            changes.append({"shape": key, "change": "added", "text": _preview(new)})
+            continue
+        if _digest(old) == _digest(new):
+            continue
+        kinds = []
+        details = {}
+        if _text(old) != _text(new):
+            kinds.append("text")
+            details["text"] = [_preview(old), _preview(new)]
+        if _geometry(old) != _geometry(new):
+            kinds.append("geometry")
+            details["geometry"] = [_geometry(old), _geometry(new)]
+        if _colors(old) != _colors(new):
+            kinds.append("colour")
+            details["colour"] = [_colors(old), _colors(new)]
+        changes.append({"shape": key, "change": "+".join(kinds) or "format", **details})
+    return changes
+
+
+def diff_rels(old_deck, old_slide, new_deck, new_slide):
+    """Relationships of a slide that were added, removed or retargeted."""
+    old_rels, new_rels = old_deck.relationships(old_slide), new_deck.relationships(new_slide)
+    return [{"id": rid, "old": old_rels.get(rid), "new": new_rels.get(rid)}
+            for rid in sorted(set(old_rels) | set(new_rels), key=lambda rid: (len(rid), rid))
+            if old_rels.get(rid) != new_rels.get(rid)]
+
+
+def diff_decks(old_path, new_path):
+    """Return a structured diff of two decks."""
+    old, new = Deck(old_path), Deck(new_path)
+    try:
+        result = {"old": old_path, "new": new_path, "parts": [], "slides": []}
+
+        # Non-slide parts: compare directory entries only
+        slide_parts = set(old.slides) | set(new.slides)
+        for name in sorted(set(old.infos) | set(new.infos)):
+            if name in slide_parts or name.startswith(("ppt/slides/_rels/", "ppt/slides/slide")):
+                continue
+            if name not in new.infos:
+                result["parts"].append({"part": name, "change": "removed"})
+            elif name not in old.infos:
+                result["parts"].append({"part": name, "change": "added"})
+            elif old.fingerprint(name) != new.fingerprint(name):
+                result["parts"].append({"part": name, "change": "modified"})
+
+        # Align slides on their fingerprints; only mismatched runs get parsed
+        old_keys = [old.slide_fingerprint(s) for s in old.slides]
+        new_keys = [new.slide_fingerprint(s) for s in new.slides]
+        # Trim the common head and tail first: cheap, and it keeps repetitive decks aligned
+        head = 0
+        while head < min(len(old_keys), len(new_keys)) and old_keys[head] == new_keys[head]:
+            head += 1
+        tail = 0
+        while (tail < min(len(old_keys), len(new_keys)) - head
+               and old_keys[-1 - tail] == new_keys[-1 - tail]):
+            tail += 1
+        matcher = difflib.SequenceMatcher(None, old_keys[head:len(old_keys) - tail],
+                                          new_keys[head:len(new_keys) - tail], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            i1, i2, j1, j2 = i1 + head, i2 + head, j1 + head, j2 + head
+            paired = min(i2 - i1, j2 - j1) if tag == "replace" else 0
+            for offset in range(paired):
+                i, j = i1 + offset, j1 + offset
+                result["slides"].append({
+                    "change": "modified", "old_index": i + 1, "new_index": j + 1,
+                    "title": slide_title(new, new.slides[j]),
+                    "shapes": diff_shapes(old, old.slides[i], new, new.slides[j]),
+                    "rels": diff_rels(old, old.slides[i], new, new.slides[j]),
+                })
+            for i in range(i1 + paired, i2):
+                result["slides"].append({"change": "removed", "old_index": i + 1,
+                                         "title": slide_title(old, old.slides[i])})
+            for j in range(j1 + paired, j2):
+                result["slides"].append({"change": "added", "new_index": j + 1,
+                                         "title": slide_title(new, new.slides[j])})
+        result["unchanged_slides"] = head + tail + sum(block.size for block in matcher.get_matching_blocks())
+        return result
+    finally:
+        old.close()
+        new.close()
+
+
+def print_report(result):
+    print(f"--- {result['old']}\n+++ {result['new']}")
+    for part in result["parts"]:
+        print(f"  part {part['change']:<9} {part['part']}")
+    for slide in result["slides"]:
+        if slide["change"] == "modified":
+            where = (f"slide {slide['old_index']}" if slide["old_index"] == slide["new_index"]
+                     else f"slide {slide['old_index']} → {slide['new_index']}")
+            print(f"~ {where}: {slide['title']}")
+            for shape in slide["shapes"]:
+                line = f"    {shape['change']:<15} {shape['shape']}"
+                if "text" in shape and isinstance(shape["text"], list):
+                    line += f": {shape['text'][0]!r} → {shape['text'][1]!r}"
+                elif "geometry" in shape:
+                    line += f": {shape['geometry'][0]} → {shape['geometry'][1]}"
+                elif "colour" in shape:
+                    line += f": {shape['colour'][0]} → {shape['colour'][1]}"
+                elif shape.get("text"):
+                    line += f": {shape['text']!r}"
+                print(line)
+            for rel in slide["rels"]:
+                print(f"    {'relationship':<15} {rel['id']}: {rel['old'] or '(none)'} → {rel['new'] or '(none)'}")
+        elif slide["change"] == "removed":
+            print(f"- slide {slide['old_index']}: {slide['title']}")
+        else:
+            print(f"+ slide {slide['new_index']}: {slide['title']}")
+    print(f"{result['unchanged_slides']} slides unchanged, {len(result['slides'])} slide changes, "
+          f"{len(result['parts'])} other part changes")
+
+
+def main():
+    """Diff two decks and exit non-zero if they differ."""
+    parser = argparse.ArgumentParser(description="Structural diff between two PPTX files.")
+    parser.add_argument("old", help="original deck")
+    parser.add_argument("new", help="changed deck")
+    parser.add_argument("--json", action="store_true", help="print the diff as JSON")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no output, exit status only")
+    args = parser.parse_args()
+
+    result = diff_decks(args.old, args.new)
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif not args.quiet:
+        print_report(result)
+    return 1 if result["slides"] or result["parts"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Image ingestion for slides: parallel resizing, a bounded on-disk cache, grids.
+
+prepare_images() turns source images (storyboard frames, photos) into copies
+sized for the box they are shown in at a target DPI. The copies are
+re-encoded as JPEG, or PNG when the source has transparency, and written to
+.deck_cache/images/. They are keyed by the content hash of the source, the
+pixel box and the DPI. A source used twice, even under two names, is
+resized once. Identical copies share one picture part per package, and
+deck_package names the parts by content hash, so identical frames are stored
+once.
+
+Missing copies are decoded and resized in a pool of worker processes. JPEG
+sources are decoded at a reduced scale (Pillow's draft mode) when the box is
+much smaller than the source. Decoded pixels stay in the workers: only
+cache paths and pixel sizes come back. So laying out thousands of frames
+holds just the small, encoded copies that python-pptx embeds.
+
+The cache is bounded by MAX_CACHE_BYTES. Every hit refreshes an entry's
+mtime, and after each batch that wrote new entries, the oldest are evicted
+until the cache fits again.
+"""
+
+import atexit
+import functools
+import hashlib
+import math
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import Image as PptxImage, ImagePart
+from pptx.util import Emu, Inches
+
+from deck_styles import add_paragraphs
+
+# Bump when resizing or encoding changes, to retire cached copies
+CACHE_VERSION = 1
+
+IMAGE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".deck_cache", "images")
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+DPI = 150
+JPEG_QUALITY = 85
+
+EMU_PER_INCH = 914400
+CAPTION_HEIGHT = Inches(0.3)
+GRID_GAP = Inches(0.15)
+
+# Storyboard slides: the helper that lays them out, its default grid, and the area below the title
+STORYBOARD_HELPER = "create_storyboard_slide"
+STORYBOARD_COLUMNS = 4
+STORYBOARD_ROWS = 3
+STORYBOARD_AREA = (Inches(0.5), Inches(1.5), Inches(9), Inches(5.6))
+
+_pool = None
+_pool_jobs = None
+
+# Package -> {"count": frames added, image SHA-1: ImagePart} for add_picture()
+_image_parts = weakref.WeakKeyDictionary()
+
+
+# --- Resizing and the cache -------------------------------------------------------
+
+@functools.lru_cache(maxsize=65536)
+def _digest(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def source_digest(path):
+    """Content hash of an image file, re-read only when its mtime or size changes."""
+    stat = os.stat(path)
+    return _digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def box_pixels(width, height, dpi=DPI):
+    """Pixel size of a width x height EMU box at dpi."""
+    return (max(1, math.ceil(width / EMU_PER_INCH * dpi)), max(1, math.ceil(height / EMU_PER_INCH * dpi)))
+
+
+def _cache_stem(digest, box, dpi, cache_dir):
+    key = hashlib.sha256(f"{CACHE_VERSION}:{digest}:{box[0]}x{box[1]}@{dpi}:{JPEG_QUALITY}".encode())
+    return os.path.join(cache_dir, key.hexdigest()[:32])
+
+
+def _lookup(stem):
+    """(path, pixel size) of a cached copy, or None. A hit refreshes the entry's mtime."""
+    for extension in (".jpg", ".png"):
+        path = stem + extension
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            continue
+        with Image.open(path) as image:  # reads the header only
+            return path, image.size
+    return None
+
+
+def resize_image(source, stem, box, dpi=DPI):
+    """Decode source, fit it inside box (never upscaling), and save it at stem + .jpg/.png.
+
+    Returns (path, pixel size). Runs in pool workers.
+    """
+    with Image.open(source) as image:
+        if image.format == "JPEG":
+            image.draft("RGB", box)
+        image = ImageOps.exif_transpose(image)
+        alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if alpha else "RGB")
+        image.thumbnail(box, Image.LANCZOS, reducing_gap=3.0)
+        path = stem + (".png" if alpha else ".jpg")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        if alpha:
+            image.save(tmp_path, "PNG", dpi=(dpi, dpi), optimize=True)
+        else:
+            image.save(tmp_path, "JPEG", dpi=(dpi, dpi), quality=JPEG_QUALITY, optimize=True)
+        os.replace(tmp_path, path)
+        return path, image.size
+
+
+def _resize_job(job):
+    try:
+        return resize_image(*job)
+    except OSError as exc:  # includes PIL.UnidentifiedImageError
+        raise ValueError(f"{job[0]}: cannot read image ({exc})") from None
+
+
+def _executor(jobs):
+    """The shared resize pool, recreated when a batch asks for a different number of workers."""
+    global _pool, _pool_jobs
+    if _pool is not None and _pool_jobs != jobs:
+        atexit.unregister(_pool.shutdown)
+        _pool.shutdown()
+        _pool = None
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=jobs)
+        _pool_jobs = jobs
+        atexit.register(_pool.shutdown)
+    return _pool
+
+
+def evict(cache_dir=IMAGE_CACHE_DIR, max_bytes=MAX_CACHE_BYTES, keep=()):
+    """Delete the least recently used copies until the cache is at most max_bytes. Returns bytes freed.
+
+    Paths in keep (the copies a batch is about to use) are never deleted.
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    try:
+        entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                   for entry in os.scandir(cache_dir) if entry.is_file() and not entry.name.endswith(".tmp")
+                   and os.path.abspath(entry.path) not in keep]
+    except FileNotFoundError:
+        return 0
+    total = sum(size for _, size, _ in entries) + sum(os.path.getsize(path) for path in keep
+                                                      if os.path.exists(path))
+    freed = 0
+    for _, size, path in sorted(entries):
+        if total - freed <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            continue
+        freed += size
+    return freed
+
+
+def prepare_images(paths, box, dpi=DPI, cache_dir=IMAGE_CACHE_DIR, max_bytes=MAX_CACHE_BYTES, jobs=None):
+    """(cached path, pixel size) of a copy of each source image fitted to a pixel box, in order.
+
+    Sources missing from the cache are resized in parallel; identical sources
+    are resized once.
+    """
+    stems = [_cache_stem(source_digest(path), box, dpi, cache_dir) for path in paths]
+    results = {}
+    missing = {}
+    for path, stem in zip(paths, stems):
+        if stem in results or stem in missing:
+            continue
+        cached = _lookup(stem)
+        if cached is None:
+            missing[stem] = path
+        else:
+            results[stem] = cached
+
+    if missing:
+        os.makedirs(cache_dir, exist_ok=True)
+        work = [(path, stem, box, dpi) for stem, path in missing.items()]
+        workers = jobs or os.cpu_count() or 1
+        jobs = min(workers, len(work))
+        if jobs <= 1:
+            resized = map(_resize_job, work)
+        else:
+            resized = _executor(workers).map(_resize_job, work, chunksize=max(1, len(work) // (jobs * 4)))
+        results.update(zip(missing, resized))
+        evict(cache_dir, max_bytes, keep=[path for path, _ in results.values()])
+    return [results[stem] for stem in stems]
+
+
+# --- Pictures --------------------------------------------------------------------
+
+def add_picture(slide, image_file, left, top, width, height):
+    """slide.shapes.add_picture(), with image parts looked up in a per-package index.
+
+    python-pptx walks every part of the package on each add_picture() call, to
+    find a duplicate image and the next free image name, which makes a deck of
+    thousands of frames quadratic to build. Here duplicates are found by SHA-1
+    in an index kept per package, and new parts are named /ppt/media/frameN,
+    outside the imageN names python-pptx allocates.
+    """
+    image = PptxImage.from_file(image_file)
+    package = slide.part.package
+    parts = _image_parts.setdefault(package, {"count": 0})
+    part = parts.get(image.sha1)
+    if part is None:
+        parts["count"] += 1
+        partname = PackURI(f"/ppt/media/frame{parts['count']}.{image.ext}")
+        part = parts[image.sha1] = ImagePart(partname, image.content_type, package, image.blob, image.filename)
+    rId = slide.part.relate_to(part, RT.IMAGE)
+    shapes = slide.shapes
+    pic = shapes._add_pic_from_image_part(part, rId, left, top, width, height)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+
+# --- Layout ----------------------------------------------------------------------
+
+def grid_cells(left, top, width, height, columns, rows, captions=False, gap=GRID_GAP):
+    """Picture boxes (left, top, width, height) of a columns x rows grid, row by row."""
+    cell_width = (width - gap * (columns - 1)) // columns
+    cell_height = (height - gap * (rows - 1)) // rows
+    picture_height = cell_height - (CAPTION_HEIGHT if captions else 0)
+    return [(left + column * (cell_width + gap), top + row * (cell_height + gap), cell_width, picture_height)
+            for row in range(rows) for column in range(columns)]
+
+
+def fit_box(size, box):
+    """(left, top, width, height) of a picture of pixel size `size` fitted and centred in box."""
+    left, top, width, height = box
+    scale = min(width / size[0], height / size[1])
+    fitted_width, fitted_height = int(size[0] * scale), int(size[1] * scale)
+    return left + (width - fitted_width) // 2, top + (height - fitted_height) // 2, fitted_width, fitted_height
+
+
+def add_image_grid(slide, frames, left, top, width, height, columns, rows, captions=None, dpi=DPI):
+    """Lay out up to columns x rows frames in a grid, with optional captions under each."""
+    frames = frames[:columns * rows]
+    cells = grid_cells(left, top, width, height, columns, rows, captions=bool(captions))
+    prepared = prepare_images(frames, box_pixels(cells[0][2], cells[0][3], dpi), dpi)
+    for index, ((path, size), cell) in enumerate(zip(prepared, cells)):
+        picture_left, picture_top, picture_width, picture_height = fit_box(size, cell)
+        add_picture(slide, path, Emu(picture_left), Emu(picture_top), Emu(picture_width), Emu(picture_height))
+        if captions and index < len(captions) and captions[index]:
+            caption = slide.shapes.add_textbox(Emu(cell[0]), Emu(cell[1] + cell[3]), Emu(cell[2]), CAPTION_HEIGHT)
+            caption.text_frame.word_wrap = True
+            add_paragraphs(caption.text_frame, [captions[index]], "light-caption")
+    return slide
+
+
+def frame_pages(frames, columns, rows):
+    """Split frames into per-slide pages of at most columns x rows."""
+    per_page = columns * rows
+    return [frames[start:start + per_page] for start in range(0, len(frames), per_page)]
+
+
+def storyboard_grid(slide, frames, columns, rows, captions=None):
+    """Add a storyboard frame grid below a slide title."""
+    return add_image_grid(slide, frames, *STORYBOARD_AREA, columns, rows, captions)
+
+
+def prefetch(steps):
+    """Resize the frames of every storyboard step in one parallel batch.
+
+    Building those steps afterwards only hits the cache, instead of resizing
+    one page of frames at a time.
+    """
+    batches = {}
+    for step in steps:
+        if step["helper"] == STORYBOARD_HELPER:
+            kwargs = step["kwargs"]
+            columns = kwargs.get("columns", STORYBOARD_COLUMNS)
+            rows = kwargs.get("rows", STORYBOARD_ROWS)
+            cell = grid_cells(*STORYBOARD_AREA, columns, rows, captions=bool(kwargs.get("captions")))[0]
+            batches.setdefault(box_pixels(cell[2], cell[3]), []).extend(kwargs["frames"][:columns * rows])
+    for box, frames in batches.items():
+        prepare_images(frames, box)
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+Import an existing PPTX back into a deck spec, or into builder calls.
+
+    python deck_import.py CharacterLock_AI_Presentation_HONEST.pptx -o specs/imported.json
+    python deck_import.py CharacterLock_Dark_Theme.pptx -o rebuild_dark.py
+
+Slides are read from the package one at a time, and the output is written as
+each slide is imported, so memory stays flat however long the deck is.
+
+Each slide is matched against the slide helpers:
+  - the title, content, two-column, large-text and closing slides of
+    create_presentation_v2.py, with or without a source footnote;
+  - the 18pt content, large-text and closing slides of create_presentation.py
+    (the v1_* spec types);
+  - the fixed dark-theme slides.
+The candidate text is read back from the slide's shapes. The candidate is
+then rebuilt in a scratch presentation and kept only if its slide XML is
+identical to the original. So a spec written by the import regenerates the
+deck without loss.
+
+A slide that matches no helper cannot be written to a spec. It is reported,
+and the exit status is 1. Builder output (.py, or --format python) turns such
+slides into calls to set_slide_background, add_text_box and
+add_rounded_rectangle from create_dark_presentation.py, one call per shape
+those helpers can reproduce. Other shapes (pictures, charts, ovals, ...) are
+listed in a comment, and the slide is reported as approximate. Builder code
+is verified by running it, after compile_builder() has checked that it only
+calls those builders; text from the deck only ever reaches it as string
+literals or escaped comments. The generated script imports the repo's
+helper modules, so keep it in the repo directory.
+Specs and scripts save to <deck stem>.rebuilt.pptx, never over the source deck.
+
+Chart and storyboard slides are not matched back to their slide types. The
+build downsamples chart data and resizes frames, so the spec inputs cannot
+be recovered from the package.
+"""
+
+import argparse
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+import textwrap
+import zipfile
+
+from lxml import etree
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+import create_dark_presentation as dark_helpers
+import create_presentation as v1_helpers
+import create_presentation_v2 as helpers
+import deck_styles
+import template_cache
+from deck_diff import NS, SHAPE_TAGS, Deck, _geometry
+from deck_spec import SLIDE_TYPES, build_slide
+
+try:
+    import yaml
+except ImportError:  # YAML output is optional
+    yaml = None
+
+FORMATS = {".json": "json", ".yaml": "yaml", ".yml": "yaml", ".py": "python"}
+
+# Spec types with no fields: fixed slides, recognized by their whole XML
+FIXED_TYPES = sorted(slide_type for slide_type, (_, fields) in SLIDE_TYPES.items() if not fields)
+FOOTNOTE_OFFSET = (Inches(0.5), Inches(6.8))
+BLANK_LAYOUT = 6
+
+# Palette colours by value, named in builder output (the first name wins: LABEL_GREY is FOOTNOTE_GREY)
+COLOR_NAMES = {}
+for _name, _value in vars(deck_styles).items():
+    if _name.isupper() and isinstance(_value, tuple) and len(_value) == 3:
+        COLOR_NAMES.setdefault(_value, _name)
+ALIGN_NAMES = {"l": "LEFT", "ctr": "CENTER", "r": "RIGHT", "just": "JUSTIFY"}
+
+# Names the builder calls run with, as the generated script imports them
+BUILDER_NAMESPACE = {"light": helpers, "v1": v1_helpers, "dark": dark_helpers, "styles": deck_styles,
+                     "PP_ALIGN": PP_ALIGN}
+
+_CTRL_ESCAPE = re.compile(r"_x([0-9A-F]{4})_")
+
+# The only functions builder code may call, and the names it may use
+BUILDER_CALLS = {"prs.slides.add_slide", "dark.set_slide_background", "dark.add_text_box",
+                 "dark.add_rounded_rectangle"}
+BUILDER_NAMES = {"prs", "slide", "dark", "styles", "PP_ALIGN"}
+_BUILDER_NODES = (ast.Module, ast.Assign, ast.Expr, ast.Call, ast.Attribute, ast.Name, ast.Load, ast.Store,
+                  ast.Constant, ast.Subscript, ast.Tuple, ast.List, ast.keyword, ast.UnaryOp, ast.USub)
+
+
+class DeckImportError(ValueError):
+    """Raised when a file cannot be read as a deck."""
+
+
+# --- Reading slides ----------------------------------------------------------------
+
+def _local(element):
+    return etree.QName(element).localname
+
+
+def paragraph_text(p, line_break="\n"):
+    """Text of an a:p element, with a:br as line_break and python-pptx's _xHHHH_ escapes undone."""
+    parts = []
+    for child in p:
+        tag = _local(child)
+        if tag in ("r", "fld"):
+            parts.append(child.findtext("a:t", "", NS))
+        elif tag == "br":
+            parts.append(line_break)
+    return _CTRL_ESCAPE.sub(lambda m: chr(int(m.group(1), 16)), "".join(parts))
+
+
+def paragraphs(shape, line_break="\n"):
+    """Texts of the paragraphs of a shape, [] for shapes without a text body."""
+    return [paragraph_text(p, line_break) for p in shape.iterfind("p:txBody/a:p", NS)]
+
+
+def _placeholder(shape):
+    return shape.find("p:nvSpPr/p:nvPr/p:ph", NS)
+
+
+def _is_textbox(shape):
+    c_nv_sp_pr = shape.find("p:nvSpPr/p:cNvSpPr", NS)
+    return c_nv_sp_pr is not None and c_nv_sp_pr.get("txBox") == "1"
+
+
+def _shape_name(shape):
+    c_nv_pr = shape.find("./*/p:cNvPr", NS)
+    return c_nv_pr.get("name") if c_nv_pr is not None else _local(shape)
+
+
+def slide_shapes(root):
+    """Top-level shapes of a slide, in z-order."""
+    return [shape for shape in root.find("p:cSld/p:spTree", NS) if _local(shape) in SHAPE_TAGS]
+
+
+def read_slides(path):
+    """Iterator of (slide number, layout part name, slide root) over a deck, parsing one slide at a time.
+
+    The package is opened here, so an unreadable file fails before any slide is read.
+    """
+    try:
+        deck = Deck(path)
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as exc:
+        raise DeckImportError(f"{path}: not a readable PPTX ({exc})") from None
+    return _iter_slides(deck)
+
+
+def _iter_slides(deck):
+    try:
+        for number, name in enumerate(deck.slides, 1):
+            rels_name = posixpath.join(posixpath.dirname(name), "_rels", posixpath.basename(name) + ".rels")
+            try:
+                rels = etree.fromstring(deck.zip.read(rels_name))
+                root = etree.fromstring(deck.zip.read(name))
+            except (KeyError, etree.XMLSyntaxError) as exc:
+                raise DeckImportError(f"{deck.path}: slide {number} is unreadable ({exc})") from None
+            layout = next((posixpath.basename(rel.get("Target")) for rel in rels.iterfind("pr:Relationship", NS)
+                           if rel.get("Type").endswith("/slideLayout")), None)
+            yield number, layout, root
+    finally:
+        deck.close()
+
+
+def slide_key(layout, root):
+    """Identity of a slide for comparisons: its layout and a hash of its canonical XML."""
+    return layout, hashlib.sha1(etree.tostring(root, method="c14n")).hexdigest()
+
+
+# --- Verification ------------------------------------------------------------------
+
+class Scratch:
+    """A presentation that candidate slides are built in one at a time, compared and dropped."""
+
+    def __init__(self):
+        self.prs = template_cache.new_presentation()
+        self.layouts = {posixpath.basename(str(layout.part.partname)): index
+                        for index, layout in enumerate(self.prs.slide_layouts)}
+        self._fixed = None
+
+    def build(self, run):
+        """slide_key() of the one slide run(prs) adds, or None if it fails or adds another number."""
+        slides = self.prs.slides
+        try:
+            run(self.prs)
+            if len(slides) != 1:
+                return None
+            slide = slides[0]
+            return slide_key(posixpath.basename(str(slide.slide_layout.part.partname)),
+                             etree.fromstring(slide.part.blob))
+        except Exception:  # a candidate the helper rejects is just not a match
+            return None
+        finally:
+            for sld_id in list(slides._sldIdLst):
+                self.prs.part.drop_rel(sld_id.rId)
+                slides._sldIdLst.remove(sld_id)
+
+    def step_key(self, step):
+        return self.build(lambda prs: build_slide(prs, step))
+
+    def code_key(self, lines):
+        # Source rejected by compile_builder() fails the build like any other mismatch
+        return self.build(lambda prs: exec(compile_builder(lines), dict(BUILDER_NAMESPACE, prs=prs)))
+
+    def fixed_types(self):
+        """slide_key() -> spec type of the fixed slides, built on first use."""
+        if self._fixed is None:
+            self._fixed = {self.step_key(make_step(slide_type, {})): slide_type for slide_type in FIXED_TYPES}
+        return self._fixed
+
+
+def _dotted(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return base and f"{base}.{node.attr}"
+    return None
+
+
+def compile_builder(lines):
+    """Compile builder source lines, after checking they only call the primitive builders.
+
+    Raises ValueError for anything else: other names or calls, private
+    attributes, or statements other than assignments and calls.
+    """
+    tree = ast.parse("\n".join(lines), "<builder>")
+    for node in ast.walk(tree):
+        if not isinstance(node, _BUILDER_NODES):
+            raise ValueError(f"builder code may not contain {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in BUILDER_NAMES:
+            raise ValueError(f"builder code may not use {node.id!r}")
+        if isinstance(node, ast.Attribute) and node.attr.startswith("_"):
+            raise ValueError(f"builder code may not use {node.attr!r}")
+        if isinstance(node, ast.Call) and _dotted(node.func) not in BUILDER_CALLS:
+            raise ValueError("builder code may only call " + ", ".join(sorted(BUILDER_CALLS)))
+    return compile(tree, "<builder>", "exec")
+
+
+def make_step(slide_type, kwargs, footnote=None):
+    """The plan step deck_spec compiles a slide of this type into."""
+    return {"helper": SLIDE_TYPES[slide_type][0], "kwargs": kwargs, "footnote": footnote, "claims": None}
+
+
+# --- Matching slide helpers --------------------------------------------------------
+
+def candidates(shapes):
+    """(spec type, helper kwargs, footnote) guesses for a slide's shapes, to be verified by rebuilding them."""
+    footnote = None
+    if shapes and _is_textbox(shapes[-1]) and _geometry(shapes[-1])[:2] == FOOTNOTE_OFFSET:
+        texts = paragraphs(shapes[-1])
+        if len(texts) == 2:
+            footnote = texts[1]
+            shapes = shapes[:-1]
+    placeholders = {}
+    for shape in shapes:
+        ph = _placeholder(shape)
+        if ph is not None:
+            placeholders[ph.get("type") or ph.get("idx")] = shape
+    # Text boxes start with the empty paragraph python-pptx creates; helpers add theirs after it
+    textboxes = [paragraphs(shape) for shape in shapes if _is_textbox(shape)]
+
+    guesses = []
+    if len(placeholders) == len(shapes) == 2:
+        if {"ctrTitle", "subTitle"} <= set(placeholders):
+            guesses.append(("title", {"title": "\n".join(paragraphs(placeholders["ctrTitle"], "\v")),
+                                      "subtitle": "\n".join(paragraphs(placeholders["subTitle"], "\v"))}))
+        elif {"title", "1"} <= set(placeholders):
+            content = {"title": "\n".join(paragraphs(placeholders["title"], "\v")),
+                       "content_items": paragraphs(placeholders["1"])[1:]}
+            guesses += [("content", content), ("v1_content", content)]
+    elif len(textboxes) == len(shapes) and all(len(texts) >= 2 for texts in textboxes):
+        if len(textboxes) == 3:
+            title, left, right = textboxes
+            guesses.append(("two_column", {"title": title[1], "left_content": left[1:], "right_content": right[1:]}))
+            large_text = {"title": title[1], "main_text": left[1], "subtext": right[1]}
+            guesses += [("large_text", large_text), ("v1_large_text", large_text)]
+        elif len(textboxes) == 2:
+            first, second = textboxes
+            large_text = {"title": first[1], "main_text": second[1]}
+            closing = {"headline": first[1], "lines": second[1:]}
+            guesses += [("large_text", large_text), ("v1_large_text", large_text),
+                        ("closing", closing), ("v1_closing", closing)]
+    return [(slide_type, kwargs, footnote) for slide_type, kwargs in guesses]
+
+
+def spec_slide(slide_type, kwargs, footnote=None):
+    """The spec entry for a helper call, fields in SLIDE_TYPES order."""
+    slide = {"type": slide_type}
+    for field, argument, _, _ in SLIDE_TYPES[slide_type][1]:
+        if argument in kwargs:
+            slide[field] = kwargs[argument]
+    if footnote:
+        slide["footnote"] = footnote
+    return slide
+
+
+def match_slide(scratch, key, shapes):
+    """(spec type, helper kwargs, footnote) of the helper call that rebuilds a slide exactly, or None."""
+    fixed = scratch.fixed_types().get(key)
+    if fixed is not None:
+        return fixed, {}, None
+    for slide_type, kwargs, footnote in candidates(shapes):
+        if scratch.step_key(make_step(slide_type, kwargs, footnote)) == key:
+            return slide_type, kwargs, footnote
+    return None
+
+
+# --- Builder calls -----------------------------------------------------------------
+
+def _length(emu, unit):
+    """Shortest number that unit() (Inches, Pt) turns back into exactly emu."""
+    per_unit = unit(1)
+    for digits in range(7):
+        value = round(emu / per_unit, digits)
+        if unit(value) == emu:
+            return repr(int(value)) if value == int(value) else repr(value)
+    return repr(emu / per_unit)
+
+
+def _py(value, indent=4):
+    """Python source for a string or list of strings, lists one item per line."""
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        inner = " " * (indent + 4)
+        return "[\n" + ",\n".join(inner + _py(item, indent + 4) for item in value) + "\n" + " " * indent + "]"
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _color(element):
+    """Palette name or RGB tuple of the a:srgbClr under element, or None."""
+    srgb = element.find("a:solidFill/a:srgbClr", NS) if element is not None else None
+    if srgb is None:
+        return None
+    rgb = tuple(bytes.fromhex(srgb.get("val")))
+    return f"styles.{COLOR_NAMES[rgb]}" if rgb in COLOR_NAMES else repr(rgb)
+
+
+def helper_call(slide_type, kwargs, footnote):
+    """Source lines of the helper call for a matched slide, as create_presentation_v2.main() writes them."""
+    module, _, name = SLIDE_TYPES[slide_type][0].rpartition(".")
+    call = f"{module or 'light'}.{name}("
+    if kwargs:
+        arguments = ["prs"] + [_py(value) for value in kwargs.values()]
+        call += "\n" + ",\n".join(" " * 4 + argument for argument in arguments) + "\n)"
+    else:
+        call += "prs)"
+    if not footnote:
+        return call.splitlines()
+    return f"slide = {call}".splitlines() + [f"light.add_source_footnote(slide, {_py(footnote)})"]
+
+
+def text_box_call(shape):
+    """add_text_box() call for a text box, or None.
+
+    add_text_box() writes one paragraph. The paragraphs of other text boxes
+    are joined into its text, styled like the first paragraph with a font size.
+    """
+    if not _is_textbox(shape):
+        return None
+    ps = shape.findall("p:txBody/a:p", NS)
+    styled = [p for p in ps if p.find("a:pPr/a:defRPr[@sz]", NS) is not None]
+    if not styled:
+        return None
+    texts = [paragraph_text(p) for p in ps]
+    if len(texts) > 1 and not texts[0]:
+        texts = texts[1:]  # the empty paragraph text boxes start with, before the helpers' own
+    defaults = styled[0].find("a:pPr/a:defRPr", NS)
+    size = int(defaults.get("sz")) / 100
+    args = [_length(value, Inches) for value in _geometry(shape)]
+    args += [_py("\n".join(texts)), repr(int(size)) if size == int(size) else repr(size)]
+    if defaults.get("b") == "1":
+        args.append("bold=True")
+    color = _color(defaults)
+    if color is not None and color != "styles.WHITE":
+        args.append(f"color={color}")
+    align = styled[0].find("a:pPr", NS).get("algn", "l")
+    if align != "l":
+        args.append(f"alignment=PP_ALIGN.{ALIGN_NAMES.get(align, 'LEFT')}")
+    return f"dark.add_text_box(slide, {', '.join(args)})"
+
+
+def placeholder_call(shape):
+    """Assignment of a placeholder's text, or None for other shapes."""
+    ph = _placeholder(shape)
+    if ph is None or not shape.findall("p:txBody/a:p", NS):
+        return None
+    try:
+        idx = int(ph.get("idx", "0"))
+    except ValueError:
+        return None
+    return f"slide.placeholders[{idx}].text = {_py(chr(10).join(paragraphs(shape, chr(11))))}"
+
+
+def rectangle_call(shape):
+    """add_rounded_rectangle() call for a filled rectangle shaped like the ones it adds, or None."""
+    sp_pr = shape.find("p:spPr", NS)
+    if _local(shape) != "sp" or _is_textbox(shape) or _placeholder(shape) is not None or sp_pr is None:
+        return None
+    geometry = sp_pr.find("a:prstGeom", NS)
+    fill = _color(sp_pr)
+    if geometry is None or geometry.get("prst") != "rect" or fill is None:
+        return None
+    args = [_length(value, Inches) for value in _geometry(shape)] + [fill]
+    texts = paragraphs(shape)
+    if len(texts) == 2 and texts[1]:
+        args.append(f"text_content={_py(texts[1])}")
+    line = sp_pr.find("a:ln", NS)
+    border = _color(line)
+    if border is not None:
+        args.append(f"border_color={border}")
+        args.append(f"border_width={_length(int(line.get('w', Pt(1))), Pt)}")
+    return f"dark.add_rounded_rectangle(slide, {', '.join(args)})"
+
+
+def builder_lines(scratch, layout, root):
+    """(source lines, names of shapes left out) rebuilding a slide with the primitive builders."""
+    lines = [f"slide = prs.slides.add_slide(prs.slide_layouts[{scratch.layouts.get(layout, BLANK_LAYOUT)}])"]
+    background = _color(root.find("p:cSld/p:bg/p:bgPr", NS))
+    if background is not None:
+        lines.append(f"dark.set_slide_background(slide, {background})")
+    skipped = []
+    for shape in slide_shapes(root):
+        call = placeholder_call(shape) or text_box_call(shape) or rectangle_call(shape)
+        if call is None:
+            skipped.append(_shape_name(shape))
+            # repr() escapes line breaks, so a shape name cannot end the comment
+            call = f"# not imported: {skipped[-1]!r} ({_local(shape)})"
+        lines.append(call)
+    return lines, skipped
+
+
+# --- Importing decks ---------------------------------------------------------------
+
+def import_deck(path, builder=False):
+    """Iterator of one result per slide, in order, each slide parsed only while it is imported.
+
+    A result has the slide "number"; its "spec" entry, or None when no slide
+    type rebuilds it; builder "code" lines (when builder is true); its
+    "status", "exact" or (builder only) "approximate" or "unmatched"; and the
+    names of "skipped" shapes.
+    """
+    return _import_slides(read_slides(path), builder)
+
+
+def _import_slides(slides, builder):
+    scratch = Scratch()
+    for number, layout, root in slides:
+        key = slide_key(layout, root)
+        matched = match_slide(scratch, key, slide_shapes(root))
+        result = {"number": number, "spec": None, "code": [], "status": "exact", "skipped": []}
+        if matched is not None:
+            result["spec"] = spec_slide(*matched)
+            if builder:
+                result["code"] = helper_call(*matched)
+        elif builder:
+            result["code"], result["skipped"] = builder_lines(scratch, layout, root)
+            if scratch.code_key(result["code"]) != key:
+                result["status"] = "approximate"
+        else:
+            result["status"] = "unmatched"
+        yield result
+
+
+def write_spec(results, file, output, fmt="json"):
+    """Write the spec entries of results as a JSON or YAML spec while they are produced."""
+    if fmt == "yaml":
+        file.write(yaml.safe_dump({"output": output}, allow_unicode=True, sort_keys=False) + "slides:\n")
+    else:
+        file.write('{\n  "output": ' + json.dumps(output, ensure_ascii=False) + ',\n  "slides": [')
+    first = True
+    for result in results:
+        if result["spec"] is None:
+            continue
+        if fmt == "yaml":
+            file.write(yaml.safe_dump([result["spec"]], allow_unicode=True, sort_keys=False))
+        else:
+            entry = json.dumps(result["spec"], ensure_ascii=False, indent=2)
+            file.write(("\n" if first else ",\n") + textwrap.indent(entry, "    "))
+        first = False
+    if fmt != "yaml":
+        file.write("\n  ]\n}")
+
+
+BUILDER_HEADER = '''#!/usr/bin/env python3
+"""
+Rebuild {source} (generated by deck_import.py).
+"""
+
+from pptx.enum.text import PP_ALIGN
+
+import create_dark_presentation as dark
+import create_presentation as v1
+import create_presentation_v2 as light
+import deck_styles as styles
+import template_cache
+
+def main():
+    """Generate the presentation."""
+    prs = template_cache.new_presentation()
+'''
+
+BUILDER_FOOTER = '''
+    # Save presentation
+    output_file = {output}
+    prs.save(output_file)
+    print(f"✓ Presentation created: {{output_file}} ({{len(prs.slides)}} slides)")
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def write_builder(results, file, source, output):
+    """Write the builder code of results as a Python script while they are produced."""
+    file.write(BUILDER_HEADER.format(source=source))
+    for result in results:
+        file.write(f"\n    # Slide {result['number']}\n")
+        file.write(textwrap.indent("\n".join(result["code"]), "    ") + "\n")
+    file.write(BUILDER_FOOTER.format(output=_py(output)))
+
+
+def report(results, counts):
+    """Pass results through, counting them by status and printing slides that did not import exactly."""
+    for result in results:
+        counts[result["status"]] += 1
+        if result["status"] == "approximate":
+            detail = f"not imported: {', '.join(result['skipped'])}" if result["skipped"] else "formatting differs"
+            print(f"≈ slide {result['number']}: approximate, {detail}", file=sys.stderr)
+        elif result["status"] == "unmatched":
+            print(f"✗ slide {result['number']}: matches no slide type (builder output can approximate it)",
+                  file=sys.stderr)
+        yield result
+
+
+def main():
+    """Import a PPTX as a deck spec or builder script."""
+    parser = argparse.ArgumentParser(description="Import a PPTX back into a deck spec or builder calls.")
+    parser.add_argument("deck", help="PPTX file to import")
+    parser.add_argument("-o", "--output", default="-",
+                        help="spec (.json, .yaml, .yml) or builder script (.py) to write (default: JSON to stdout)")
+    parser.add_argument("--format", choices=sorted(set(FORMATS.values())),
+                        help="output format (default: from the output extension)")
+    args = parser.parse_args()
+
+    fmt = args.format or FORMATS.get(os.path.splitext(args.output)[1].lower(), "json")
+    if fmt == "yaml" and yaml is None:
+        print("✗ PyYAML is required for YAML output", file=sys.stderr)
+        return 1
+    source_name = os.path.basename(args.deck)
+    output_name = f"{os.path.splitext(source_name)[0]}.rebuilt.pptx"
+    counts = dict.fromkeys(("exact", "approximate", "unmatched"), 0)
+    to_stdout = args.output == "-"
+    tmp_file = None if to_stdout else f"{args.output}.{os.getpid()}.tmp"
+    try:
+        results = report(import_deck(args.deck, builder=fmt == "python"), counts)
+        with contextlib.nullcontext(sys.stdout) if to_stdout else open(tmp_file, "w", encoding="utf-8") as f:
+            if fmt == "python":
+                write_builder(results, f, source_name, output_name)
+            else:
+                write_spec(results, f, output_name, fmt)
+                if to_stdout:
+                    f.write("\n")
+    except DeckImportError as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        return 1
+    if tmp_file:
+        os.replace(tmp_file, args.output)
+
+    total = sum(counts.values())
+    print(f"✓ {args.deck} → {'stdout' if to_stdout else args.output} "
+          f"({counts['exact']}/{total} slides exact)", file=sys.stderr)
+    return 0 if counts["exact"] == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Incremental deck builds: only rebuild the slides whose inputs changed.
+
+Each slide of a compiled deck spec is hashed from its helper name and
+arguments, plus the source of the helper and style modules so that editing
+a helper invalidates its slides. The serialized slide XML and relationships
+of every slide ever built are kept under .deck_cache/slides/ by that hash; a
+build regenerates only the slides missing from the cache and re-zips the
+package from the cached parts. Chart and storyboard slides also hash their
+data and frame files, and the chart and picture parts they refer to are
+cached alongside under slides/parts/.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+import deck_charts
+import deck_images
+import deck_spec
+import deck_styles
+from deck_package import RELATED_PARTS, package_parts, related_targets, slide_parts, write_package
+
+SLIDE_CACHE_DIR = os.path.join(os.path.dirname(deck_spec.CACHE_DIR), "slides")
+
+_helpers_digest = None
+_base_parts = None
+
+
+def helpers_digest():
+    """Hash of the helper and style sources, so edits to either invalidate cached slides."""
+    global _helpers_digest
+    if _helpers_digest is None:
+        digest = hashlib.sha256()
+        for module in (*deck_spec.HELPER_MODULES.values(), deck_styles, deck_charts, deck_images):
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+        _helpers_digest = digest.hexdigest()
+    return _helpers_digest
+
+
+def invalidate_helpers():
+    """Forget the helper digest after the helper or style modules were reloaded."""
+    global _helpers_digest
+    _helpers_digest = None
+
+
+def base_parts():
+    """Parts of the empty base package every incremental deck is assembled on."""
+    global _base_parts
+    if _base_parts is None:
+        _base_parts = package_parts(deck_spec.new_presentation())
+    return _base_parts
+
+
+def slide_hash(step):
+    """Content hash of one plan step: helper name, arguments, footnote and input files."""
+    payload = [helpers_digest(), step["helper"], step["kwargs"], step["footnote"]]
+    if step.get("inputs"):
+        payload.append([deck_images.source_digest(path) for path in step["inputs"]])
+    payload = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_paths(key, cache_dir):
+    return os.path.join(cache_dir, f"{key}.xml"), os.path.join(cache_dir, f"{key}.xml.rels")
+
+
+def _write_atomic(path, blob):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _related_path(name, cache_dir):
+    return os.path.join(cache_dir, "parts", name.replace("/", "_"))
+
+
+def _read_related(target, cache_dir=SLIDE_CACHE_DIR):
+    """(blob, content type, rels XML or None) of a cached related part, or None if it is not cached."""
+    path = _related_path(target, cache_dir)
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+        with open(f"{path}.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        return None
+    rels = meta["rels"].encode("utf-8") if meta["rels"] is not None else None
+    return blob, meta["content_type"], rels
+
+
+# Related parts evicted from memory are read back from the slide cache
+RELATED_PARTS.loader = _read_related
+
+
+def _load_related(rels_xml, partname, cache_dir):
+    """Load the related parts a rels part refers to into RELATED_PARTS; False if any is missing."""
+    for target in related_targets(rels_xml, partname):
+        if target in RELATED_PARTS:
+            continue
+        entry = _read_related(target, cache_dir)
+        if entry is None:
+            return False
+        RELATED_PARTS[target] = entry
+        rels = entry[2]
+        if rels is not None and not _load_related(rels, target, cache_dir):
+            return False
+    return True
+
+
+def _store_related(rels_xml, partname, cache_dir):
+    for target in related_targets(rels_xml, partname):
+        path = _related_path(target, cache_dir)
+        if os.path.exists(f"{path}.json"):
+            continue  # content-addressed: already stored
+        blob, content_type, rels = RELATED_PARTS[target]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _write_atomic(path, blob)
+        if rels is not None:
+            _store_related(rels, target, cache_dir)
+        meta = {"content_type": content_type, "rels": rels.decode("utf-8") if rels is not None else None}
+        _write_atomic(f"{path}.json", json.dumps(meta).encode("utf-8"))
+
+
+def load_slide(key, cache_dir=SLIDE_CACHE_DIR):
+    """Return cached (slide XML, rels XML) for a slide hash, or None.
+
+    Parts the slide refers to, such as charts, are loaded into RELATED_PARTS.
+    """
+    xml_path, rels_path = _cache_paths(key, cache_dir)
+    try:
+        with open(xml_path, "rb") as f:
+            slide_xml = f.read()
+        with open(rels_path, "rb") as f:
+            rels_xml = f.read()
+    except FileNotFoundError:
+        return None
+    if not _load_related(rels_xml, "ppt/slides/slide1.xml", cache_dir):
+        return None
+    return slide_xml, rels_xml
+
+
+def store_slide(key, parts, cache_dir=SLIDE_CACHE_DIR):
+    """Save a slide's serialized parts, and the related parts they refer to, under its hash."""
+    os.makedirs(cache_dir, exist_ok=True)
+    _store_related(parts[1], "ppt/slides/slide1.xml", cache_dir)
+    for path, blob in zip(_cache_paths(key, cache_dir), parts):
+        _write_atomic(path, blob)
+
+
+def build_slides(steps, cache_dir=SLIDE_CACHE_DIR):
+    """Serialized (slide XML, rels XML) for each plan step, building only uncached slides.
+
+    Returns (parts in step order, slides rebuilt).
+    """
+    keys = [slide_hash(step) for step in steps]
+    parts = {}
+    missing = []
+    for key, step in zip(keys, steps):
+        if key in parts:
+            continue
+        cached = load_slide(key, cache_dir)
+        if cached is None:
+            missing.append((key, step))
+            parts[key] = None
+        else:
+            parts[key] = cached
+
+    if missing:
+        # Changed slides are built together in one scratch deck; their images are resized up front
+        deck_images.prefetch([step for _, step in missing])
+        scratch = deck_spec.new_presentation()
+        for key, step in missing:
+            parts[key] = slide_parts(deck_spec.build_slide(scratch, step))
+            store_slide(key, parts[key], cache_dir)
+
+    return [parts[key] for key in keys], len(missing)
+
+
+def build_incremental(plan, output_file, cache_dir=SLIDE_CACHE_DIR):
+    """Build a deck from a plan, regenerating only uncached slides.
+
+    output_file may be a path or a writable binary file object. Returns
+    (slides rebuilt, total slides).
+    """
+    parts, rebuilt = build_slides(plan["slides"], cache_dir)
+    write_package(output_file, base_parts(), parts)
+    return rebuilt, len(parts)
+
+
+def main():
+    """Incrementally build one or more deck specs."""
+    parser = argparse.ArgumentParser(description="Incrementally build decks from JSON/YAML specs.")
+    parser.add_argument("specs", nargs="+", help="deck spec files (.json, .yaml, .yml)")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.specs:
+        start = time.perf_counter()
+        try:
+            plan = deck_spec.compile_spec(path)
+        except (OSError, deck_spec.SpecError) as exc:
+            print(f"✗ {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        output_file = plan["output"]
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+            output_file = os.path.join(args.output_dir, os.path.basename(output_file))
+        rebuilt, total = build_incremental(plan, output_file)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"✓ {path} → {output_file} (rebuilt {rebuilt}/{total} slides, {elapsed:.0f} ms)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Full-text index over decks: which deck, slide and shape says what.
+
+    python deck_index.py --update                          # index the decks in this repo
+    python deck_index.py --update ~/decks archive/*.pptx   # ... or any others (directories are searched)
+    python deck_index.py "60% of production time wasted"
+    python deck_index.py --words production wasted --json
+
+Indexing stream-parses each slide with iterparse and clears every shape as
+soon as its text is read, so memory stays flat however large a slide is.
+Text is split into case-folded word tokens. Punctuation is dropped, so
+"60%" is the token "60". A query matches shapes that contain its words
+consecutively (or, with --words, anywhere in the shape).
+
+The index lives in .deck_cache/index/ (--index-dir to move it). It is a set
+of immutable segment files plus a manifest of indexed decks. Each segment
+holds a sorted term table, postings of (shape, word position) per term, and
+a shape table with each shape's deck, slide, name and text. Queries read
+segments through mmap, binary-search the term table, and decode only the
+postings of the query's terms. So a query costs about the same whatever the
+corpus size, apart from how often its words occur.
+
+--update re-reads only decks whose size or mtime changed, and writes their
+shapes into one new segment. Postings of decks that changed or disappeared
+are skipped, using the manifest, until the segments are compacted. That
+happens automatically when there are more than MAX_SEGMENTS of them, and
+needs no deck to be re-read, because segments keep the shape text.
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from deck_diff import NS, Deck
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_DIR = os.path.join(REPO_DIR, ".deck_cache", "index")
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+MAX_SEGMENTS = 8
+
+# Segment layout (little-endian): header, term table, postings, shape table, strings
+MAGIC = b"DECKIDX1"
+HEADER = struct.Struct("<8sIIQQQQ")  # magic, terms, shapes, offsets of term table, postings, shape table, strings
+TERM = struct.Struct("<QIQI")  # term offset and length in strings, first posting, postings
+SHAPE = struct.Struct("<IIQIQI")  # deck id, slide number, name offset and length, text offset and length
+
+_WORD = re.compile(r"\w+")
+_SHAPE_TAGS = tuple(f"{{{NS['p']}}}{tag}" for tag in ("sp", "graphicFrame"))
+_A_P = f"{{{NS['a']}}}p"
+_A_T = f"{{{NS['a']}}}t"
+
+
+def tokenize(text):
+    """Case-folded word tokens of text."""
+    return _WORD.findall(text.casefold())
+
+
+# --- Extraction --------------------------------------------------------------------
+
+def deck_shapes(path):
+    """[(slide number, shape name, text)] for every shape with text, in slide order."""
+    deck = Deck(path)
+    try:
+        shapes = []
+        for number, slide in enumerate(deck.slides, 1):
+            with deck.zip.open(slide) as stream:
+                for _, element in etree.iterparse(stream, events=("end",), tag=_SHAPE_TAGS):
+                    text = "\n".join("".join(t.text or "" for t in p.iter(_A_T)) for p in element.iter(_A_P))
+                    if text.strip():
+                        c_nv_pr = element.find("./*/p:cNvPr", NS)
+                        shapes.append((number, c_nv_pr.get("name", "") if c_nv_pr is not None else "", text))
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+        return shapes
+    finally:
+        deck.close()
+
+
+def _extract(path):
+    try:
+        return path, deck_shapes(path), None
+    except Exception as exc:  # a broken deck is reported, not fatal
+        return path, None, f"{type(exc).__name__}: {exc}"
+
+
+def find_decks(paths):
+    """Absolute paths of the .pptx files named by paths, directories and glob patterns."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            matches = glob.glob(os.path.join(path, "**", "*.pptx"), recursive=True)
+        elif glob.has_magic(path):
+            matches = glob.glob(path, recursive=True)
+        else:
+            matches = [path]
+        found.extend(os.path.abspath(match) for match in matches
+                     if match.lower().endswith(".pptx") and not os.path.basename(match).startswith("~$"))
+    return sorted(set(found))
+
+
+# --- Segments ------------------------------------------------------------------------
+
+def _little_endian(values):
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_segment(path, shapes):
+    """Write a segment for [(deck id, slide number, shape name, text)]."""
+    postings = defaultdict(lambda: array("I"))
+    for index, (_, _, _, text) in enumerate(shapes):
+        for position, term in enumerate(tokenize(text)):
+            postings[term.encode("utf-8")].extend((index, position))
+
+    strings = bytearray()
+    term_table = bytearray()
+    postings_blob = array("I")
+    for term in sorted(postings):
+        term_table += TERM.pack(len(strings), len(term), len(postings_blob) // 2, len(postings[term]) // 2)
+        strings += term
+        postings_blob.extend(postings[term])
+    shape_table = bytearray()
+    for deck_id, slide, name, text in shapes:
+        name, text = name.encode("utf-8"), text.encode("utf-8")
+        shape_table += SHAPE.pack(deck_id, slide, len(strings), len(name), len(strings) + len(name), len(text))
+        strings += name + text
+
+    postings_blob = _little_endian(postings_blob).tobytes()
+    terms_at = HEADER.size
+    postings_at = terms_at + len(term_table)
+    shapes_at = postings_at + len(postings_blob)
+    strings_at = shapes_at + len(shape_table)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(postings), len(shapes), terms_at, postings_at, shapes_at, strings_at))
+        for section in (term_table, postings_blob, shape_table, strings):
+            f.write(section)
+    os.replace(tmp_path, path)
+
+
+class Segment:
+    """Read-only, memory-mapped view of one segment file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.term_count, self.shape_count, self.terms_at, self.postings_at, self.shapes_at,
+         self.strings_at) = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a deck index segment")
+
+    def _string(self, offset, length):
+        start = self.strings_at + offset
+        return self.map[start:start + length]
+
+    def postings(self, term):
+        """(shape indexes, word positions) arrays for a term, sorted by shape; empty if absent."""
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, first, count = TERM.unpack_from(self.map, self.terms_at + middle * TERM.size)
+            found = self._string(offset, length)
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                start = self.postings_at + first * 8
+                pairs = _little_endian(array("I", self.map[start:start + count * 8]))
+                return pairs[0::2], pairs[1::2]
+        return array("I"), array("I")
+
+    def shape(self, index):
+        """(deck id, slide number, shape name, text) of a shape."""
+        deck_id, slide, name_at, name_length, text_at, text_length = SHAPE.unpack_from(
+            self.map, self.shapes_at + index * SHAPE.size)
+        return (deck_id, slide, self._string(name_at, name_length).decode("utf-8"),
+                self._string(text_at, text_length).decode("utf-8"))
+
+    def shapes(self):
+        return (self.shape(index) for index in range(self.shape_count))
+
+    def close(self):
+        self.map.close()
+
+
+_open_segments = {}
+
+
+def open_segment(path):
+    """A Segment, kept open across queries; segment files are never rewritten in place."""
+    if path not in _open_segments:
+        _open_segments[path] = Segment(path)
+    return _open_segments[path]
+
+
+# --- Manifest and updates -------------------------------------------------------------
+
+def load_manifest(index_dir=INDEX_DIR):
+    try:
+        with open(os.path.join(index_dir, MANIFEST), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == FORMAT_VERSION:
+            return manifest
+    except FileNotFoundError:
+        pass
+    return {"version": FORMAT_VERSION, "next_id": 1, "next_segment": 1, "segments": [], "decks": {}}
+
+
+def _save_manifest(manifest, index_dir):
+    path = os.path.join(index_dir, MANIFEST)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _new_segment(manifest, index_dir, shapes):
+    name = f"segment-{manifest['next_segment']:06d}.idx"
+    manifest["next_segment"] += 1
+    write_segment(os.path.join(index_dir, name), shapes)
+    manifest["segments"].append(name)
+
+
+def _live_ids(manifest):
+    return {entry["id"]: path for path, entry in manifest["decks"].items()}
+
+
+_read_manifests = {}
+
+
+def _current_index(index_dir):
+    """(manifest, {deck id: path}) for queries, re-read only when the manifest changes."""
+    path = os.path.join(index_dir, MANIFEST)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return load_manifest(index_dir), {}
+    cached = _read_manifests.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        manifest = load_manifest(index_dir)
+        cached = _read_manifests[path] = (mtime_ns, manifest, _live_ids(manifest))
+    return cached[1], cached[2]
+
+
+def compact(manifest, index_dir=INDEX_DIR):
+    """Merge every segment into one, dropping shapes of decks no longer indexed."""
+    live = _live_ids(manifest)
+    old = manifest["segments"]
+    shapes = [shape for name in old for shape in open_segment(os.path.join(index_dir, name)).shapes()
+              if shape[0] in live]
+    manifest["segments"] = []
+    if shapes:
+        _new_segment(manifest, index_dir, shapes)
+    _save_manifest(manifest, index_dir)
+    for name in old:
+        path = os.path.join(index_dir, name)
+        segment = _open_segments.pop(path, None)
+        if segment is not None:
+            segment.close()
+        os.remove(path)
+
+
+def update(paths, index_dir=INDEX_DIR, jobs=None):
+    """Index new and changed decks among paths and forget deleted ones.
+
+    Returns (decks indexed, decks unchanged, decks removed, {path: error}).
+    """
+    os.makedirs(index_dir, exist_ok=True)
+    manifest = load_manifest(index_dir)
+    decks = manifest["decks"]
+    stats = {path: os.stat(path) for path in find_decks(paths) if os.path.isfile(path)}
+    changed = [path for path, stat in stats.items()
+               if path not in decks or (decks[path]["mtime_ns"], decks[path]["size"]) != (stat.st_mtime_ns,
+                                                                                           stat.st_size)]
+    removed = [path for path in decks if path not in stats and not os.path.exists(path)]
+    for path in removed:
+        del decks[path]
+
+    jobs = min(jobs or os.cpu_count() or 1, len(changed))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            extracted = list(pool.map(_extract, changed, chunksize=max(1, len(changed) // (jobs * 4))))
+    else:
+        extracted = [_extract(path) for path in changed]
+
+    shapes = []
+    errors = {}
+    for path, deck_shapes_, error in extracted:
+        if error is not None:
+            errors[path] = error
+            decks.pop(path, None)
+            continue
+        deck_id = manifest["next_id"]
+        manifest["next_id"] += 1
+        decks[path] = {"id": deck_id, "mtime_ns": stats[path].st_mtime_ns, "size": stats[path].st_size,
+                       "slides": max((slide for slide, _, _ in deck_shapes_), default=0)}
+        shapes.extend((deck_id, slide, name, text) for slide, name, text in deck_shapes_)
+    if shapes:
+        _new_segment(manifest, index_dir, shapes)
+    _save_manifest(manifest, index_dir)
+    if len(manifest["segments"]) > MAX_SEGMENTS:
+        compact(manifest, index_dir)
+    return len(changed) - len(errors), len(stats) - len(changed), len(removed), errors
+
+
+# --- Queries -----------------------------------------------------------------------------
+
+def _contains(shape_ids, shape):
+    i = bisect.bisect_left(shape_ids, shape)
+    return i < len(shape_ids) and shape_ids[i] == shape
+
+
+def _positions(shape_ids, positions, shape):
+    start = bisect.bisect_left(shape_ids, shape)
+    return positions[start:bisect.bisect_right(shape_ids, shape, start)]
+
+
+def search(query, index_dir=INDEX_DIR, phrase=True):
+    """Shapes whose text contains the query's words (consecutively when phrase is true).
+
+    Returns [{"deck", "slide", "shape", "text", "position"}] in deck and slide order.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    manifest, live = _current_index(index_dir)
+    hits = []
+    for name in manifest["segments"]:
+        segment = open_segment(os.path.join(index_dir, name))
+        postings = {term: segment.postings(term) for term in set(terms)}
+        if any(not shape_ids for shape_ids, _ in postings.values()):
+            continue
+        # Start from the rarest term; check the others by binary search
+        rarest, *others = sorted(postings, key=lambda term: len(postings[term][0]))
+        candidates = sorted(set(postings[rarest][0]))
+        for term in others:
+            shape_ids = postings[term][0]
+            candidates = [shape for shape in candidates if _contains(shape_ids, shape)]
+        for shape in candidates:
+            deck_id, slide, shape_name, text = segment.shape(shape)
+            if deck_id not in live:
+                continue
+            if phrase:
+                sets = [set(_positions(*postings[term], shape)) for term in terms]
+                starts = [p for p in sorted(sets[0]) if all(p + i in sets[i] for i in range(1, len(terms)))]
+            else:
+                starts = [min(_positions(*postings[terms[0]], shape))]
+            if starts:
+                hits.append({"deck": live[deck_id], "slide": slide, "shape": shape_name, "text": text,
+                             "position": starts[0]})
+    hits.sort(key=lambda hit: (hit["deck"], hit["slide"]))
+    return hits
+
+
+def snippet(text, position, width=100):
+    """The line of text holding the word at position, shortened to about width characters."""
+    count = 0
+    for line in text.splitlines():
+        words = len(tokenize(line))
+        if position < count + words:
+            line = line.strip()
+            return line if len(line) <= width else line[:width - 1] + "…"
+        count += words
+    return ""
+
+
+def main():
+    """Update the deck index or search it."""
+    parser = argparse.ArgumentParser(description="Full-text index and search over decks.")
+    parser.add_argument("query", nargs="*", help="words to search for (a phrase unless --words)")
+    parser.add_argument("--update", nargs="*", metavar="PATH",
+                        help="index new and changed decks under these files, directories or globs "
+                             "(default: the decks in this repo)")
+    parser.add_argument("--words", action="store_true", help="match the words anywhere in a shape, in any order")
+    parser.add_argument("--compact", action="store_true", help="merge the index into one segment")
+    parser.add_argument("--index-dir", default=INDEX_DIR, help="index directory")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes for indexing")
+    parser.add_argument("--json", action="store_true", help="print matches as JSON")
+    args = parser.parse_args()
+
+    if args.update is None and not args.query and not args.compact:
+        parser.error("give a query, --update or --compact")
+    status = 0
+    if args.update is not None:
+        start = time.perf_counter()
+        indexed, unchanged, removed, errors = update(args.update or [os.path.join(REPO_DIR, "*.pptx")],
+                                                     args.index_dir, args.jobs)
+        for path, error in errors.items():
+            print(f"✗ {path}: {error}", file=sys.stderr)
+        print(f"✓ indexed {indexed} deck(s), {unchanged} unchanged, {removed} removed "
+              f"({time.perf_counter() - start:.2f}s)", file=sys.stderr)
+        status = 1 if errors else 0
+    if args.compact:
+        compact(load_manifest(args.index_dir), args.index_dir)
+    if not args.query:
+        return status
+
+    start = time.perf_counter()
+    hits = search(" ".join(args.query), args.index_dir, phrase=not args.words)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        json.dump(hits, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for hit in hits:
+            deck = os.path.relpath(hit["deck"]) if hit["deck"].startswith(os.getcwd() + os.sep) else hit["deck"]
+            print(f"{deck}  slide {hit['slide']}  {hit['shape']}")
+            print(f"    {snippet(hit['text'], hit['position'])}")
+        decks = len({hit["deck"] for hit in hits})
+        print(f"{len(hits)} match(es) in {decks} deck(s) ({elapsed * 1000:.1f} ms)", file=sys.stderr)
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,604 @@
+#!/usr/bin/env python3
+"""
+Compact slide IR with PPTX, HTML and Markdown backends.
+
+A deck is built once and lowered into a small intermediate representation:
+Deck -> Slide -> Shape (geometry, fill, outline) -> TextFrame -> Paragraph ->
+Run. All classes use __slots__. Each backend serializes the same IR, so the
+PPTX, the static HTML version of the deck and its Markdown outline stay in
+step without separate hand-maintained copies.
+
+The slide helpers are not changed: the IR is lowered from the slide XML they
+already produce through the incremental slide cache. Each lowered slide keeps
+those parts and a fingerprint of its IR. The PPTX backend writes the cached
+parts of slides whose IR is unchanged, so an unedited deck is byte-identical
+to deck_spec.py and deck_variants.py, and generates every edited or new slide
+from its IR nodes. Saved decks (.pptx) can be lowered too, for HTML and
+Markdown only: their pictures and charts have no IR to generate them from.
+
+    python deck_ir.py specs/characterlock_honest.json -o site/
+    python deck_ir.py specs/characterlock.json --variant honest-dark --formats html md
+    python deck_ir.py CharacterLock_Dark_Theme.pptx --formats html
+"""
+
+import argparse
+import html
+import os
+import posixpath
+import sys
+import time
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Pt
+
+import deck_incremental
+import deck_spec
+from deck_package import PRESENTATION_PART, rels_partname
+from deck_stream import StreamingDeck
+from deck_thumbnails import (DEFAULT_BODY_PR, DEFAULT_SHAPE_FILL, DEFAULT_SIZES, NS, inherited_shapes,
+                             read_slides, shape_geometry)
+from deck_variants import variant_parts
+
+EMU_PER_POINT = 12700
+EMU_PER_PIXEL = 9525  # 96 dpi
+LINE_SPACING = 1.2
+# Text at or below this size is a footnote in the Markdown outline
+FOOTNOTE_SIZE = 10
+# Blank layout of the default template, for slides generated from the IR
+BLANK_LAYOUT = 6
+
+
+# --- IR --------------------------------------------------------------------
+
+class Run:
+    """A span of text with uniform formatting. Sizes are in points, colours (r, g, b)."""
+
+    __slots__ = ("text", "size", "bold", "italic", "color")
+
+    def __init__(self, text, size, bold=False, italic=False, color=None):
+        self.text = text
+        self.size = size
+        self.bold = bold
+        self.italic = italic
+        self.color = color
+
+
+class Paragraph:
+    __slots__ = ("runs", "align", "space_after")
+
+    def __init__(self, runs, align="l", space_after=0.0):
+        self.runs = runs
+        self.align = align
+        self.space_after = space_after
+
+    @property
+    def text(self):
+        return "".join(run.text for run in self.runs)
+
+
+class TextFrame:
+    """Paragraphs plus the frame's anchor ("t", "ctr", "b"), wrapping and insets in EMU."""
+
+    __slots__ = ("paragraphs", "anchor", "wrap", "insets")
+
+    def __init__(self, paragraphs, anchor="t", wrap=True, insets=(91440, 45720, 91440, 45720)):
+        self.paragraphs = paragraphs
+        self.anchor = anchor
+        self.wrap = wrap
+        self.insets = insets
+
+    @property
+    def text(self):
+        return "\n".join(p.text for p in self.paragraphs)
+
+
+class Geometry:
+    """Position and size in EMU."""
+
+    __slots__ = ("x", "y", "cx", "cy")
+
+    def __init__(self, x, y, cx, cy):
+        self.x, self.y, self.cx, self.cy = x, y, cx, cy
+
+
+class Shape:
+    """One positioned shape. kind is the preset geometry ("rect", "roundRect", "ellipse", ...),
+    "picture" or "other"; role is the placeholder type for placeholders."""
+
+    __slots__ = ("name", "kind", "geometry", "fill", "line", "line_width", "dashed", "text", "role")
+
+    def __init__(self, name, kind, geometry, fill=None, line=None, line_width=0, dashed=False, text=None,
+                 role=None):
+        self.name = name
+        self.kind = kind
+        self.geometry = geometry
+        self.fill = fill
+        self.line = line
+        self.line_width = line_width
+        self.dashed = dashed
+        self.text = text
+        self.role = role
+
+
+class Slide:
+    """Shapes and background. source is the (slide XML, rels XML, fingerprint) the slide
+    was lowered from, when it came from a plan; it is not part of the IR."""
+
+    __slots__ = ("shapes", "background", "source")
+
+    def __init__(self, shapes, background=None, source=None):
+        self.shapes = shapes
+        self.background = background
+        self.source = source
+
+    @property
+    def title(self):
+        """Text of the title placeholder, else of the first shape with text."""
+        texts = [shape for shape in self.shapes if shape.text is not None and shape.text.text.strip()]
+        titled = next((s for s in texts if s.role in ("title", "ctrTitle")), texts[0] if texts else None)
+        return titled.text.text.strip().replace("\n", " ") if titled else ""
+
+
+class Deck:
+    """Slides plus slide size in EMU."""
+
+    __slots__ = ("width", "height", "slides")
+
+    def __init__(self, width, height, slides):
+        self.width = width
+        self.height = height
+        self.slides = slides
+
+
+def fingerprint(node):
+    """Hashable value of an IR node and everything under it, excluding Slide.source."""
+    if isinstance(node, (list, tuple)):
+        return tuple(fingerprint(item) for item in node)
+    slots = getattr(type(node), "__slots__", None)
+    if slots is None:
+        return node
+    return (type(node).__name__,) + tuple(fingerprint(getattr(node, name)) for name in slots if name != "source")
+
+
+# --- Lowering slide XML to IR ----------------------------------------------
+
+def _color(parent):
+    if parent is None:
+        return None
+    color = parent.find("a:solidFill/a:srgbClr", NS)
+    if color is None:
+        return None
+    val = color.get("val")
+    return tuple(int(val[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _run_props(props, default_size):
+    """(size, bold, italic, colour) from run properties, most specific first."""
+    size = next((int(e.get("sz")) / 100 for e in props if e.get("sz")), default_size)
+    bold = next((e.get("b") == "1" for e in props if e.get("b")), False)
+    italic = next((e.get("i") == "1" for e in props if e.get("i")), False)
+    color = next((c for c in map(_color, props) if c), None)
+    return size, bold, italic, color
+
+
+def lower_text(sp, layout=None, master=None, sources=None):
+    """TextFrame for a shape's txBody, or None. sources is inherited_shapes(sp, layout, master)."""
+    tx_body = sp.find("p:txBody", NS)
+    if tx_body is None:
+        return None
+    ph = sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    default_size = DEFAULT_SIZES.get(ph.get("type", "body"), 18) if ph is not None else 18
+    anchor = "t"
+    if sources is None:
+        sources = inherited_shapes(sp, layout, master)
+    for source in reversed(sources):
+        body_pr = source.find("p:txBody/a:bodyPr", NS)
+        if body_pr is not None:
+            anchor = body_pr.get("anchor", anchor)
+    body_pr = tx_body.find("a:bodyPr", NS)
+    insets = DEFAULT_BODY_PR
+    wrap = True
+    if body_pr is not None:
+        insets = {key: int(body_pr.get(key, value)) for key, value in DEFAULT_BODY_PR.items()}
+        wrap = body_pr.get("wrap", "square") != "none"
+
+    paragraphs = []
+    for p in tx_body.iterfind("a:p", NS):
+        p_pr = p.find("a:pPr", NS)
+        def_rpr = p_pr.find("a:defRPr", NS) if p_pr is not None else None
+        runs = []
+        for child in p:
+            tag = etree.QName(child).localname
+            if tag == "r":
+                props = [e for e in (child.find("a:rPr", NS), def_rpr) if e is not None]
+                runs.append(Run(child.findtext("a:t", "", NS), *_run_props(props, default_size)))
+            elif tag == "br":
+                runs.append(Run("\n", *_run_props([def_rpr] if def_rpr is not None else [], default_size)))
+        if not runs:  # keep the height of an empty paragraph
+            runs.append(Run("", *_run_props([def_rpr] if def_rpr is not None else [], default_size)))
+        spc_aft = p_pr.find("a:spcAft/a:spcPts", NS) if p_pr is not None else None
+        paragraphs.append(Paragraph(runs, p_pr.get("algn", "l") if p_pr is not None else "l",
+                                    int(spc_aft.get("val")) / 100 if spc_aft is not None else 0.0))
+    return TextFrame(paragraphs, anchor, wrap,
+                     (insets["lIns"], insets["tIns"], insets["rIns"], insets["bIns"]))
+
+
+def lower_shape(element, layout=None, master=None):
+    """Shape for one top-level spTree child, or None if it has no position."""
+    sources = inherited_shapes(element, layout, master)
+    geometry = shape_geometry(element, layout, master, sources)
+    if geometry is None:
+        return None
+    c_nv_pr = element.find("./*/p:cNvPr", NS)
+    name = c_nv_pr.get("name") if c_nv_pr is not None else ""
+    tag = etree.QName(element).localname
+    if tag != "sp":
+        return Shape(name, "picture" if tag == "pic" else "other", Geometry(*geometry))
+
+    sp_pr = element.find("p:spPr", NS)
+    prst = sp_pr.find("a:prstGeom", NS) if sp_pr is not None else None
+    styled = element.find("p:style", NS) is not None
+    fill = _color(sp_pr)
+    if fill is None and styled and sp_pr is not None and sp_pr.find("a:noFill", NS) is None:
+        fill = DEFAULT_SHAPE_FILL
+    ln = sp_pr.find("a:ln", NS) if sp_pr is not None else None
+    line, line_width, dashed = None, 0, False
+    if ln is not None and ln.find("a:noFill", NS) is None:
+        line = _color(ln) or ((56, 93, 138) if styled else None)
+        line_width = int(ln.get("w", EMU_PER_POINT))
+        dash = ln.find("a:prstDash", NS)
+        dashed = dash is not None and dash.get("val") != "solid"
+    elif ln is None and styled:
+        line, line_width = (56, 93, 138), EMU_PER_POINT
+    ph = element.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    return Shape(name, prst.get("prst") if prst is not None else "rect", Geometry(*geometry), fill, line,
+                 line_width, dashed, lower_text(element, layout, master, sources),
+                 ph.get("type", "body") if ph is not None else None)
+
+
+def lower_slide(slide, layout=None, master=None):
+    """Slide IR from a parsed slide element and its layout and master elements."""
+    shapes = [lower_shape(element, layout, master) for element in slide.find("p:cSld/p:spTree", NS)
+              if etree.QName(element).localname in ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")]
+    return Slide([shape for shape in shapes if shape is not None],
+                 _color(slide.find("p:cSld/p:bg/p:bgPr", NS)))
+
+
+def _related_part(rels_xml, kind, source_part="ppt/slides/slide1.xml"):
+    rels = etree.fromstring(rels_xml)
+    for rel in rels.iterfind("pr:Relationship", NS):
+        if rel.get("Type").endswith(f"/{kind}"):
+            return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), rel.get("Target")))
+    return None
+
+
+def slide_context(rels_xml, base_parts, parsed):
+    """(layout, master) elements from the base package for a serialized slide's rels.
+
+    parsed caches parsed parts across slides.
+    """
+    layout_part = _related_part(rels_xml, "slideLayout")
+    master_part = None
+    if layout_part in base_parts:
+        master_part = _related_part(base_parts[rels_partname(layout_part)], "slideMaster", layout_part)
+    for partname in (layout_part, master_part):
+        if partname not in parsed:
+            parsed[partname] = etree.fromstring(base_parts[partname]) if partname in base_parts else None
+    return parsed[layout_part], parsed[master_part]
+
+
+def lower_parts(parts, base_parts=None):
+    """Deck IR from serialized (slide XML, rels XML) pairs on the base package."""
+    base_parts = base_parts if base_parts is not None else deck_incremental.base_parts()
+    size = etree.fromstring(base_parts[PRESENTATION_PART]).find("p:sldSz", NS)
+    parsed = {}
+    slides = []
+    for slide_xml, rels_xml in parts:
+        slide = lower_slide(etree.fromstring(slide_xml), *slide_context(rels_xml, base_parts, parsed))
+        slide.source = (slide_xml, rels_xml, fingerprint(slide))
+        slides.append(slide)
+    return Deck(int(size.get("cx")), int(size.get("cy")), slides)
+
+
+def build_ir(plan, variant_name=None):
+    """Build a plan (or one variant) once, through the slide cache, and lower it to IR."""
+    return lower_parts(variant_parts(plan, variant_name))
+
+
+def lower_file(path):
+    """Deck IR from a saved .pptx (HTML and Markdown backends only)."""
+    slide_size, slides = read_slides(path)
+    parsed = {b"": None}
+    ir = []
+    for slide_xml, layout_xml, master_xml in slides:
+        for blob in (layout_xml, master_xml):
+            if blob not in parsed:
+                parsed[blob] = etree.fromstring(blob)
+        ir.append(lower_slide(etree.fromstring(slide_xml), parsed[layout_xml], parsed[master_xml]))
+    return Deck(*slide_size, ir)
+
+
+# --- Backends --------------------------------------------------------------
+
+def _rgb(color):
+    return RGBColor(*color)
+
+
+def _pptx_text(frame, text):
+    frame.word_wrap = text.wrap
+    frame.vertical_anchor = MSO_ANCHOR.from_xml(text.anchor)
+    frame.margin_left, frame.margin_top, frame.margin_right, frame.margin_bottom = text.insets
+    for index, paragraph in enumerate(text.paragraphs):
+        p = frame.paragraphs[0] if index == 0 else frame.add_paragraph()
+        p.alignment = PP_ALIGN.from_xml(paragraph.align)
+        if paragraph.space_after:
+            p.space_after = Pt(paragraph.space_after)
+        for run in paragraph.runs:
+            if run.text == "\n":
+                p.add_line_break()
+                continue
+            r = p.add_run()
+            r.text = run.text
+            font = r.font
+            font.size = Pt(run.size)
+            font.bold = run.bold
+            font.italic = run.italic
+            if run.color:
+                font.color.rgb = _rgb(run.color)
+
+
+def _pptx_shape(shapes, shape):
+    if shape.kind in ("picture", "other"):
+        raise ValueError(f"shape {shape.name!r}: a {shape.kind} shape cannot be generated from the IR")
+    g = shape.geometry
+    if shape.kind == "rect" and shape.fill is None and shape.line is None:
+        sp = shapes.add_textbox(g.x, g.y, g.cx, g.cy)
+    else:
+        try:
+            auto_shape = MSO_AUTO_SHAPE_TYPE.from_xml(shape.kind)
+        except ValueError:
+            raise ValueError(f"shape {shape.name!r}: unknown geometry {shape.kind!r}") from None
+        sp = shapes.add_shape(auto_shape, g.x, g.y, g.cx, g.cy)
+        # The theme style would add a fill, outline and text colour the IR does not have
+        sp._element.remove(sp._element.find(qn("p:style")))
+        if shape.fill:
+            sp.fill.solid()
+            sp.fill.fore_color.rgb = _rgb(shape.fill)
+        else:
+            sp.fill.background()
+        if shape.line:
+            sp.line.color.rgb = _rgb(shape.line)
+            sp.line.width = shape.line_width
+            if shape.dashed:
+                sp.line.dash_style = MSO_LINE_DASH_STYLE.DASH
+        else:
+            sp.line.fill.background()
+    sp.name = shape.name
+    if shape.text is not None:
+        _pptx_text(sp.text_frame, shape.text)
+
+
+def _pptx_slide(prs, slide):
+    """Build one IR slide on a blank layout of prs and return the python-pptx slide."""
+    pptx_slide = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT])
+    if slide.background:
+        fill = pptx_slide.background.fill
+        fill.solid()
+        fill.fore_color.rgb = _rgb(slide.background)
+    for shape in slide.shapes:
+        _pptx_shape(pptx_slide.shapes, shape)
+    return pptx_slide
+
+
+def write_pptx(deck, path):
+    """Write slides whose IR is unchanged from their cached parts and generate the others."""
+    size = etree.fromstring(deck_incremental.base_parts()[PRESENTATION_PART]).find("p:sldSz", NS)
+    if (deck.width, deck.height) != (int(size.get("cx")), int(size.get("cy"))):
+        raise ValueError("the PPTX backend writes only the base package's slide size")
+    with StreamingDeck(path) as stream:
+        for number, slide in enumerate(deck.slides, 1):
+            if slide.source is not None and slide.source[2] == fingerprint(slide):
+                stream.add_parts(*slide.source[:2])
+                continue
+            try:
+                stream.add(_pptx_slide, slide)
+            except ValueError as exc:
+                raise ValueError(f"slide {number}: {exc}") from None
+
+
+def _css_color(rgb):
+    return "#%02x%02x%02x" % tuple(rgb)
+
+
+_ALIGN_CSS = {"l": "left", "ctr": "center", "r": "right", "just": "justify"}
+_ANCHOR_CSS = {"t": "flex-start", "ctr": "center", "b": "flex-end"}
+
+
+def _px(emu):
+    return f"{emu / EMU_PER_PIXEL:.1f}px"
+
+
+def _html_text(frame):
+    parts = []
+    for p in frame.paragraphs:
+        spans = []
+        for run in p.runs:
+            if run.text == "\n":
+                spans.append("<br>")
+                continue
+            style = f"font-size:{run.size:g}pt"
+            if run.bold:
+                style += ";font-weight:bold"
+            if run.italic:
+                style += ";font-style:italic"
+            if run.color:
+                style += f";color:{_css_color(run.color)}"
+            spans.append(f'<span style="{style}">{html.escape(run.text) or "&#8203;"}</span>')
+        margin = f";margin-bottom:{p.space_after:g}pt" if p.space_after else ""
+        parts.append(f'<p style="text-align:{_ALIGN_CSS.get(p.align, "left")}{margin}">{"".join(spans)}</p>')
+    return "".join(parts)
+
+
+def _html_shape(shape):
+    g = shape.geometry
+    style = [f"left:{_px(g.x)}", f"top:{_px(g.y)}", f"width:{_px(g.cx)}", f"height:{_px(g.cy)}"]
+    if shape.fill:
+        style.append(f"background:{_css_color(shape.fill)}")
+    if shape.line:
+        style.append(f"border:{max(1, round(shape.line_width / EMU_PER_PIXEL))}px "
+                     f"{'dashed' if shape.dashed else 'solid'} {_css_color(shape.line)}")
+    if shape.kind == "ellipse":
+        style.append("border-radius:50%")
+    elif shape.kind == "roundRect":
+        style.append(f"border-radius:{_px(min(g.cx, g.cy) * 0.1667)}")
+    body = ""
+    if shape.text is not None:
+        left, top, right, bottom = shape.text.insets
+        style.append(f"padding:{_px(top)} {_px(right)} {_px(bottom)} {_px(left)}")
+        style.append(f"justify-content:{_ANCHOR_CSS.get(shape.text.anchor, 'flex-start')}")
+        if not shape.text.wrap:
+            style.append("white-space:nowrap")
+        body = _html_text(shape.text)
+    return f'<div class="shape {shape.kind}" style="{";".join(style)}">{body}</div>'
+
+
+HTML_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ margin: 0; padding: 24px; background: #2b2b2b; font-family: Calibri, Carlito, "DejaVu Sans", sans-serif; }}
+.slide {{ position: relative; overflow: hidden; margin: 0 auto 24px; width: {width}; height: {height};
+          background: #ffffff; color: #000000; box-shadow: 0 2px 12px rgba(0, 0, 0, 0.5); }}
+.shape {{ position: absolute; box-sizing: border-box; display: flex; flex-direction: column; }}
+.shape p {{ margin: 0; line-height: {line_spacing}; white-space: pre-wrap; }}
+</style>
+</head>
+<body>
+{slides}
+</body>
+</html>
+"""
+
+
+def write_html(deck, path):
+    """One static page; each slide an absolutely positioned section at 96 dpi."""
+    sections = []
+    for number, slide in enumerate(deck.slides, 1):
+        background = f' style="background:{_css_color(slide.background)}"' if slide.background else ""
+        shapes = "\n".join(_html_shape(shape) for shape in slide.shapes)
+        sections.append(f'<section class="slide" id="slide-{number}"{background}>\n{shapes}\n</section>')
+    title = deck.slides[0].title if deck.slides else ""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HTML_PAGE.format(title=html.escape(title), width=_px(deck.width), height=_px(deck.height),
+                                 line_spacing=LINE_SPACING, slides="\n".join(sections)))
+
+
+def _markdown_line(paragraph):
+    text = paragraph.text.replace("*", r"\*").replace("\n", "  \n").strip()
+    if not text:
+        return ""
+    if text.startswith("•"):
+        return f"- {text[1:].strip()}"
+    runs = [run for run in paragraph.runs if run.text.strip()]
+    if runs and all(run.size <= FOOTNOTE_SIZE for run in runs):
+        return f"*{text}*"
+    if runs and all(run.bold for run in runs):
+        return f"**{text}**"
+    return text
+
+
+def write_markdown(deck, path):
+    """Outline: one "##" section per slide, text shapes in reading order."""
+    lines = []
+    for number, slide in enumerate(deck.slides, 1):
+        title = slide.title
+        lines.append(f"## {number}. {title}" if title else f"## {number}.")
+        lines.append("")
+        skipped_title = False
+        for shape in sorted(slide.shapes, key=lambda s: (s.geometry.y, s.geometry.x)):
+            if shape.text is None:
+                continue
+            if not skipped_title and shape.text.text.strip().replace("\n", " ") == title:
+                skipped_title = True
+                continue
+            block = [_markdown_line(p) for p in shape.text.paragraphs]
+            while block and not block[-1]:
+                block.pop()
+            while block and not block[0]:
+                block.pop(0)
+            if block:
+                lines.extend(block)
+                lines.append("")
+        lines.append("---")
+        lines.append("")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+# Format -> (file extension, writer(deck, path))
+BACKENDS = {
+    "pptx": (".pptx", write_pptx),
+    "html": (".html", write_html),
+    "md": (".md", write_markdown),
+}
+
+
+def emit(deck, stem, formats=tuple(BACKENDS)):
+    """Serialize one IR with each backend; returns the files written."""
+    written = []
+    for name in formats:
+        extension, writer = BACKENDS[name]
+        writer(deck, stem + extension)
+        written.append(stem + extension)
+    return written
+
+
+def main():
+    """Build decks once and write them in several formats."""
+    parser = argparse.ArgumentParser(description="Emit PPTX, HTML and Markdown from one build.")
+    parser.add_argument("inputs", nargs="+", help="deck specs (.json, .yaml, .yml) or saved .pptx files")
+    parser.add_argument("--formats", nargs="+", choices=sorted(BACKENDS), default=list(BACKENDS),
+                        help="backends to run (default: all)")
+    parser.add_argument("--variant", help="build this variant of each spec")
+    parser.add_argument("-o", "--output-dir", default=None, help="directory for outputs (default: current)")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.inputs:
+        start = time.perf_counter()
+        formats = args.formats
+        try:
+            if path.endswith(".pptx"):
+                deck = lower_file(path)
+                stem = os.path.splitext(path)[0]
+                formats = [name for name in formats if name != "pptx"]
+            else:
+                plan = deck_spec.compile_spec(path)
+                if args.variant is not None and args.variant not in {v["name"] for v in plan["variants"]}:
+                    raise deck_spec.SpecError(f"{path}: no variant named {args.variant!r}")
+                deck = build_ir(plan, args.variant)
+                output = (plan["output"] if args.variant is None else
+                          next(v["output"] for v in plan["variants"] if v["name"] == args.variant))
+                stem = os.path.splitext(output)[0]
+        except (OSError, deck_spec.SpecError) as exc:
+            print(f"✗ {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+            stem = os.path.join(args.output_dir, os.path.basename(stem))
+        written = emit(deck, stem, formats)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"✓ {path} → {', '.join(written)} ({len(deck.slides)} slides, {elapsed:.0f} ms)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Layout checker for absolutely positioned slides.
+
+For each slide, every shape's rectangle goes into a uniform grid (spatial
+hash). Only shapes sharing a grid cell are compared, so a slide costs about
+O(n) rather than O(n^2) pairs. The checker reports:
+
+- collision    two text-bearing shapes overlap, or two shapes overlap
+               partially (a shape drawn fully inside another, such as a
+               label on a card, is layering and not reported);
+- overflow     the text needs more height than its frame, measured with
+               font_metrics at the paragraph's font size. Frames set to
+               shrink text on overflow are skipped; frames set to resize to
+               their text are grown to the measured height before the
+               collision and off-slide checks;
+- off-slide    a shape extends past the slide edges.
+
+Run it on saved decks, or call check_presentation(prs) at build time:
+
+    python deck_layout.py CharacterLock_Dark_Theme.pptx
+    python deck_layout.py *.pptx --json
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+from lxml import etree
+
+import font_metrics
+from deck_thumbnails import DEFAULT_BODY_PR, DEFAULT_SIZES, NS, inherited_shapes, read_slides, shape_geometry
+
+EMU_PER_INCH = 914400
+SHAPE_TAGS = ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")
+
+# Grid cell edge for the spatial hash, in EMU
+CELL_SIZE = EMU_PER_INCH
+
+# Overlaps smaller than this (in square inches) are rounding, not collisions
+MIN_OVERLAP_AREA = 0.01
+# Overflow smaller than this (in inches) is within measuring error
+MIN_OVERFLOW = 0.05
+
+
+class Box:
+    """One shape's rectangle and text, in EMU."""
+
+    __slots__ = ("name", "x0", "y0", "x1", "y1", "element")
+
+    def __init__(self, name, geometry, element):
+        x, y, cx, cy = geometry
+        self.name = name
+        self.x0, self.y0, self.x1, self.y1 = x, y, x + cx, y + cy
+        self.element = element
+
+    @property
+    def has_text(self):
+        return any(t.text and t.text.strip() for t in self.element.iter(f"{{{NS['a']}}}t"))
+
+    def contains(self, other):
+        return self.x0 <= other.x0 and self.y0 <= other.y0 and self.x1 >= other.x1 and self.y1 >= other.y1
+
+    def overlap_area(self, other):
+        width = min(self.x1, other.x1) - max(self.x0, other.x0)
+        height = min(self.y1, other.y1) - max(self.y0, other.y0)
+        return width * height if width > 0 and height > 0 else 0
+
+
+def _inches(emu):
+    return round(emu / EMU_PER_INCH, 2)
+
+
+def slide_boxes(slide, layout=None, master=None):
+    """Box for every top-level shape with a known position."""
+    boxes = []
+    tree = slide.find("p:cSld/p:spTree", NS)
+    for element in tree:
+        if etree.QName(element).localname not in SHAPE_TAGS:
+            continue
+        geometry = shape_geometry(element, layout, master)
+        if geometry is None:
+            continue
+        c_nv_pr = element.find("./*/p:cNvPr", NS)
+        boxes.append(Box(c_nv_pr.get("name") if c_nv_pr is not None else "?", geometry, element))
+    return boxes
+
+
+def candidate_pairs(boxes, cell=CELL_SIZE):
+    """Pairs of box indexes that share at least one grid cell."""
+    grid = defaultdict(list)
+    for index, box in enumerate(boxes):
+        for gx in range(int(box.x0 // cell), int(max(box.x0, box.x1 - 1) // cell) + 1):
+            for gy in range(int(box.y0 // cell), int(max(box.y0, box.y1 - 1) // cell) + 1):
+                grid[gx, gy].append(index)
+    pairs = set()
+    for members in grid.values():
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                pairs.add((a, b))
+    return sorted(pairs)
+
+
+def text_height(element, width_emu, scale=1.0, wrap=None):
+    """Height in EMU the shape's text needs when wrapped to width_emu, or None without text.
+
+    scale multiplies every font size (as a:normAutofit fontScale does); wrap
+    overrides the frame's own wrapping setting.
+    """
+    tx_body = element.find("p:txBody", NS)
+    if tx_body is None:
+        return None
+    body_pr = tx_body.find("a:bodyPr", NS)
+    insets = dict(DEFAULT_BODY_PR)
+    frame_wrap = True
+    if body_pr is not None:
+        frame_wrap = body_pr.get("wrap", "square") != "none"
+        insets = {key: int(body_pr.get(key, value)) for key, value in insets.items()}
+    ph = element.find("p:nvSpPr/p:nvPr/p:ph", NS)
+    default_size = DEFAULT_SIZES.get(ph.get("type", "body"), 18) if ph is not None else 18
+    wrap = frame_wrap if wrap is None else wrap
+    width_pt = (width_emu - insets["lIns"] - insets["rIns"]) / font_metrics.EMU_PER_POINT
+
+    height_pt = 0.0
+    has_text = False
+    for p in tx_body.iterfind("a:p", NS):
+        p_pr = p.find("a:pPr", NS)
+        props = [e for e in (p.find("a:r/a:rPr", NS), p_pr.find("a:defRPr", NS) if p_pr is not None else None)
+                 if e is not None]
+        size = next((int(e.get("sz")) / 100 for e in props if e.get("sz")), default_size) * scale
+        bold = next((e.get("b") == "1" for e in props if e.get("b")), False)
+        text = "".join("\n" if etree.QName(child).localname == "br" else (child.findtext("a:t", "", NS))
+                       for child in p if etree.QName(child).localname in ("r", "br"))
+        has_text = has_text or bool(text.strip())
+        metrics = font_metrics.get_metrics(bold=bold)
+        lines = metrics.line_count(text, width_pt if wrap else float("inf"), size)
+        height_pt += lines * size * font_metrics.LINE_SPACING
+        spc_aft = p_pr.find("a:spcAft/a:spcPts", NS) if p_pr is not None else None
+        if spc_aft is not None:
+            height_pt += int(spc_aft.get("val")) / 100
+    if not has_text:
+        return None
+    return height_pt * font_metrics.EMU_PER_POINT + insets["tIns"] + insets["bIns"]
+
+
+AUTOFIT_MODES = {"normAutofit": "shrink", "spAutoFit": "resize", "noAutofit": None}
+
+
+def autofit_mode(element, layout=None, master=None):
+    """"shrink", "resize" or None, following placeholder inheritance."""
+    for source in inherited_shapes(element, layout, master):
+        body_pr = source.find("p:txBody/a:bodyPr", NS)
+        if body_pr is None:
+            continue
+        for child in body_pr:
+            mode = etree.QName(child).localname
+            if mode in AUTOFIT_MODES:
+                return AUTOFIT_MODES[mode]
+    return None
+
+
+def check_slide(slide, slide_size, layout=None, master=None):
+    """Findings for one slide element, as dicts with kind, shapes and a message."""
+    boxes = slide_boxes(slide, layout, master)
+    findings = []
+    width, height = slide_size
+
+    for box in boxes:
+        needed = text_height(box.element, box.x1 - box.x0)
+        if needed is not None and needed - (box.y1 - box.y0) > MIN_OVERFLOW * EMU_PER_INCH:
+            mode = autofit_mode(box.element, layout, master)
+            if mode == "resize":
+                box.y1 = box.y0 + needed
+            elif mode is None:
+                findings.append({
+                    "kind": "overflow", "shapes": [box.name],
+                    "message": f"text needs {_inches(needed)} in, frame is {_inches(box.y1 - box.y0)} in tall",
+                })
+        if box.x0 < 0 or box.y0 < 0 or box.x1 > width or box.y1 > height:
+            findings.append({
+                "kind": "off-slide", "shapes": [box.name],
+                "message": f"spans ({_inches(box.x0)}, {_inches(box.y0)})-({_inches(box.x1)}, {_inches(box.y1)}) in "
+                           f"on a {_inches(width)}x{_inches(height)} in slide",
+            })
+
+    for a, b in candidate_pairs(boxes):
+        first, second = boxes[a], boxes[b]
+        area = first.overlap_area(second) / EMU_PER_INCH ** 2
+        if area < MIN_OVERLAP_AREA:
+            continue
+        both_text = first.has_text and second.has_text
+        layered = first.contains(second) or second.contains(first)
+        if both_text or not layered:
+            findings.append({
+                "kind": "collision", "shapes": [first.name, second.name],
+                "message": f"overlap {area:.2f} sq in" + (" (both contain text)" if both_text else ""),
+            })
+    return findings
+
+
+def check_presentation(prs):
+    """Findings for every slide of a python-pptx presentation, with 1-based slide numbers."""
+    slide_size = (prs.slide_width, prs.slide_height)
+    findings = []
+    for number, slide in enumerate(prs.slides, 1):
+        layout = slide.slide_layout
+        for finding in check_slide(slide._element, slide_size, layout._element, layout.slide_master._element):
+            findings.append({"slide": number, **finding})
+    return findings
+
+
+def check_file(path):
+    """Findings for every slide of a saved deck."""
+    slide_size, slides = read_slides(path)
+    findings = []
+    parsed = {b"": None}  # layouts and masters are shared by many slides
+    for number, (slide_xml, layout_xml, master_xml) in enumerate(slides, 1):
+        for blob in (layout_xml, master_xml):
+            if blob not in parsed:
+                parsed[blob] = etree.fromstring(blob)
+        layout, master = parsed[layout_xml], parsed[master_xml]
+        for finding in check_slide(etree.fromstring(slide_xml), slide_size, layout, master):
+            findings.append({"slide": number, **finding})
+    return findings
+
+
+def main():
+    """Check decks and exit non-zero if any layout problem is found."""
+    parser = argparse.ArgumentParser(description="Report overlapping, overflowing and off-slide shapes.")
+    parser.add_argument("decks", nargs="+", help=".pptx files")
+    parser.add_argument("--json", action="store_true", help="print findings as JSON")
+    parser.add_argument("--ignore", nargs="+", default=[], choices=("collision", "overflow", "off-slide"),
+                        help="finding kinds to skip")
+    args = parser.parse_args()
+
+    results = {}
+    for deck in args.decks:
+        results[deck] = [f for f in check_file(deck) if f["kind"] not in args.ignore]
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        for deck, findings in results.items():
+            print(f"{deck}: {len(findings)} finding(s)")
+            for f in findings:
+                print(f"  slide {f['slide']:>3}  {f['kind']:<10} {' / '.join(f['shapes'])}: {f['message']}")
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
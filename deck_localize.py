@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Localized deck builds from one deck spec, rendered in parallel.
+
+The spec is compiled once. Its user-visible strings (titles, items, columns,
+footnotes) are looked up in a translation memory per locale,
+locales/<locale>.json, which maps source strings to translations:
+
+    {"The Real Cost of Inconsistency": "Die wahren Kosten der Inkonsistenz",
+     "Video production: $3,000 - $15,000 per project*": null}
+
+Bullet markers ("• ") are kept out of the keys. A null or absent entry is a
+missing key: the source text is used and the key is reported, and
+--update-memory adds it to the file for translators. Memories are parsed once
+per process and kept in an LRU cache keyed by file and modification time.
+
+Each locale is built in its own worker through the incremental slide cache.
+Translations usually run longer than the source, so every text frame whose
+text no longer fits is shrunk: its font scale (a:normAutofit fontScale) is
+set to the largest 5% step at which font_metrics measures it to fit. The
+fixed dark_* slides have no spec fields and are not localized; neither are
+a chart slide's data binding (file, chart type, column names, number format)
+or a storyboard's frame files.
+
+The pseudo-locale qps-ploc needs no memory. It accents every letter and pads
+each string by 40%, which tests layouts against long translations.
+
+    python deck_localize.py specs/characterlock_honest.json --locales de fr qps-ploc -o build/
+    python deck_localize.py specs/characterlock.json --variant honest-dark --locales de
+    python deck_localize.py specs/characterlock_honest.json --locales de --update-memory
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+import deck_incremental
+import deck_layout
+import deck_spec
+from deck_ir import slide_context
+from deck_package import write_package
+from deck_thumbnails import NS
+from deck_variants import apply_dark_theme, select_steps
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+MEMORY_CACHE_SIZE = 32
+
+PSEUDO_LOCALE = "qps-ploc"
+PSEUDO_EXPANSION = 0.4
+
+# Helper arguments that bind data or files rather than hold text
+UNTRANSLATED = {"data", "chart", "series", "x", "number_format", "frames"}
+
+# Font scales tried for frames that overflow, in percent
+MIN_FONT_SCALE = 50
+FONT_SCALE_STEP = 5
+
+AUTOFIT_TAGS = ("noAutofit", "normAutofit", "spAutoFit")
+
+_MARKER = re.compile(r"\s*[•\-–]\s+")
+_PSEUDO_CHARS = str.maketrans("AaCcEeIiNnOoSsUuYyZz", "ÅåÇçÉéÎîÑñÖöŠšÛûÝýŽž")
+
+
+# --- Strings and translation memories -------------------------------------
+
+def split_marker(text):
+    """("• ", "rest") for a bulleted string, ("", text) otherwise."""
+    match = _MARKER.match(text)
+    return (match.group(), text[match.end():]) if match else ("", text)
+
+
+def _step_strings(step):
+    values = [step["footnote"]] if step["footnote"] else []
+    for name, value in step["kwargs"].items():
+        if name in UNTRANSLATED:
+            continue
+        if isinstance(value, list):
+            values.extend(value)
+        elif isinstance(value, str):
+            values.append(value)
+    return values
+
+
+def extract_strings(steps):
+    """{source string: [1-based slide numbers]} for every translatable string, in first-use order."""
+    strings = {}
+    for number, step in enumerate(steps, 1):
+        for value in _step_strings(step):
+            text = split_marker(value)[1]
+            if text.strip():
+                numbers = strings.setdefault(text, [])
+                if number not in numbers:
+                    numbers.append(number)
+    return strings
+
+
+def memory_path(locale, locale_dir=LOCALE_DIR):
+    return os.path.join(locale_dir, f"{locale}.json")
+
+
+@functools.lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _read_memory(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        try:
+            memory = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path}: invalid JSON: {exc}") from None
+    if not isinstance(memory, dict):
+        raise ValueError(f"{path}: expected an object mapping source strings to translations")
+    return {source: target for source, target in memory.items() if isinstance(target, str) and target}
+
+
+def load_memory(locale, locale_dir=LOCALE_DIR):
+    """Translations for a locale ({} if it has no file yet); re-read only when the file changes."""
+    path = memory_path(locale, locale_dir)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _read_memory(path, mtime_ns)
+
+
+def pseudo_translate(text):
+    """Accented, padded rendering of text for layout testing."""
+    padding = "·" * math.ceil(len(text) * PSEUDO_EXPANSION)
+    return f"[{text.translate(_PSEUDO_CHARS)} {padding}]"
+
+
+def update_memory(locale, missing, locale_dir=LOCALE_DIR):
+    """Add missing keys (as null) to a locale's memory file. Returns how many were added."""
+    path = memory_path(locale, locale_dir)
+    memory = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            memory = json.load(f)
+    added = [text for text in missing if text not in memory]
+    if not added:
+        return 0
+    memory.update(dict.fromkeys(added))
+    os.makedirs(locale_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(memory, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return len(added)
+
+
+def localize_steps(steps, memory):
+    """Translated copies of plan steps, and {missing source string: [slide numbers]}."""
+    missing = {}
+
+    def translate(value, number):
+        marker, text = split_marker(value)
+        if not text.strip():
+            return value
+        translated = memory.get(text)
+        if translated is None:
+            numbers = missing.setdefault(text, [])
+            if number not in numbers:
+                numbers.append(number)
+            return value
+        return marker + translated
+
+    localized = []
+    for number, step in enumerate(steps, 1):
+        kwargs = {}
+        for name, value in step["kwargs"].items():
+            if name in UNTRANSLATED:
+                kwargs[name] = value
+            elif isinstance(value, list):
+                kwargs[name] = [translate(item, number) for item in value]
+            elif isinstance(value, str):
+                kwargs[name] = translate(value, number)
+            else:
+                kwargs[name] = value
+        footnote = translate(step["footnote"], number) if step["footnote"] else step["footnote"]
+        localized.append(dict(step, kwargs=kwargs, footnote=footnote))
+    return localized, missing
+
+
+# --- Fitting longer text -----------------------------------------------------
+
+def _needed(element, width, scale=1.0):
+    # Wrapping is forced so a one-line frame that runs too wide counts as too tall
+    return deck_layout.text_height(element, width, scale, wrap=True) or 0
+
+
+def _fits(element, width, room, scale):
+    return _needed(element, width, scale) - room <= deck_layout.MIN_OVERFLOW * deck_layout.EMU_PER_INCH
+
+
+def fit_scale(element, width, room):
+    """Font scale in percent at which the frame's text fits `room` EMU of height, or None if it
+    fits unscaled."""
+    if _fits(element, width, room, 1.0):
+        return None
+    for percent in range(100 - FONT_SCALE_STEP, MIN_FONT_SCALE - 1, -FONT_SCALE_STEP):
+        if _fits(element, width, room, percent / 100):
+            return percent
+    return MIN_FONT_SCALE
+
+
+def set_font_scale(element, percent):
+    """Make a shape's text frame shrink its text to percent of its size."""
+    tx_body = element.find("p:txBody", NS)
+    body_pr = tx_body.find("a:bodyPr", NS)
+    if body_pr is None:
+        body_pr = etree.Element(f"{{{NS['a']}}}bodyPr")
+        tx_body.insert(0, body_pr)
+    for child in list(body_pr):
+        if etree.QName(child).localname in AUTOFIT_TAGS:
+            body_pr.remove(child)
+    autofit = etree.Element(f"{{{NS['a']}}}normAutofit", fontScale=str(percent * 1000))
+    warp = body_pr.find("a:prstTxWarp", NS)
+    if warp is not None:
+        warp.addnext(autofit)
+    else:
+        body_pr.insert(0, autofit)
+
+
+def fit_slide(slide_xml, source_xml, layout=None, master=None):
+    """Shrink text frames of a localized slide that need more room than in the source slide.
+
+    A frame may use its own height, or as much as the source text already
+    needed there, so frames the source deck overfills are left as designed.
+    Returns (slide XML, [(shape name, font scale, still overflowing)]).
+    """
+    root = etree.fromstring(slide_xml)
+    source_boxes = deck_layout.slide_boxes(etree.fromstring(source_xml), layout, master)
+    changes = []
+    for box, source in zip(deck_layout.slide_boxes(root, layout, master), source_boxes):
+        width = box.x1 - box.x0
+        room = max(box.y1 - box.y0, _needed(source.element, width))
+        percent = fit_scale(box.element, width, room)
+        if percent is not None:
+            set_font_scale(box.element, percent)
+            changes.append((box.name, percent, not _fits(box.element, width, room, percent / 100)))
+    if not changes:
+        return slide_xml, changes
+    return etree.tostring(root, encoding="UTF-8", standalone=True), changes
+
+
+# --- Builds ------------------------------------------------------------------
+
+def build_locale(plan, locale, output_file, variant_name=None, locale_dir=LOCALE_DIR):
+    """Build one localized deck (or variant). Runs in a worker; returns a summary dict."""
+    start = time.perf_counter()
+    variant = None
+    steps = plan["slides"]
+    if variant_name is not None:
+        variant = next(v for v in plan["variants"] if v["name"] == variant_name)
+        steps = select_steps(plan, variant)
+
+    if locale == PSEUDO_LOCALE:
+        memory = {text: pseudo_translate(text) for text in extract_strings(steps)}
+    else:
+        memory = load_memory(locale, locale_dir)
+    localized, missing = localize_steps(steps, memory)
+
+    # The source slides come from the slide cache; they are the baseline for fitting
+    source_parts, _ = deck_incremental.build_slides(steps)
+    parts, rebuilt = deck_incremental.build_slides(localized)
+
+    base_parts = deck_incremental.base_parts()
+    parsed = {}
+    fitted = []
+    for number, ((slide_xml, rels_xml), (source_xml, _)) in enumerate(zip(parts, source_parts), 1):
+        if slide_xml != source_xml:
+            slide_xml, changes = fit_slide(slide_xml, source_xml, *slide_context(rels_xml, base_parts, parsed))
+            fitted.extend((number, name, percent, still) for name, percent, still in changes)
+        if variant is not None and variant["theme"] == "dark":
+            slide_xml = apply_dark_theme(slide_xml)
+        parts[number - 1] = (slide_xml, rels_xml)
+    write_package(output_file, base_parts, parts)
+    return {"locale": locale, "output": output_file, "slides": len(parts), "rebuilt": rebuilt,
+            "missing": missing, "fitted": fitted, "elapsed": time.perf_counter() - start}
+
+
+def localized_output(plan, locale, variant_name=None, output_dir=None):
+    """<deck stem>.<locale>.pptx, in output_dir if given."""
+    output = plan["output"]
+    if variant_name is not None:
+        output = next(v["output"] for v in plan["variants"] if v["name"] == variant_name)
+    stem = os.path.splitext(output)[0]
+    if output_dir:
+        stem = os.path.join(output_dir, os.path.basename(stem))
+    return f"{stem}.{locale}.pptx"
+
+
+def build_locales(plan, locales, variant_name=None, output_dir=None, jobs=None, locale_dir=LOCALE_DIR):
+    """Build every locale in parallel; returns summaries in locale order."""
+    # Load once in the parent so forked workers start warm
+    deck_incremental.base_parts()
+    deck_incremental.helpers_digest()
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    jobs = min(jobs or os.cpu_count() or 1, len(locales))
+    arguments = [(plan, locale, localized_output(plan, locale, variant_name, output_dir), variant_name,
+                  locale_dir) for locale in locales]
+    if jobs <= 1:
+        return [build_locale(*args) for args in arguments]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(build_locale, *args) for args in arguments]
+        return [future.result() for future in futures]
+
+
+def main():
+    """Build localized copies of a deck spec."""
+    parser = argparse.ArgumentParser(description="Build localized decks from one spec, in parallel.")
+    parser.add_argument("spec", help="deck spec (.json, .yaml, .yml)")
+    parser.add_argument("--locales", nargs="+", required=True,
+                        help=f"locale codes, matching locales/<code>.json ({PSEUDO_LOCALE} is built in)")
+    parser.add_argument("--variant", help="build this variant of the spec")
+    parser.add_argument("-o", "--output-dir", default=None, help="directory for generated decks")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--locale-dir", default=LOCALE_DIR, help="translation memory directory")
+    parser.add_argument("--update-memory", action="store_true",
+                        help="add missing keys (as null) to each locale's memory file")
+    parser.add_argument("--report", help="write missing keys per locale to this JSON file")
+    parser.add_argument("--strict", action="store_true", help="exit non-zero if any key is missing")
+    args = parser.parse_args()
+
+    try:
+        plan = deck_spec.compile_spec(args.spec)
+        if args.variant is not None and args.variant not in {v["name"] for v in plan["variants"]}:
+            raise deck_spec.SpecError(f"{args.spec}: no variant named {args.variant!r}")
+        # Read every memory here, so a malformed file is reported before any worker starts
+        for locale in args.locales:
+            if locale != PSEUDO_LOCALE:
+                load_memory(locale, args.locale_dir)
+    except (OSError, ValueError, deck_spec.SpecError) as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    results = build_locales(plan, args.locales, args.variant, args.output_dir, args.jobs, args.locale_dir)
+    for result in results:
+        print(f"✓ {result['locale']} → {result['output']} ({result['slides']} slides, "
+              f"{len(result['fitted'])} frame(s) shrunk, {len(result['missing'])} missing keys, "
+              f"{result['elapsed'] * 1000:.0f} ms)")
+        for number, name, percent, still in result["fitted"]:
+            if still:
+                print(f"  ✗ slide {number} {name}: overflows even at {percent}%")
+        if result["missing"] and result["locale"] != PSEUDO_LOCALE:
+            shown = list(result["missing"].items())[:5]
+            for text, numbers in shown:
+                print(f"  missing (slides {', '.join(map(str, numbers))}): {text[:70]!r}")
+            if len(result["missing"]) > len(shown):
+                print(f"  ... and {len(result['missing']) - len(shown)} more")
+        if args.update_memory and result["locale"] != PSEUDO_LOCALE:
+            added = update_memory(result["locale"], result["missing"], args.locale_dir)
+            if added:
+                print(f"  added {added} keys to {memory_path(result['locale'], args.locale_dir)}")
+    print(f"{len(results)} locales in {time.perf_counter() - start:.2f}s")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({r["locale"]: r["missing"] for r in results}, f, ensure_ascii=False, indent=2)
+    if args.strict and any(r["missing"] for r in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
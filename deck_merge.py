@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Mail merge: one personalized copy of a deck per recipient, in parallel.
+
+Spec strings may contain {{field}} tokens:
+
+    {"type": "content", "title": "Join Us, {{studio}}",
+     "items": ["Prepared for {{contact}}", "", "Your pilot roadmap:", "• {{roadmap}}"]}
+
+Recipients come from a CSV, JSON or YAML file, with one record per recipient
+and a field per token. A field that holds a list, or a string with several
+lines (a multi-line CSV cell), fills the paragraph holding its token once
+per item. An empty list drops that paragraph.
+
+The template deck is built once, through the slide cache. Slides without
+tokens are zipped once, together with the rest of the package, into a
+template zip. Each recipient's deck is a copy of that zip, with the slides
+that have tokens appended. Those slides are rendered by substituting
+escaped values into the pre-serialized slide XML, so no recipient pays for
+python-pptx, lxml or compressing the shared parts. Recipients are split into
+chunks over a process pool.
+
+    python deck_merge.py specs/pilot_invite.json specs/pilot_studios.example.csv -o build/invites
+    python deck_merge.py specs/pilot_invite.json studios.json --variant dark -o build/invites \\
+        --name "CharacterLock_{{studio}}.pptx"
+"""
+
+import argparse
+import csv
+import glob
+import io
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+import deck_incremental
+import deck_spec
+from deck_package import PackageWriter
+from deck_variants import variant_parts
+
+try:
+    import yaml
+except ImportError:  # YAML recipient lists are optional
+    yaml = None
+
+# {{field}} tokens, in serialized XML (bytes) and in filename patterns (str)
+_FIELD = r"\{\{\s*([A-Za-z_][\w-]*)\s*\}\}"
+TOKEN = re.compile(_FIELD.encode("ascii"))
+FIELD_TOKEN = re.compile(_FIELD)
+# Built-in field: the recipient's 1-based position in the list
+ROW_FIELD = "n"
+
+CHUNK_SIZE = 16
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+_UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\x00-\x1F]+')
+
+
+class MergeError(ValueError):
+    """Raised for recipient data that does not fit the template."""
+
+
+# --- Templates -----------------------------------------------------------------
+
+def _paragraph_span(xml, start, end):
+    """(start, end) of the <a:p> element enclosing xml[start:end], or None."""
+    open_at = max(xml.rfind(b"<a:p>", 0, start), xml.rfind(b"<a:p ", 0, start))
+    if open_at < 0 or xml.rfind(b"</a:p>", open_at, start) >= 0:
+        return None
+    close_at = xml.find(b"</a:p>", end)
+    return None if close_at < 0 else (open_at, close_at + len(b"</a:p>"))
+
+
+def _token_pieces(xml):
+    """Split XML into literal bytes and field names."""
+    pieces = []
+    position = 0
+    for match in TOKEN.finditer(xml):
+        pieces.append(xml[position:match.start()])
+        pieces.append(match.group(1).decode("ascii"))
+        position = match.end()
+    pieces.append(xml[position:])
+    return pieces
+
+
+def compile_slide(slide_xml):
+    """A slide's XML as template pieces, or None if it has no tokens.
+
+    Pieces are literal bytes, field names (str), and (paragraph pieces, field
+    names) tuples for the paragraphs that hold tokens.
+    """
+    matches = list(TOKEN.finditer(slide_xml))
+    if not matches:
+        return None
+    pieces = []
+    position = 0
+    for match in matches:
+        if match.start() < position:
+            continue  # inside a paragraph already taken
+        span = _paragraph_span(slide_xml, match.start(), match.end())
+        if span is None:
+            pieces.extend(_token_pieces(slide_xml[position:match.end()]))
+            position = match.end()
+            continue
+        paragraph = _token_pieces(slide_xml[span[0]:span[1]])
+        pieces.append(slide_xml[position:span[0]])
+        pieces.append((paragraph, {piece for piece in paragraph if isinstance(piece, str)}))
+        position = span[1]
+    pieces.append(slide_xml[position:])
+    return [piece for piece in pieces if piece != b""]
+
+
+def template_fields(slides):
+    """Field names used by compiled slides, in first-use order."""
+    fields = {}
+    for pieces in slides.values():
+        for piece in pieces:
+            names = [piece] if isinstance(piece, str) else sorted(piece[1]) if isinstance(piece, tuple) else []
+            fields.update(dict.fromkeys(names))
+    return list(fields)
+
+
+def _xml_text(value):
+    text = _CTRL_CHARS.sub(" ", str(value))
+    return escape(text).encode("utf-8")
+
+
+def _lines(value):
+    """The items a value fills a paragraph with, or None for a single value."""
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    if isinstance(value, str) and "\n" in value:
+        return value.strip("\n").splitlines()
+    return None
+
+
+def render_slide(pieces, record):
+    """Substitute one recipient's fields into compiled slide pieces."""
+    out = []
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            out.append(piece)
+        elif isinstance(piece, str):
+            value = record[piece]
+            lines = _lines(value)
+            out.append(_xml_text(" ".join(lines) if lines is not None else value))
+        else:
+            paragraph, names = piece
+            lists = {name: lines for name in names if (lines := _lines(record[name])) is not None}
+            if len({len(lines) for lines in lists.values()}) > 1:
+                raise MergeError(f"fields {', '.join(sorted(lists))} share a paragraph but have "
+                                 "different numbers of lines")
+            count = len(next(iter(lists.values()))) if lists else 1
+            for index in range(count):
+                for part in paragraph:
+                    if isinstance(part, bytes):
+                        out.append(part)
+                    else:
+                        out.append(_xml_text(lists[part][index] if part in lists else record[part]))
+    return b"".join(out)
+
+
+class MergeTemplate:
+    """A deck split into a template zip of shared parts and compiled slides with tokens."""
+
+    def __init__(self, parts, base_parts):
+        self.slides = {}
+        for number, (slide_xml, _) in enumerate(parts, 1):
+            pieces = compile_slide(slide_xml)
+            if pieces is not None:
+                self.slides[number] = pieces
+        self.fields = template_fields(self.slides)
+        buffer = io.BytesIO()
+        with PackageWriter(buffer, base_parts) as writer:
+            for number, (slide_xml, rels_xml) in enumerate(parts, 1):
+                writer.add_slide(None if number in self.slides else slide_xml, rels_xml)
+        self.zip_bytes = buffer.getvalue()
+
+    def write(self, file, record, compresslevel=None):
+        """Write one recipient's deck to a path or a seekable binary file."""
+        rendered = {number: render_slide(pieces, record) for number, pieces in self.slides.items()}
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "w+b") as f:
+                self._append(f, rendered, compresslevel)
+        else:
+            self._append(file, rendered, compresslevel)
+
+    def _append(self, file, rendered, compresslevel):
+        file.write(self.zip_bytes)
+        file.seek(0)
+        with zipfile.ZipFile(file, "a", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+            for number, slide_xml in rendered.items():
+                zf.writestr(f"ppt/slides/slide{number}.xml", slide_xml)
+
+
+def build_template(plan, variant_name=None):
+    """MergeTemplate for a compiled plan, or one of its variants."""
+    return MergeTemplate(variant_parts(plan, variant_name), deck_incremental.base_parts())
+
+
+# --- Recipients --------------------------------------------------------------------
+
+def load_recipients(path):
+    """Recipient records from a CSV, JSON or YAML file."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return [dict(row) for row in csv.DictReader(f)]
+    with open(path, encoding="utf-8") as f:
+        if extension in (".yaml", ".yml"):
+            if yaml is None:
+                raise MergeError(f"{path}: PyYAML is required for YAML recipient lists")
+            records = yaml.safe_load(f)
+        else:
+            records = json.load(f)
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        raise MergeError(f"{path}: expected a list of recipient records")
+    return records
+
+
+def output_names(records, pattern, output_dir=""):
+    """Output path per record, from a filename pattern with {{field}} tokens."""
+    paths = []
+    seen = {}
+    for number, record in enumerate(records, 1):
+        def field(match):
+            value = record[match.group(1)]
+            return _UNSAFE_FILENAME.sub("_", " ".join(_lines(value) or [str(value)])).strip() or "_"
+        name = FIELD_TOKEN.sub(field, pattern)
+        if not name.lower().endswith(".pptx"):
+            name += ".pptx"
+        path = os.path.join(output_dir, name)
+        if path in seen:
+            raise MergeError(f"recipients {seen[path]} and {number} would both be written to {path}")
+        seen[path] = number
+        paths.append(path)
+    return paths
+
+
+def clean_outputs(output_dir, pattern):
+    """Delete the decks in output_dir that a filename pattern could have written; returns how many.
+
+    Only .pptx files matching the pattern are removed, and never from the
+    current directory or the repo.
+    """
+    target = os.path.realpath(output_dir)
+    for protected in (os.getcwd(), REPO_DIR):
+        protected = os.path.realpath(protected)
+        if target == protected or protected.startswith(target.rstrip(os.sep) + os.sep):
+            raise MergeError(f"--clean: refusing to clean {output_dir} (it holds {protected})")
+    if not pattern.lower().endswith(".pptx"):
+        pattern += ".pptx"
+    wildcard = "*".join(glob.escape(piece) for piece in FIELD_TOKEN.split(pattern)[::2])
+    removed = 0
+    for path in glob.glob(os.path.join(glob.escape(output_dir), wildcard)):
+        if os.path.isfile(path):
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def prepare_records(records, fields, pattern):
+    """Records with the row field added; raises MergeError for missing fields."""
+    needed = set(fields) | set(FIELD_TOKEN.findall(pattern))
+    prepared = []
+    for number, record in enumerate(records, 1):
+        record = {ROW_FIELD: number, **{key: "" if value is None else value for key, value in record.items()}}
+        missing = sorted(needed - set(record))
+        if missing:
+            raise MergeError(f"recipient {number}: no value for {', '.join(missing)}")
+        prepared.append(record)
+    return prepared
+
+
+# --- Parallel merge --------------------------------------------------------------
+
+_template = None
+
+
+def _init_worker(template):
+    global _template
+    _template = template
+
+
+def _write_chunk(jobs, compresslevel):
+    written = 0
+    for path, record in jobs:
+        _template.write(path, record, compresslevel)
+        written += os.path.getsize(path)
+    return len(jobs), written
+
+
+def merge(template, records, paths, jobs=None, compresslevel=None, chunk_size=CHUNK_SIZE):
+    """Write one deck per record; returns (decks written, total bytes)."""
+    pairs = list(zip(paths, records))
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    jobs = min(jobs or os.cpu_count() or 1, len(chunks))
+    if jobs <= 1:
+        _init_worker(template)
+        results = [_write_chunk(chunk, compresslevel) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(template,)) as pool:
+            results = list(pool.map(_write_chunk, chunks, [compresslevel] * len(chunks)))
+    return sum(count for count, _ in results), sum(size for _, size in results)
+
+
+def main():
+    """Write a personalized deck per recipient."""
+    parser = argparse.ArgumentParser(description="Mail-merge a deck spec with a recipient list.")
+    parser.add_argument("spec", help="deck spec with {{field}} tokens (.json, .yaml, .yml)")
+    parser.add_argument("recipients", help="recipient records (.csv, .json, .yaml, .yml)")
+    parser.add_argument("--variant", help="merge this variant of the spec")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    parser.add_argument("--name", default=None,
+                        help="output filename pattern with {{field}} tokens (default: <deck>_{{n}}.pptx)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    parser.add_argument("--compresslevel", type=int, default=None, choices=range(10), metavar="0-9",
+                        help="deflate level for personalized slides (default: zlib's)")
+    parser.add_argument("--clean", action="store_true",
+                        help="first delete decks in the output directory that match the filename pattern "
+                             "(needs -o)")
+    args = parser.parse_args()
+    if args.clean and args.output_dir is None:
+        parser.error("--clean needs an explicit -o/--output-dir")
+    output_dir = args.output_dir or "."
+
+    start = time.perf_counter()
+    try:
+        plan = deck_spec.compile_spec(args.spec)
+        output = plan["output"]
+        if args.variant is not None:
+            variant = next((v for v in plan["variants"] if v["name"] == args.variant), None)
+            if variant is None:
+                raise deck_spec.SpecError(f"{args.spec}: no variant named {args.variant!r}")
+            output = variant["output"]
+        template = build_template(plan, args.variant)
+        if not template.fields:
+            raise MergeError(f"{args.spec}: no {{{{field}}}} tokens to merge")
+        pattern = args.name or f"{os.path.splitext(os.path.basename(output))[0]}_{{{{{ROW_FIELD}}}}}.pptx"
+        records = prepare_records(load_recipients(args.recipients), template.fields, pattern)
+        paths = output_names(records, pattern, output_dir)
+    except (OSError, ValueError, deck_spec.SpecError) as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        return 1
+    prepared = time.perf_counter() - start
+
+    try:
+        if args.clean:
+            clean_outputs(output_dir, pattern)
+        os.makedirs(output_dir, exist_ok=True)
+        count, size = merge(template, records, paths, args.jobs, args.compresslevel)
+    except MergeError as exc:
+        print(f"✗ {exc}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    print(f"✓ {count} decks → {output_dir} ({len(template.slides)} personalized slide(s), "
+          f"fields: {', '.join(template.fields)})")
+    print(f"  template {prepared * 1000:.0f} ms, total {elapsed:.2f}s, "
+          f"{count / elapsed * 60:,.0f} decks/min, {size / 1e6:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Save-time package optimizer for generated decks.
+
+Works on the saved .pptx package and needs no python-pptx objects:
+
+- removes slide layouts no slide uses (a Presentation() deck carries all
+  eleven defaults), then masters and themes left without a used layout;
+- drops every part no longer reachable through the relationship graph,
+  along with its content-type override;
+- stores byte-identical media parts once and repoints the relationships;
+- rewrites the zip with a compression profile: store, fast, default (what
+  python-pptx uses) or max. Parts that are already compressed (JPEG, PNG,
+  ...) are always stored.
+
+It prints a per-part byte breakdown before and after.
+
+    python deck_optimize.py CharacterLock_Dark_Theme.pptx -o out.pptx --profile max
+    python deck_optimize.py *.pptx --in-place --drop-thumbnail
+"""
+
+import argparse
+import hashlib
+import os
+import posixpath
+import sys
+import zipfile
+
+from lxml import etree
+
+from deck_package import (CONTENT_TYPES, NS_CT, NS_P, NS_PR, NS_R, PRESENTATION_PART, _serialize, package_parts,
+                          rels_partname)
+
+SLIDE_RELTYPE_SUFFIX = "/slide"
+LAYOUT_RELTYPE_SUFFIX = "/slideLayout"
+MASTER_RELTYPE_SUFFIX = "/slideMaster"
+THUMBNAIL_RELTYPE_SUFFIX = "/metadata/thumbnail"
+
+COMPRESSION_PROFILES = {
+    "store": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, 6),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+
+# Already-compressed formats (xlsx is a zip: embedded chart workbooks): deflating them again costs time
+# and saves nothing
+PRECOMPRESSED_EXTENSIONS = {"jpeg", "jpg", "png", "gif", "mp4", "m4a", "mp3", "zip", "wdp", "xlsx"}
+
+
+def resolve_target(partname, target):
+    """Zip name a relationship target points to."""
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join(posixpath.dirname(partname), target))
+
+
+def relationships(parts, partname):
+    """(parsed rels root, [(Relationship element, target zip name)]) for internal relationships."""
+    blob = parts.get(rels_partname(partname))
+    if blob is None:
+        return None, []
+    root = etree.fromstring(blob)
+    return root, [(rel, resolve_target(partname, rel.get("Target")))
+                  for rel in root.iterfind(f"{{{NS_PR}}}Relationship")
+                  if rel.get("TargetMode") != "External"]
+
+
+def reachable_parts(parts):
+    """Every part reachable from the package relationships."""
+    seen = set()
+    stack = [""]
+    while stack:
+        partname = stack.pop()
+        for _, target in relationships(parts, partname)[1]:
+            if target not in seen and target in parts:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def _remove_relationship(parts, partname, target, id_list_tag=None):
+    """Drop relationships from partname to target, and their ids from an id list in the part."""
+    root, rels = relationships(parts, partname)
+    rids = {rel.get("Id") for rel, resolved in rels if resolved == target}
+    if not rids:
+        return
+    for rel, resolved in rels:
+        if resolved == target:
+            root.remove(rel)
+    parts[rels_partname(partname)] = _serialize(root)
+    if id_list_tag is not None:
+        owner = etree.fromstring(parts[partname])
+        for element in list(owner.iter(id_list_tag)):
+            if element.get(f"{{{NS_R}}}id") in rids:
+                element.getparent().remove(element)
+        parts[partname] = _serialize(owner)
+
+
+def strip_unused_layouts(parts):
+    """Remove layouts no slide uses, and masters left with no used layout. Returns removed part names."""
+    used_layouts = set()
+    slides = [t for rel, t in relationships(parts, PRESENTATION_PART)[1]
+              if rel.get("Type").endswith(SLIDE_RELTYPE_SUFFIX)]
+    for slide in slides:
+        used_layouts.update(t for rel, t in relationships(parts, slide)[1]
+                            if rel.get("Type").endswith(LAYOUT_RELTYPE_SUFFIX))
+
+    masters = [t for rel, t in relationships(parts, PRESENTATION_PART)[1]
+               if rel.get("Type").endswith(MASTER_RELTYPE_SUFFIX)]
+    removed = []
+    for index, master in enumerate(masters):
+        layouts = [t for rel, t in relationships(parts, master)[1]
+                   if rel.get("Type").endswith(LAYOUT_RELTYPE_SUFFIX)]
+        keep = [layout for layout in layouts if layout in used_layouts]
+        if not keep and index == 0 and not used_layouts:
+            keep = layouts[:1]  # a deck without slides still needs one master and layout
+        if not keep:
+            _remove_relationship(parts, PRESENTATION_PART, master, f"{{{NS_P}}}sldMasterId")
+            removed.append(master)
+            continue
+        for layout in layouts:
+            if layout not in keep:
+                _remove_relationship(parts, master, layout, f"{{{NS_P}}}sldLayoutId")
+                removed.append(layout)
+    return removed
+
+
+def drop_thumbnail(parts):
+    """Remove the package thumbnail (file-browser preview). Returns removed part names."""
+    thumbnails = [t for rel, t in relationships(parts, "")[1] if rel.get("Type").endswith(THUMBNAIL_RELTYPE_SUFFIX)]
+    for thumbnail in thumbnails:
+        _remove_relationship(parts, "", thumbnail)
+    return thumbnails
+
+
+def dedupe_media(parts):
+    """Point every relationship to identical media at one copy. Returns {duplicate: kept part}."""
+    first = {}
+    duplicates = {}
+    for name in sorted(parts):
+        if name.startswith("ppt/media/"):
+            digest = hashlib.sha1(parts[name]).digest()
+            if digest in first:
+                duplicates[name] = first[digest]
+            else:
+                first[digest] = name
+    if not duplicates:
+        return duplicates
+    for partname in [""] + list(parts):
+        root, rels = relationships(parts, partname)
+        changed = False
+        for rel, target in rels:
+            if target in duplicates:
+                kept = duplicates[target]
+                rel.set("Target", posixpath.relpath(kept, posixpath.dirname(partname) or "."))
+                changed = True
+        if changed:
+            parts[rels_partname(partname)] = _serialize(root)
+    return duplicates
+
+
+def collect_garbage(parts):
+    """Delete unreachable parts, their rels and their content-type overrides. Returns removed names."""
+    keep = reachable_parts(parts)
+    removed = [name for name in parts
+               if name != CONTENT_TYPES and name not in keep and not name.endswith(".rels")]
+    for name in removed:
+        del parts[name]
+    for name in [n for n in parts if n.endswith(".rels") and n != "_rels/.rels"]:
+        directory, rels_file = posixpath.split(name)
+        owner = posixpath.join(posixpath.dirname(directory), rels_file[:-len(".rels")])
+        if owner not in parts:
+            del parts[name]
+    content_types = etree.fromstring(parts[CONTENT_TYPES])
+    for override in content_types.findall(f"{{{NS_CT}}}Override"):
+        if override.get("PartName")[1:] not in parts:
+            content_types.remove(override)
+    parts[CONTENT_TYPES] = _serialize(content_types)
+    return removed
+
+
+def optimize_parts(parts, strip_thumbnail=False):
+    """Optimize a {zip name: bytes} package in place. Returns (removed parts, deduplicated parts)."""
+    removed = strip_unused_layouts(parts)
+    if strip_thumbnail:
+        removed += drop_thumbnail(parts)
+    duplicates = dedupe_media(parts)
+    collect_garbage(parts)
+    return removed, duplicates
+
+
+def write_parts(file, parts, profile="default"):
+    """Write a package with a compression profile; [Content_Types].xml goes first."""
+    compression, level = COMPRESSION_PROFILES[profile]
+    names = [CONTENT_TYPES] + [name for name in parts if name != CONTENT_TYPES]
+    with zipfile.ZipFile(file, "w") as zf:
+        for name in names:
+            extension = name.rsplit(".", 1)[-1].lower()
+            stored = compression == zipfile.ZIP_STORED or extension in PRECOMPRESSED_EXTENSIONS
+            zf.writestr(name, parts[name], compress_type=zipfile.ZIP_STORED if stored else compression,
+                        compresslevel=None if stored else level)
+
+
+def save_optimized(prs, file, profile="default", strip_thumbnail=False):
+    """Save a python-pptx presentation through the optimizer."""
+    parts = package_parts(prs)
+    optimize_parts(parts, strip_thumbnail)
+    write_parts(file, parts, profile)
+
+
+def read_parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def breakdown(path):
+    """{zip name: (uncompressed bytes, stored bytes)} of a package."""
+    with zipfile.ZipFile(path) as zf:
+        return {info.filename: (info.file_size, info.compress_size) for info in zf.infolist()}
+
+
+def print_breakdown(before, after):
+    """Per-part stored sizes before and after, largest first."""
+    print(f"  {'PART':<48} {'SIZE':>8} {'BEFORE':>8} {'AFTER':>8}")
+    for name in sorted(before, key=lambda n: -before[n][1]):
+        size, stored = before[name]
+        new = f"{after[name][1]:>8}" if name in after else f"{'removed':>8}"
+        print(f"  {name:<48} {size:>8} {stored:>8} {new}")
+    for name in sorted(set(after) - set(before)):
+        print(f"  {name:<48} {after[name][0]:>8} {'-':>8} {after[name][1]:>8}")
+
+
+def main():
+    """Optimize one or more saved decks."""
+    parser = argparse.ArgumentParser(description="Strip unused parts from decks and recompress them.")
+    parser.add_argument("decks", nargs="+", help=".pptx files")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("-o", "--output", help="output file (single deck) or directory")
+    group.add_argument("--in-place", action="store_true", help="overwrite the input decks")
+    parser.add_argument("--profile", choices=sorted(COMPRESSION_PROFILES), default="default",
+                        help="compression profile (default: default)")
+    parser.add_argument("--drop-thumbnail", action="store_true", help="also remove docProps/thumbnail.jpeg")
+    parser.add_argument("-q", "--quiet", action="store_true", help="totals only, no per-part breakdown")
+    args = parser.parse_args()
+
+    for deck in args.decks:
+        if args.in_place:
+            output = deck
+        elif args.output and (len(args.decks) > 1 or os.path.isdir(args.output) or args.output.endswith(os.sep)):
+            os.makedirs(args.output, exist_ok=True)
+            output = os.path.join(args.output, os.path.basename(deck))
+        elif args.output:
+            output = args.output
+        else:
+            output = f"{os.path.splitext(deck)[0]}.optimized.pptx"
+
+        before = breakdown(deck)
+        parts = read_parts(deck)
+        removed, duplicates = optimize_parts(parts, args.drop_thumbnail)
+        tmp_output = f"{output}.{os.getpid()}.tmp"
+        write_parts(tmp_output, parts, args.profile)
+        os.replace(tmp_output, output)
+        after = breakdown(output)
+
+        print(f"{deck} → {output} ({args.profile})")
+        if not args.quiet:
+            print_breakdown(before, after)
+        old_total = os.path.getsize(deck) if output != deck else sum(s for _, s in before.values())
+        new_total = os.path.getsize(output)
+        print(f"  removed {len(removed)} parts ({len(before) - len(after)} zip entries), "
+              f"deduplicated {len(duplicates)} media parts")
+        print(f"  {old_total:,} → {new_total:,} bytes ({(1 - new_total / old_total) * 100:.1f}% smaller)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+Low-level PPTX package assembly from pre-serialized slide parts.
+
+python-pptx only writes a package through prs.save(), which needs every slide
+in memory as live objects. The helpers here work one level down: a slide is
+just its serialized XML plus its relationships part, and a deck is an empty
+base package with those slide parts added and the presentation part, its
+relationships and [Content_Types].xml rewritten to list them.
+
+Parts a slide relates to other than its layout (a chart and its embedded
+workbook, a picture) are renamed by content hash when the slide is
+serialized and kept in RELATED_PARTS; PackageWriter writes each one once,
+for whichever slides refer to it. RELATED_PARTS keeps the most recently
+used parts up to RELATED_PARTS_LIMIT bytes, so long-lived processes don't
+accumulate every blob they ever built; an evicted part is read back through
+RELATED_PARTS.loader (deck_incremental sets it to the slide cache).
+"""
+
+import collections
+import hashlib
+import io
+import posixpath
+import zipfile
+
+from lxml import etree
+
+SLIDE_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+SLIDE_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+SLIDE_LAYOUT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
+
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PR = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_CT = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+PRESENTATION_PART = "ppt/presentation.xml"
+PRESENTATION_RELS = "ppt/_rels/presentation.xml.rels"
+CONTENT_TYPES = "[Content_Types].xml"
+MANIFEST_PARTS = (CONTENT_TYPES, PRESENTATION_PART, PRESENTATION_RELS)
+
+# Elements that may follow p:sldIdLst inside p:presentation
+_SLDIDLST_SUCCESSORS = ("sldSz", "notesSz", "smartTags", "embeddedFontLst", "custShowLst",
+                        "photoAlbum", "custDataLst", "kinsoku", "defaultTextStyle",
+                        "modifyVerifier", "extLst")
+
+
+# Bytes of related-part blobs kept in memory
+RELATED_PARTS_LIMIT = 64 * 1024 * 1024
+
+
+class _RelatedParts(collections.OrderedDict):
+    """Content-addressed part name -> (blob, content type, rels XML or None), least recently used first.
+
+    Blobs over `limit` bytes in total are evicted oldest first. A missing name
+    is passed to `loader` (a callable returning the entry or None), if set.
+    """
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.size = 0
+        self.loader = None
+
+    def __getitem__(self, name):
+        entry = super().__getitem__(name)
+        self.move_to_end(name)
+        return entry
+
+    def __missing__(self, name):
+        entry = self.loader(name) if self.loader is not None else None
+        if entry is None:
+            raise KeyError(name)
+        self[name] = entry
+        return entry
+
+    def __setitem__(self, name, entry):
+        if name in self:
+            self.size -= len(self.pop(name)[0])
+        super().__setitem__(name, entry)
+        self.size += len(entry[0])
+        while self.size > self.limit and len(self) > 1:
+            _, (blob, _, _) = self.popitem(last=False)
+            self.size -= len(blob)
+
+
+RELATED_PARTS = _RelatedParts(RELATED_PARTS_LIMIT)
+
+
+def rels_partname(partname):
+    """Zip name of a part's relationships part."""
+    directory, name = posixpath.split(partname)
+    return posixpath.join(directory, "_rels", f"{name}.rels")
+
+
+def related_targets(rels_xml, partname):
+    """Zip names of the internal, non-layout parts a rels part points to."""
+    if rels_xml.count(b"<Relationship ") <= 1 and SLIDE_LAYOUT_RELTYPE.encode() in rels_xml:
+        return []  # just the slide layout: the common case, no parse needed
+    rels = etree.fromstring(rels_xml)
+    return [posixpath.normpath(posixpath.join(posixpath.dirname(partname), rel.get("Target")))
+            for rel in rels.iter(f"{{{NS_PR}}}Relationship")
+            if rel.get("TargetMode") != "External" and rel.get("Type") != SLIDE_LAYOUT_RELTYPE]
+
+
+def _register(part):
+    """Register a python-pptx part and the parts it relates to; return its content-addressed name."""
+    partname = str(part.partname)[1:]
+    rels_xml = None
+    if len(part.rels):
+        rels = etree.fromstring(part.rels.xml)
+        for rel in rels.iter(f"{{{NS_PR}}}Relationship"):
+            if rel.get("TargetMode") != "External":
+                target = _register(part.related_part(rel.get("Id")))
+                rel.set("Target", posixpath.relpath(target, posixpath.dirname(partname)))
+        rels_xml = _serialize(rels)
+    digest = hashlib.sha1(part.blob)
+    digest.update(rels_xml or b"")
+    directory, name = posixpath.split(partname)
+    stem, extension = posixpath.splitext(name)
+    name = posixpath.join(directory, f"{stem.rstrip('0123456789') or 'part'}-{digest.hexdigest()[:16]}{extension}")
+    if name not in RELATED_PARTS:
+        RELATED_PARTS[name] = (part.blob, part.content_type, rels_xml)
+    return name
+
+
+def slide_parts(slide):
+    """Return the serialized (slide XML, slide rels XML) of a python-pptx slide.
+
+    Related parts other than the layout are registered in RELATED_PARTS under
+    content-addressed names, and the rels point to those names.
+    """
+    part = slide.part
+    rels_xml = part.rels.xml
+    if not related_targets(rels_xml, "ppt/slides/slide1.xml"):
+        return part.blob, rels_xml
+    rels = etree.fromstring(rels_xml)
+    for rel in rels.iter(f"{{{NS_PR}}}Relationship"):
+        if rel.get("TargetMode") != "External" and rel.get("Type") != SLIDE_LAYOUT_RELTYPE:
+            target = _register(part.related_part(rel.get("Id")))
+            rel.set("Target", posixpath.relpath(target, "ppt/slides"))
+    return part.blob, _serialize(rels)
+
+
+def package_parts(prs):
+    """Serialize a presentation and return its parts as {zip name: bytes}."""
+    stream = io.BytesIO()
+    prs.save(stream)
+    with zipfile.ZipFile(stream) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _serialize(element):
+    return etree.tostring(element, encoding="UTF-8", standalone=True)
+
+
+def _manifests(base_parts, slide_count, extra_content_types=()):
+    """Rewrite presentation.xml, its rels and content types for slide_count slides.
+
+    extra_content_types lists (part name, content type) for any parts added
+    alongside the slides, such as pictures.
+    """
+    presentation = etree.fromstring(base_parts[PRESENTATION_PART])
+    rels = etree.fromstring(base_parts[PRESENTATION_RELS])
+    content_types = etree.fromstring(base_parts[CONTENT_TYPES])
+
+    for old in presentation.findall(f"{{{NS_P}}}sldIdLst"):
+        presentation.remove(old)
+    for rel in rels.findall(f"{{{NS_PR}}}Relationship"):
+        if rel.get("Type") == SLIDE_RELTYPE:
+            rels.remove(rel)
+    for override in content_types.findall(f"{{{NS_CT}}}Override"):
+        if override.get("ContentType") == SLIDE_CONTENT_TYPE:
+            content_types.remove(override)
+
+    used = {rel.get("Id") for rel in rels}
+    next_rid = 1 + max((int(rid[3:]) for rid in used if rid.startswith("rId") and rid[3:].isdigit()),
+                       default=0)
+
+    sld_id_lst = etree.Element(f"{{{NS_P}}}sldIdLst")
+    for index in range(1, slide_count + 1):
+        rid = f"rId{next_rid}"
+        next_rid += 1
+        etree.SubElement(sld_id_lst, f"{{{NS_P}}}sldId", {"id": str(255 + index), f"{{{NS_R}}}id": rid})
+        etree.SubElement(rels, f"{{{NS_PR}}}Relationship",
+                         {"Id": rid, "Type": SLIDE_RELTYPE, "Target": f"slides/slide{index}.xml"})
+        etree.SubElement(content_types, f"{{{NS_CT}}}Override",
+                         {"PartName": f"/ppt/slides/slide{index}.xml", "ContentType": SLIDE_CONTENT_TYPE})
+    for partname, content_type in extra_content_types:
+        etree.SubElement(content_types, f"{{{NS_CT}}}Override",
+                         {"PartName": f"/{partname}", "ContentType": content_type})
+
+    # python-pptx writes overrides sorted by part name; keep the same order
+    overrides = sorted(content_types.findall(f"{{{NS_CT}}}Override"), key=lambda o: o.get("PartName"))
+    for override in overrides:
+        content_types.append(override)
+
+    if slide_count:
+        successor = next((child for child in presentation
+                          if etree.QName(child).localname in _SLDIDLST_SUCCESSORS), None)
+        if successor is None:
+            presentation.append(sld_id_lst)
+        else:
+            successor.addprevious(sld_id_lst)
+
+    return {
+        CONTENT_TYPES: _serialize(content_types),
+        PRESENTATION_PART: _serialize(presentation),
+        PRESENTATION_RELS: _serialize(rels),
+    }
+
+
+class PackageWriter:
+    """Write a PPTX package slide by slide on top of an empty base package.
+
+    Base parts are written when the writer opens, each slide part as soon as it
+    is added, and the three manifest parts on close, so only the running slide
+    count is kept in memory.
+    """
+
+    def __init__(self, file, base_parts, compression=zipfile.ZIP_DEFLATED, compresslevel=None):
+        self.base_parts = base_parts
+        self.slide_count = 0
+        self.extra_content_types = []
+        self._written = set()
+        self._zip = zipfile.ZipFile(file, "w", compression=compression, compresslevel=compresslevel)
+        for name, blob in base_parts.items():
+            if name not in MANIFEST_PARTS and not name.startswith("ppt/slides/"):
+                self._zip.writestr(name, blob)
+
+    def add_slide(self, slide_xml, rels_xml):
+        """Append one slide from its serialized XML and relationships.
+
+        slide_xml may be None to leave the slide part out of the zip, for a
+        caller that appends it to the finished package later (deck_merge).
+        """
+        self.slide_count += 1
+        if slide_xml is not None:
+            self._zip.writestr(f"ppt/slides/slide{self.slide_count}.xml", slide_xml)
+        self._zip.writestr(f"ppt/slides/_rels/slide{self.slide_count}.xml.rels", rels_xml)
+        self._add_related(rels_xml, "ppt/slides/slide1.xml")
+        return self.slide_count
+
+    def _add_related(self, rels_xml, partname):
+        for target in related_targets(rels_xml, partname):
+            if target in self._written or target in self.base_parts:
+                continue
+            try:
+                blob, content_type, target_rels = RELATED_PARTS[target]
+            except KeyError:
+                raise KeyError(f"{partname} refers to {target}, which is not in RELATED_PARTS") from None
+            self.add_part(target, blob, content_type)
+            if target_rels is not None:
+                self._zip.writestr(rels_partname(target), target_rels)
+                self._add_related(target_rels, target)
+
+    def add_part(self, partname, blob, content_type):
+        """Write a non-slide part, such as a picture, referenced by slide rels."""
+        self._zip.writestr(partname, blob)
+        self._written.add(partname)
+        self.extra_content_types.append((partname, content_type))
+
+    def close(self):
+        """Write the manifests and finish the zip."""
+        if self._zip is None:
+            return
+        manifests = _manifests(self.base_parts, self.slide_count, self.extra_content_types)
+        for name, blob in manifests.items():
+            self._zip.writestr(name, blob)
+        self._zip.close()
+        self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_package(file, base_parts, slides, **kwargs):
+    """Write a package from an iterable of (slide XML, rels XML) pairs."""
+    with PackageWriter(file, base_parts, **kwargs) as writer:
+        for slide_xml, rels_xml in slides:
+            writer.add_slide(slide_xml, rels_xml)
+        return writer.slide_count
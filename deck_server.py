@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Local HTTP service that renders deck specs to PPTX.
+
+Other services POST a deck spec (see deck_spec.py) and get the .pptx bytes
+back, instead of shelling out to the generator scripts. Renders run on a
+pool of worker processes forked at startup, each with python-pptx, the slide
+helpers and the base template already loaded. Slides come from the shared
+incremental slide cache whenever possible.
+
+Identical concurrent requests (same compiled plan and variant) are merged
+into a single render. When the number of distinct pending renders reaches
+--max-pending, new requests are refused with 503 and a Retry-After header
+rather than queued without bound.
+
+    python deck_server.py --port 8765 -j 4
+    curl --data-binary @specs/characterlock_honest.json localhost:8765/render -o deck.pptx
+    curl --data-binary @specs/characterlock.json 'localhost:8765/render?variant=honest-dark' -o dark.pptx
+    curl localhost:8765/metrics
+
+Posted specs may only name chart data and storyboard frames when the server
+is started with --data-root; their paths are then resolved under it and may
+not leave it.
+
+Endpoints: POST /render[?variant=NAME], GET /metrics, GET /healthz.
+"""
+
+import argparse
+import collections
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+import deck_incremental
+import deck_spec
+import template_cache
+from deck_package import write_package
+from deck_variants import variant_parts
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+MAX_SPEC_BYTES = 4 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+LATENCY_WINDOW = 1000
+
+
+# --- Worker side -----------------------------------------------------------
+
+def _warm_worker():
+    """Pool initializer: load the template and helper sources before the first request."""
+    template_cache.base_presentation()
+    deck_incremental.base_parts()
+    deck_incremental.helpers_digest()
+
+
+def render_plan(plan, variant_name=None):
+    """Render a compiled plan, or one of its variants, to PPTX bytes. Runs in a worker."""
+    buffer = io.BytesIO()
+    write_package(buffer, deck_incremental.base_parts(), variant_parts(plan, variant_name))
+    return buffer.getvalue()
+
+
+# --- Server side -----------------------------------------------------------
+
+class Overloaded(Exception):
+    """Raised when the pool already has --max-pending distinct renders queued."""
+
+
+class RenderService:
+    """Worker pool with request coalescing, backpressure and latency metrics."""
+
+    def __init__(self, workers=None, max_pending=None, timeout=60.0):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.max_pending = max_pending or self.workers * 4
+        self.timeout = timeout
+        self.pool = multiprocessing.Pool(self.workers, initializer=_warm_worker)
+        self._lock = threading.Lock()
+        self._pending = {}  # render key -> Future
+        self._latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.counters = collections.Counter()
+        self.started = time.time()
+
+    def submit(self, plan, variant=None):
+        """Future for the rendered bytes, shared with any identical pending request."""
+        key = hashlib.sha256(json.dumps([plan, variant], sort_keys=True).encode("utf-8")).hexdigest()
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                self.counters["coalesced"] += 1
+                return future
+            if len(self._pending) >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise Overloaded()
+            future = self._pending[key] = Future()
+            self.counters["renders"] += 1
+
+        def done(result, failed=False):
+            with self._lock:
+                del self._pending[key]
+                self.counters["render_errors" if failed else "renders_ok"] += 1
+            if failed:
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        self.pool.apply_async(render_plan, (plan, variant), callback=done,
+                              error_callback=lambda exc: done(exc, failed=True))
+        return future
+
+    def count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def render(self, plan, variant=None):
+        """Render and wait, recording end-to-end latency of accepted requests."""
+        start = time.perf_counter()
+        future = self.submit(plan, variant)  # refused requests are not timed
+        try:
+            return future.result(self.timeout)
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - start)
+
+    def metrics(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            queue_depth = len(self._pending)
+            counters = dict(self.counters)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 2)
+
+        return {
+            "workers": self.workers,
+            "queue_depth": queue_depth,
+            "max_pending": self.max_pending,
+            "uptime_s": round(time.time() - self.started, 1),
+            "latency_ms": {"p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99),
+                           "samples": len(latencies)},
+            **{name: counters.get(name, 0)
+               for name in ("requests", "renders", "renders_ok", "render_errors", "coalesced", "rejected",
+                            "bad_requests")},
+        }
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """HTTP front end; the RenderService is attached to the server."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "DeckRender/1"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, body, content_type="application/json", headers=()):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body, indent=2).encode("utf-8") + b"\n"
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        view = memoryview(body)
+        for offset in range(0, len(view), CHUNK_SIZE):
+            self.wfile.write(view[offset:offset + CHUNK_SIZE])
+
+    def _error(self, status, message, headers=()):
+        self._send(status, {"error": message}, headers=headers)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            self._send(200, self.service.metrics())
+        elif path == "/healthz":
+            self._send(200, {"ok": True})
+        else:
+            self._error(404, f"no such endpoint: {path}")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            self._error(404, f"no such endpoint: {url.path}")
+            return
+        self.service.count("requests")
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.service.count("bad_requests")
+            self._error(400, "Content-Length must be an integer")
+            return
+        if length <= 0 or length > MAX_SPEC_BYTES:
+            self.service.count("bad_requests")
+            self._error(413 if length else 411, f"spec body must be 1..{MAX_SPEC_BYTES} bytes")
+            return
+        raw = self.rfile.read(length)
+        variant = parse_qs(url.query).get("variant", [None])[0]
+
+        try:
+            content_type = self.headers.get("Content-Type", "")
+            spec = deck_spec.parse_spec(raw, ".yaml" if "yaml" in content_type else "")
+            plan = deck_spec.validate_spec(spec, self.server.data_root)
+            if variant is not None and variant not in {v["name"] for v in plan["variants"]}:
+                raise deck_spec.SpecError(f"variant {variant!r} is not defined in the spec")
+        except (ValueError, deck_spec.SpecError) as exc:
+            self.service.count("bad_requests")
+            self._error(400, str(exc))
+            return
+
+        try:
+            body = self.service.render(plan, variant)
+        except Overloaded:
+            self._error(503, "render pool saturated, retry later", headers=[("Retry-After", "1")])
+            return
+        except FutureTimeout:
+            self._error(504, f"render did not finish within {self.service.timeout:.0f}s")
+            return
+        except ValueError as exc:  # unreadable chart data or frames named by the spec
+            self.service.count("bad_requests")
+            self._error(400, str(exc))
+            return
+        except Exception as exc:  # a failed render answers this request only
+            self._error(500, f"{type(exc).__name__}: {exc}")
+            return
+        filename = (variant and f"{variant}.pptx") or plan["output"] or "deck.pptx"
+        self._send(200, body, PPTX_CONTENT_TYPE, headers=[("Content-Disposition", content_disposition(filename))])
+
+
+def content_disposition(filename):
+    """Attachment header for a file name taken from a spec (RFC 6266).
+
+    Only the base name is kept. The quoted fallback is printable ASCII without
+    quotes or backslashes, and the full name goes in a percent-encoded filename*.
+    """
+    filename = os.path.basename(filename.replace("\\", "/")) or "deck.pptx"
+    fallback = "".join(c if " " <= c <= "~" and c not in '"\\' else "_" for c in filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def make_server(host, port, service, verbose=False, data_root=None):
+    server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    server.data_root = data_root
+    return server
+
+
+def main():
+    """Serve deck renders over HTTP until interrupted."""
+    parser = argparse.ArgumentParser(description="Local HTTP deck-rendering service.")
+    parser.add_argument("--host", default="127.0.0.1", help="bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="port (default: 8765)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="distinct renders allowed in flight before returning 503 (default: 4 per worker)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds to wait for a render")
+    parser.add_argument("--data-root", default=None,
+                        help="directory chart data and storyboard frames are read from "
+                             "(default: specs may not name files)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    service = RenderService(args.workers, args.max_pending, args.timeout)
+    server = make_server(args.host, args.port, service, args.verbose,
+                         args.data_root and os.path.abspath(args.data_root))
+    print(f"Rendering decks on http://{args.host}:{args.port} with {service.workers} workers (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
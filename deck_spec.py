@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Compile declarative deck specs (JSON or YAML) into PowerPoint presentations.
+
+A spec lists slides by type; each type maps onto one of the slide helpers in
+create_presentation_v2.py, (the v1_* types) the original deck's 18pt helpers in
+create_presentation.py, or (the dark_* types) one of the fixed dark-theme
+slides in create_dark_presentation.py:
+
+    {
+      "output": "CharacterLock_AI_Presentation_HONEST.pptx",
+      "slides": [
+        {"type": "title", "title": "...", "subtitle": "..."},
+        {"type": "content", "title": "...", "items": ["...", "..."],
+         "footnote": "* Source: ..."},
+        {"type": "two_column", "title": "...", "left": [...], "right": [...]},
+        {"type": "large_text", "title": "...", "text": "...", "subtext": "..."},
+        {"type": "chart", "title": "...", "data": "data/scores.csv",
+         "chart": "line", "series": ["score"], "format": "0%"},
+        {"type": "storyboard", "title": "...", "frames": ["frames/*.png"],
+         "columns": 4, "rows": 3, "captions": ["..."]},
+        {"type": "closing", "title": "Thank You!", "lines": [...]}
+      ],
+      "variants": [
+        {"name": "honest-dark", "output": "Honest_Dark.pptx", "theme": "dark",
+         "footnotes": true, "claims": "honest"}
+      ]
+    }
+
+Chart data and storyboard frame paths are relative to the spec file and must
+stay inside its directory. Slides record these files as plan inputs, so
+editing one rebuilds only the slides that use it. Frames may be glob
+patterns, and a storyboard becomes as many slides as its frames fill. A
+cached plan is recompiled when a pattern's matches change.
+
+A slide may list the claim sets it belongs to ("claims": ["honest"]); slides
+without one are shared by every claim set. Variants are rendered by
+deck_variants.py.
+
+Specs are validated once and compiled into a plan of helper calls. Plans are
+cached on disk keyed by the content hash of the spec, so an unchanged spec
+skips validation and compilation entirely.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import sys
+
+import create_dark_presentation as dark_helpers
+import create_presentation as v1_helpers
+import create_presentation_v2 as helpers
+import template_cache
+from deck_charts import CHART_TYPES
+from deck_images import STORYBOARD_COLUMNS, STORYBOARD_ROWS, prefetch as prefetch_images
+
+try:
+    import yaml
+except ImportError:  # YAML specs are optional
+    yaml = None
+
+# Bump whenever the plan format or the slide type table changes
+COMPILER_VERSION = 6
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".deck_cache", "plans")
+
+# Slide type -> (helper name, [(spec field, helper argument, kind, required)]); kind "path" is a
+# data file path and "paths" a list of file paths or glob patterns, resolved against the spec's directory
+SLIDE_TYPES = {
+    "title": ("create_title_slide", [
+        ("title", "title", str, True),
+        ("subtitle", "subtitle", str, True),
+    ]),
+    "content": ("create_content_slide", [
+        ("title", "title", str, True),
+        ("items", "content_items", list, True),
+    ]),
+    "two_column": ("create_two_column_slide", [
+        ("title", "title", str, True),
+        ("left", "left_content", list, True),
+        ("right", "right_content", list, True),
+    ]),
+    "large_text": ("create_large_text_slide", [
+        ("title", "title", str, True),
+        ("text", "main_text", str, True),
+        ("subtext", "subtext", str, False),
+    ]),
+    "closing": ("create_closing_slide", [
+        ("title", "headline", str, True),
+        ("lines", "lines", list, True),
+    ]),
+    "chart": ("create_chart_slide", [
+        ("title", "title", str, True),
+        ("data", "data", "path", True),
+        ("chart", "chart", str, False),
+        ("series", "series", list, False),
+        ("x", "x", str, False),
+        ("format", "number_format", str, False),
+    ]),
+    "storyboard": ("create_storyboard_slide", [
+        ("title", "title", str, True),
+        ("frames", "frames", "paths", True),
+        ("columns", "columns", int, False),
+        ("rows", "rows", int, False),
+        ("captions", "captions", list, False),
+    ]),
+    "v1_content": ("v1.create_content_slide", [
+        ("title", "title", str, True),
+        ("items", "content_items", list, True),
+    ]),
+    "v1_large_text": ("v1.create_large_text_slide", [
+        ("title", "title", str, True),
+        ("text", "main_text", str, True),
+        ("subtext", "subtext", str, False),
+    ]),
+    "v1_closing": ("v1.create_closing_slide", [
+        ("title", "headline", str, True),
+        ("lines", "lines", list, True),
+    ]),
+    "dark_problem": ("dark.create_slide_1_problem", []),
+    "dark_solution": ("dark.create_slide_2_solution", []),
+    "dark_impact": ("dark.create_slide_3_impact", []),
+    "dark_engine": ("dark.create_slide_4_engine", []),
+}
+
+# Helper name prefix -> module the helper lives in
+HELPER_MODULES = {"": helpers, "v1": v1_helpers, "dark": dark_helpers}
+
+COMMON_FIELDS = {"type", "footnote", "claims"}
+
+THEMES = ("light", "dark")
+
+
+class SpecError(ValueError):
+    """Raised when a deck spec does not describe a valid deck."""
+
+
+def spec_hash(raw):
+    """Content hash of a raw spec, including the compiler version."""
+    digest = hashlib.sha256(f"deck-spec/{COMPILER_VERSION}\n".encode())
+    digest.update(raw)
+    return digest.hexdigest()
+
+
+def parse_spec(raw, path=""):
+    """Parse raw spec bytes as JSON, or YAML for .yaml/.yml files.
+
+    Raises ValueError for invalid JSON and SpecError for invalid YAML.
+    """
+    if path.endswith((".yaml", ".yml")):
+        if yaml is None:
+            raise SpecError(f"{path}: PyYAML is required for YAML specs")
+        try:
+            return yaml.safe_load(raw)
+        except yaml.YAMLError as exc:
+            raise SpecError(f"invalid YAML: {exc}") from exc
+    return json.loads(raw)
+
+
+def _check_strings(value, where):
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise SpecError(f"{where}: expected a list of strings")
+
+
+def _expand_pattern(pattern):
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def _spec_path(item, base_dir, where):
+    """Absolute path of a file path relative to the spec's directory.
+
+    Raises SpecError for absolute paths and paths that leave base_dir, or
+    for any path when base_dir is None (specs that may not read files).
+    """
+    if base_dir is None:
+        raise SpecError(f"{where}: data files are not allowed in this spec")
+    if os.path.isabs(item) or os.path.splitdrive(item)[0]:
+        raise SpecError(f"{where}: {item!r} must be relative to the spec's directory")
+    path = os.path.abspath(os.path.join(base_dir, item))
+    if not _inside(path, base_dir):
+        raise SpecError(f"{where}: {item!r} is outside the spec's directory")
+    return path
+
+
+def _inside(path, base_dir):
+    """Whether path, with symlinks resolved, lies under base_dir."""
+    root = os.path.realpath(base_dir or os.curdir)
+    return os.path.commonpath([root, os.path.realpath(path)]) == root
+
+
+def _resolve_paths(value, base_dir, where, globs):
+    """Absolute file paths for a list of paths and glob patterns; records each pattern's matches."""
+    _check_strings(value, where)
+    paths = []
+    for item in value:
+        path = _spec_path(item, base_dir, where)
+        if glob.has_magic(item):
+            globs[path] = _expand_pattern(path)
+            outside = [match for match in globs[path] if not _inside(match, base_dir)]
+            if outside:
+                raise SpecError(f"{where}: {item!r} matches {outside[0]!r}, outside the spec's directory")
+            if not globs[path]:
+                raise SpecError(f"{where}: no files match {item!r}")
+            paths.extend(globs[path])
+        elif os.path.isfile(path):
+            paths.append(path)
+        else:
+            raise SpecError(f"{where}: no such file {item!r}")
+    return paths
+
+
+def _storyboard_pages(step, where):
+    """Split a storyboard step into one step per page of frames."""
+    kwargs = step["kwargs"]
+    per_page = kwargs.get("columns", STORYBOARD_COLUMNS) * kwargs.get("rows", STORYBOARD_ROWS)
+    frames = kwargs["frames"]
+    captions = kwargs.get("captions")
+    if captions is not None and len(captions) != len(frames):
+        raise SpecError(f"{where}.captions: {len(captions)} captions for {len(frames)} frames")
+    pages = []
+    for start in range(0, len(frames), per_page):
+        page = dict(kwargs, frames=frames[start:start + per_page])
+        if captions is not None:
+            page["captions"] = captions[start:start + per_page]
+        if len(frames) > per_page:
+            page["title"] = f"{kwargs['title']} ({start // per_page + 1}/{math.ceil(len(frames) / per_page)})"
+        pages.append(dict(step, kwargs=page, inputs=page["frames"]))
+    return pages
+
+
+def validate_spec(spec, base_dir=""):
+    """Validate a parsed spec and compile it into a plan of helper calls.
+
+    Data file paths are resolved against base_dir (default: the current
+    directory) and must stay inside it. With base_dir None, slides that read
+    files are rejected.
+    """
+    if not isinstance(spec, dict):
+        raise SpecError("spec: expected an object at top level")
+    slides = spec.get("slides")
+    if not isinstance(slides, list) or not slides:
+        raise SpecError("spec.slides: expected a non-empty list")
+    output = spec.get("output")
+    if output is not None and not isinstance(output, str):
+        raise SpecError("spec.output: expected a string")
+
+    steps = []
+    globs = {}
+    for i, slide in enumerate(slides):
+        where = f"slides[{i}]"
+        if not isinstance(slide, dict):
+            raise SpecError(f"{where}: expected an object")
+        slide_type = slide.get("type")
+        if slide_type not in SLIDE_TYPES:
+            raise SpecError(f"{where}.type: unknown slide type {slide_type!r} "
+                            f"(expected one of {', '.join(sorted(SLIDE_TYPES))})")
+        helper, fields = SLIDE_TYPES[slide_type]
+
+        known = COMMON_FIELDS | {field for field, _, _, _ in fields}
+        unknown = sorted(set(slide) - known)
+        if unknown:
+            raise SpecError(f"{where}: unknown field(s) {', '.join(unknown)} for {slide_type!r} slide")
+
+        kwargs = {}
+        inputs = []
+        for field, argument, kind, required in fields:
+            if field not in slide:
+                if required:
+                    raise SpecError(f"{where}.{field}: required for {slide_type!r} slide")
+                continue
+            value = slide[field]
+            if kind is list:
+                _check_strings(value, f"{where}.{field}")
+            elif kind == "paths":
+                value = _resolve_paths(value, base_dir, f"{where}.{field}", globs)
+            elif kind is int:
+                if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                    raise SpecError(f"{where}.{field}: expected a positive integer")
+            elif not isinstance(value, str):
+                raise SpecError(f"{where}.{field}: expected a string")
+            if kind == "path":
+                value = _spec_path(value, base_dir, f"{where}.{field}")
+                if not os.path.isfile(value):
+                    raise SpecError(f"{where}.{field}: no such file {slide[field]!r}")
+                inputs.append(value)
+            kwargs[argument] = value
+        if slide_type == "chart" and kwargs.get("chart", "line") not in CHART_TYPES:
+            raise SpecError(f"{where}.chart: expected one of {', '.join(sorted(CHART_TYPES))}")
+
+        footnote = slide.get("footnote")
+        if footnote is not None and not isinstance(footnote, str):
+            raise SpecError(f"{where}.footnote: expected a string")
+        claims = slide.get("claims")
+        if claims is not None:
+            _check_strings(claims, f"{where}.claims")
+
+        step = {"helper": helper, "kwargs": kwargs, "footnote": footnote, "claims": claims}
+        if inputs:
+            step["inputs"] = inputs
+        if slide_type == "storyboard":
+            steps.extend(_storyboard_pages(step, where))
+        else:
+            steps.append(step)
+
+    plan = {"version": COMPILER_VERSION, "output": output, "slides": steps,
+            "variants": validate_variants(spec.get("variants", []))}
+    if globs:
+        plan["globs"] = globs
+    return plan
+
+
+def validate_variants(variants):
+    """Validate the optional list of deck variants."""
+    if not isinstance(variants, list):
+        raise SpecError("spec.variants: expected a list")
+    names = set()
+    compiled = []
+    for i, variant in enumerate(variants):
+        where = f"variants[{i}]"
+        if not isinstance(variant, dict):
+            raise SpecError(f"{where}: expected an object")
+        unknown = sorted(set(variant) - {"name", "output", "theme", "footnotes", "claims"})
+        if unknown:
+            raise SpecError(f"{where}: unknown field(s) {', '.join(unknown)}")
+        name = variant.get("name")
+        if not isinstance(name, str) or not name:
+            raise SpecError(f"{where}.name: required string")
+        if name in names:
+            raise SpecError(f"{where}.name: duplicate variant {name!r}")
+        names.add(name)
+        output = variant.get("output", f"{name}.pptx")
+        if not isinstance(output, str):
+            raise SpecError(f"{where}.output: expected a string")
+        theme = variant.get("theme", "light")
+        if theme not in THEMES:
+            raise SpecError(f"{where}.theme: expected one of {', '.join(THEMES)}")
+        footnotes = variant.get("footnotes", True)
+        if not isinstance(footnotes, bool):
+            raise SpecError(f"{where}.footnotes: expected true or false")
+        claims = variant.get("claims")
+        if claims is not None and not isinstance(claims, str):
+            raise SpecError(f"{where}.claims: expected a string")
+        compiled.append({"name": name, "output": output, "theme": theme,
+                         "footnotes": footnotes, "claims": claims})
+    return compiled
+
+
+def compile_spec(path, use_cache=True):
+    """Load a spec file and return its compiled plan, using the plan cache."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    # Data paths in the plan are resolved against the spec's directory, so it is part of the key
+    key = spec_hash(raw + b"\0" + os.path.dirname(os.path.abspath(path)).encode())
+    cache_file = os.path.join(CACHE_DIR, f"{key}.json")
+
+    if use_cache and os.path.exists(cache_file):
+        with open(cache_file, encoding="utf-8") as f:
+            plan = json.load(f)
+        if all(_expand_pattern(pattern) == matches for pattern, matches in plan.get("globs", {}).items()):
+            return plan
+
+    try:
+        spec = parse_spec(raw, path)
+    except ValueError as exc:
+        raise SpecError(f"{path}: {exc}") from exc
+    plan = validate_spec(spec, os.path.dirname(path))
+    if plan["output"] is None:
+        plan["output"] = os.path.splitext(os.path.basename(path))[0] + ".pptx"
+
+    if use_cache:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(plan, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    return plan
+
+
+def new_presentation():
+    """Create an empty 10x7.5 in presentation from the cached base template."""
+    return template_cache.new_presentation()
+
+
+def build_slide(prs, step):
+    """Run one compiled plan step against a presentation."""
+    module, _, name = step["helper"].rpartition(".")
+    slide = getattr(HELPER_MODULES[module], name)(prs, **step["kwargs"])
+    if step["footnote"]:
+        helpers.add_source_footnote(slide, step["footnote"])
+    return slide
+
+
+def build_deck(plan, prs=None):
+    """Build a presentation from a compiled plan."""
+    if prs is None:
+        prs = new_presentation()
+    prefetch_images(plan["slides"])
+    for step in plan["slides"]:
+        build_slide(prs, step)
+    return prs
+
+
+def main():
+    """Compile and build one or more deck specs."""
+    parser = argparse.ArgumentParser(description="Build PowerPoint decks from JSON/YAML specs.")
+    parser.add_argument("specs", nargs="+", help="deck spec files (.json, .yaml, .yml)")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and don't write the plan cache")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.specs:
+        try:
+            plan = compile_spec(path, use_cache=not args.no_cache)
+        except (OSError, SpecError) as exc:
+            print(f"✗ {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        prs = build_deck(plan)
+        output_file = plan["output"]
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+            output_file = os.path.join(args.output_dir, os.path.basename(output_file))
+        prs.save(output_file)
+        print(f"✓ {path} → {output_file} ({len(prs.slides)} slides)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Streaming deck output with bounded memory.
+
+prs.save() needs every slide alive in one Presentation, so memory grows with
+slide count. StreamingDeck instead runs each slide builder against a scratch
+presentation, writes the resulting slide part (and the parts it relates to:
+pictures, charts and their embedded workbooks) straight into the output zip, then removes the slide from the scratch deck so
+its python-pptx objects can be freed. Only the slide count and the list of
+written parts are kept until close, when the manifests are written.
+
+    with StreamingDeck("storyboard.pptx") as deck:
+        for frame in frames:
+            deck.add(create_content_slide, frame.title, frame.items)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import deck_spec
+import template_cache
+from deck_package import PackageWriter, package_parts, slide_parts
+
+_base_parts = None
+
+
+def base_parts():
+    """Parts of the empty base package streamed decks are written on."""
+    global _base_parts
+    if _base_parts is None:
+        _base_parts = package_parts(template_cache.new_presentation())
+    return _base_parts
+
+
+class StreamingDeck:
+    """Write slides to a PPTX file one at a time as they are built."""
+
+    def __init__(self, file, **writer_kwargs):
+        self._scratch = template_cache.new_presentation()
+        self._writer = PackageWriter(file, base_parts(), **writer_kwargs)
+
+    @property
+    def slide_count(self):
+        return self._writer.slide_count
+
+    def add(self, builder, *args, **kwargs):
+        """Run builder(prs, *args, **kwargs), which must return the new slide, and stream it out."""
+        slide = builder(self._scratch, *args, **kwargs)
+        self._write_slide(slide)
+        self._discard(slide)
+        return self.slide_count
+
+    def add_parts(self, slide_xml, rels_xml):
+        """Stream an already serialized slide, such as one from the slide cache."""
+        return self._writer.add_slide(slide_xml, rels_xml)
+
+    def add_step(self, step):
+        """Stream one compiled deck-spec plan step."""
+        return self.add(deck_spec.build_slide, step)
+
+    def _write_slide(self, slide):
+        # Related parts get content-addressed names, so the writer adds each distinct one once
+        self._writer.add_slide(*slide_parts(slide))
+
+    def _discard(self, slide):
+        """Remove a streamed slide from the scratch deck so it can be freed."""
+        slides = self._scratch.slides
+        for sld_id in list(slides._sldIdLst):
+            if self._scratch.part.related_part(sld_id.rId) is slide.part:
+                slides._sldIdLst.remove(sld_id)
+                self._scratch.part.drop_rel(sld_id.rId)
+                break
+
+    def close(self):
+        """Write the manifests and finish the file."""
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def build_deck_streaming(plan, file):
+    """Stream a compiled deck-spec plan to a file; returns the slide count."""
+    with StreamingDeck(file) as deck:
+        for step in plan["slides"]:
+            deck.add_step(step)
+        return deck.slide_count
+
+
+def main():
+    """Build one or more deck specs with the streaming writer."""
+    parser = argparse.ArgumentParser(description="Build decks from specs with bounded memory.")
+    parser.add_argument("specs", nargs="+", help="deck spec files (.json, .yaml, .yml)")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    args = parser.parse_args()
+
+    failures = 0
+    for path in args.specs:
+        start = time.perf_counter()
+        try:
+            plan = deck_spec.compile_spec(path)
+        except (OSError, deck_spec.SpecError) as exc:
+            print(f"✗ {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        output_file = plan["output"]
+        if args.output_dir:
+            os.makedirs(args.output_dir, exist_ok=True)
+            output_file = os.path.join(args.output_dir, os.path.basename(output_file))
+        count = build_deck_streaming(plan, output_file)
+        elapsed = time.perf_counter() - start
+        print(f"✓ {path} → {output_file} ({count} slides, {elapsed:.2f}s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+Shared colour palette and precomputed paragraph style registry.
+
+Setting p.font.size / p.font.bold / p.font.color.rgb one at a time goes
+through several python-pptx proxies and builds new Pt/RGBColor objects for
+every paragraph. A registered style instead builds its paragraph-property
+XML (<a:pPr> with alignment, spacing and the <a:defRPr> run defaults) once;
+applying it copies that element onto a paragraph. The XML is identical to
+what the property setters produce.
+"""
+
+import copy
+import re
+from xml.sax.saxutils import escape
+
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+# --- Colours ---------------------------------------------------------------
+
+# Light decks
+ACCENT_BLUE = (3, 105, 161)
+FOOTNOTE_GREY = (100, 100, 100)
+
+# Dark deck (matches the HTML design)
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+NEON = (204, 255, 0)
+CARD = (30, 30, 30)
+SCENE_FILL = (40, 40, 40)
+BORDER = (60, 60, 60)
+LABEL_GREY = (100, 100, 100)
+MUTED = (120, 120, 120)
+BODY_GREY = (180, 180, 180)
+BODY_LIGHT = (200, 200, 200)
+DRIFT_RED = (239, 68, 68)
+DRIFT_ORANGE = (251, 146, 60)
+
+# Dark rendering of the light decks: background, default text colour and the
+# light-deck colours to swap
+DARK_THEME = {
+    "background": BLACK,
+    "text": WHITE,
+    "colors": {ACCENT_BLUE: NEON, FOOTNOTE_GREY: MUTED},
+}
+
+# --- Styles ----------------------------------------------------------------
+
+_ALIGNMENTS = {
+    PP_ALIGN.LEFT: "l",
+    PP_ALIGN.CENTER: "ctr",
+    PP_ALIGN.RIGHT: "r",
+    PP_ALIGN.JUSTIFY: "just",
+}
+
+# Children of a:pPr that must follow a:spcAft / a:defRPr
+_SPCAFT_SUCCESSORS = ("a:buClrTx", "a:buClr", "a:buSzTx", "a:buSzPct", "a:buSzPts", "a:buFontTx",
+                      "a:buFont", "a:buNone", "a:buAutoNum", "a:buChar", "a:buBlip", "a:tabLst",
+                      "a:defRPr", "a:extLst")
+_DEFRPR_SUCCESSORS = ("a:extLst",)
+
+
+class ParagraphStyle:
+    """Paragraph properties built once as an <a:pPr> element."""
+
+    __slots__ = ("name", "pPr", "xml")
+
+    def __init__(self, name, size=None, bold=None, italic=None, color=None, alignment=None,
+                 space_after=None):
+        self.name = name
+        attrs = f' algn="{_ALIGNMENTS[alignment]}"' if alignment is not None else ""
+        spacing = (f'<a:spcAft><a:spcPts val="{space_after * 100}"/></a:spcAft>'
+                   if space_after is not None else "")
+        run_attrs = ""
+        if size is not None:
+            run_attrs += f' sz="{int(size * 100)}"'
+        if bold is not None:
+            run_attrs += f' b="{int(bool(bold))}"'
+        if italic is not None:
+            run_attrs += f' i="{int(bool(italic))}"'
+        fill = (f'<a:solidFill><a:srgbClr val="{"%02X%02X%02X" % tuple(color)}"/></a:solidFill>'
+                if color is not None else "")
+        run_props = f"<a:defRPr{run_attrs}>{fill}</a:defRPr>" if fill else f"<a:defRPr{run_attrs}/>"
+        self.xml = f"<a:pPr{attrs}>{spacing}{run_props}</a:pPr>"
+        self.pPr = parse_xml(self.xml.replace("<a:pPr", f'<a:pPr {nsdecls("a")}', 1))
+
+    def apply(self, paragraph):
+        """Apply this style to a python-pptx paragraph (or a raw a:p element)."""
+        p = getattr(paragraph, "_p", paragraph)
+        pPr = p.pPr
+        if pPr is None:
+            p.insert(0, copy.deepcopy(self.pPr))
+            return
+        for key, value in self.pPr.attrib.items():
+            pPr.set(key, value)
+        for child in self.pPr:
+            for old in pPr.findall(child.tag):
+                pPr.remove(old)
+            successors = _DEFRPR_SUCCESSORS if child.tag.endswith("}defRPr") else _SPCAFT_SUCCESSORS
+            pPr.insert_element_before(copy.deepcopy(child), *successors)
+
+    def __repr__(self):
+        return f"ParagraphStyle({self.name!r})"
+
+
+STYLES = {}
+
+
+def register_style(name, **props):
+    """Build and register a named paragraph style."""
+    STYLES[name] = ParagraphStyle(name, **props)
+    return STYLES[name]
+
+
+def get_style(name):
+    """Look up a registered style by name."""
+    try:
+        return STYLES[name]
+    except KeyError:
+        raise KeyError(f"unknown paragraph style {name!r}") from None
+
+
+_anonymous = {}
+
+
+def text_style(size, bold=None, italic=None, color=None, alignment=None, space_after=None):
+    """Cached unnamed style for ad-hoc property combinations."""
+    key = (size, bold, italic, color, alignment, space_after)
+    style = _anonymous.get(key)
+    if style is None:
+        style = _anonymous[key] = ParagraphStyle(None, size=size, bold=bold, italic=italic, color=color,
+                                                 alignment=alignment, space_after=space_after)
+    return style
+
+
+def apply_style(paragraph, style):
+    """Apply a style (or registered style name) to one paragraph."""
+    (get_style(style) if isinstance(style, str) else style).apply(paragraph)
+
+
+_LINE_BREAKS = re.compile("\n|\v")
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def _escape_ctrl(match):
+    return "_x%04X_" % ord(match.group(1))
+
+
+def _runs_xml(text):
+    """Runs and line breaks for one paragraph, as python-pptx's p.text setter writes them."""
+    parts = []
+    for index, run_text in enumerate(_LINE_BREAKS.split(text)):
+        if index:
+            parts.append("<a:br/>")
+        if run_text:
+            parts.append(f"<a:r><a:t>{escape(_CTRL_CHARS.sub(_escape_ctrl, run_text))}</a:t></a:r>")
+    return "".join(parts)
+
+
+def add_paragraphs(text_frame, lines, style):
+    """Append one styled paragraph per line to a text frame.
+
+    The whole paragraph list is rendered as one XML string and parsed in a
+    single lxml call, instead of going through add_paragraph() and the
+    text/font proxies for every line.
+    """
+    style = get_style(style) if isinstance(style, str) else style
+    paragraphs = "".join(f"<a:p>{style.xml}{_runs_xml(line)}</a:p>" for line in lines)
+    if paragraphs:
+        fragment = parse_xml(f'<a:txBody {nsdecls("a")}>{paragraphs}</a:txBody>')
+        text_frame._txBody.extend(list(fragment))
+
+
+# Light decks
+register_style("light-bullet", size=16)
+register_style("light-bullet-large", size=18)
+register_style("light-title", size=32, bold=True)
+register_style("light-title-accent", size=32, bold=True, color=ACCENT_BLUE)
+register_style("light-column", size=14, space_after=12)
+register_style("light-caption", size=10)
+register_style("light-subtext", size=18, alignment=PP_ALIGN.CENTER)
+register_style("light-headline-accent", size=44, bold=True, color=ACCENT_BLUE, alignment=PP_ALIGN.CENTER)
+register_style("light-closing-accent", size=60, bold=True, color=ACCENT_BLUE, alignment=PP_ALIGN.CENTER)
+register_style("light-closing-line", size=16, alignment=PP_ALIGN.CENTER)
+register_style("footnote-grey", size=10, color=FOOTNOTE_GREY)
+
+# Dark deck
+register_style("dark-scene-sharp", size=10, bold=True, color=DRIFT_RED, alignment=PP_ALIGN.CENTER)
+register_style("dark-scene-drifted", size=9, bold=True, italic=True, color=DRIFT_ORANGE,
+               alignment=PP_ALIGN.CENTER)
+register_style("dark-badge", size=14, bold=True, color=BLACK)
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+PNG thumbnails and contact sheets for generated decks, without an office suite.
+
+Rasterizes slide XML directly with Pillow (already installed as a
+python-pptx dependency) for the shapes the generator scripts emit: text
+boxes and placeholders, rectangles (add_shape(1, ...)), rounded rectangles,
+ovals (add_shape(9, ...)), solid slide backgrounds from set_slide_background,
+and solid or dashed borders. Placeholder geometry is inherited from the
+slide layout or master. Anything else is drawn as its bounding box.
+
+Thumbnails are cached under .deck_cache/thumbs/ by a hash of the slide XML
+(plus its layout and the render size) and rendered across a worker pool.
+
+    python deck_thumbnails.py CharacterLock_Dark_Theme.pptx -o thumbs/
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import posixpath
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+from PIL import Image, ImageDraw, ImageFont
+
+# Bump whenever rendering changes, so cached thumbnails are redrawn
+RENDERER_VERSION = 1
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".deck_cache", "thumbs")
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+EMU_PER_INCH = 914400
+EMU_PER_POINT = 12700
+
+DEFAULT_TEXT = (0, 0, 0)
+DEFAULT_SHAPE_FILL = (79, 129, 189)  # theme accent1, used when an autoshape keeps its style fill
+DEFAULT_SIZES = {"title": 44, "ctrTitle": 44, "subTitle": 32, "body": 28}
+DEFAULT_BODY_PR = {"lIns": 91440, "tIns": 45720, "rIns": 91440, "bIns": 45720}
+ALIGN = {"l": "left", "ctr": "center", "r": "right", "just": "left"}
+
+
+# --- Package reading -------------------------------------------------------
+
+def _resolve(base_part, target):
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base_part), target))
+
+
+def _rels(zf, part):
+    rels_name = posixpath.join(posixpath.dirname(part), "_rels", posixpath.basename(part) + ".rels")
+    try:
+        root = etree.fromstring(zf.read(rels_name))
+    except KeyError:
+        return {}
+    return {rel.get("Id"): (rel.get("Type").rsplit("/", 1)[-1], _resolve(part, rel.get("Target")))
+            for rel in root.iterfind("pr:Relationship", NS) if rel.get("TargetMode") != "External"}
+
+
+def read_slides(path):
+    """Return (slide size in EMU, [(slide XML, layout XML, master XML)]) in deck order."""
+    with zipfile.ZipFile(path) as zf:
+        presentation = etree.fromstring(zf.read("ppt/presentation.xml"))
+        size = presentation.find("p:sldSz", NS)
+        slide_size = (int(size.get("cx")), int(size.get("cy")))
+        pres_rels = _rels(zf, "ppt/presentation.xml")
+        slides = []
+        parsed = {}
+        for sld_id in presentation.iterfind("p:sldIdLst/p:sldId", NS):
+            slide_part = pres_rels[sld_id.get(f"{{{NS['r']}}}id")][1]
+            layout_part = next((t for kind, t in _rels(zf, slide_part).values() if kind == "slideLayout"), None)
+            master_part = None
+            if layout_part:
+                master_part = next((t for kind, t in _rels(zf, layout_part).values() if kind == "slideMaster"),
+                                   None)
+            for part in (layout_part, master_part):
+                if part and part not in parsed:
+                    parsed[part] = zf.read(part)
+            slides.append((zf.read(slide_part), parsed.get(layout_part, b""), parsed.get(master_part, b"")))
+    return slide_size, slides
+
+
+# --- Rendering -------------------------------------------------------------
+
+_fonts = {}
+
+
+def get_font(px, bold=False):
+    """Truetype font at a pixel size, falling back to Pillow's bundled font."""
+    key = (px, bold)
+    if key not in _fonts:
+        name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+        try:
+            _fonts[key] = ImageFont.truetype(name, px)
+        except OSError:
+            _fonts[key] = ImageFont.load_default(px)
+    return _fonts[key]
+
+
+def _rgb(parent):
+    """Colour of an a:solidFill child (srgbClr only), or None."""
+    if parent is None:
+        return None
+    color = parent.find("a:solidFill/a:srgbClr", NS)
+    if color is None:
+        return None
+    val = color.get("val")
+    return tuple(int(val[i:i + 2], 16) for i in (0, 2, 4))
+
+
+# Where the transform lives for shapes, pictures and connectors; groups; graphic frames
+_XFRM_PATHS = ("p:spPr/a:xfrm", "p:grpSpPr/a:xfrm", "p:xfrm")
+
+
+def _placeholder(sp):
+    return sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+
+
+def _find_placeholder(root, ph):
+    if root is None:
+        return None
+    idx, ph_type = ph.get("idx"), ph.get("type", "body")
+    candidates = [(s, _placeholder(s)) for s in root.iterfind(".//p:sp", NS) if _placeholder(s) is not None]
+    for sp, other in candidates:
+        if idx is not None and other.get("idx") == idx:
+            return sp
+    for sp, other in candidates:
+        other_type = other.get("type", "body")
+        if other_type == ph_type or {other_type, ph_type} <= {"title", "ctrTitle"}:
+            return sp
+    return None
+
+
+def inherited_shapes(sp, layout, master):
+    """The shape, then for placeholders the layout and master shapes it inherits from."""
+    shapes = [sp]
+    ph = _placeholder(sp)
+    if ph is not None:
+        layout_sp = _find_placeholder(layout, ph)
+        shapes.append(layout_sp)
+        shapes.append(_find_placeholder(master, _placeholder(layout_sp) if layout_sp is not None else ph))
+    return [shape for shape in shapes if shape is not None]
+
+
+def shape_geometry(sp, layout, master, sources=None):
+    """(x, y, cx, cy) in EMU of any shape element, following placeholder inheritance."""
+    if sources is None:
+        sources = inherited_shapes(sp, layout, master)
+    for source in sources:
+        xfrm = next((x for x in (source.find(path, NS) for path in _XFRM_PATHS) if x is not None), None)
+        if xfrm is not None:
+            off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+            return int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy"))
+    return None
+
+
+def _dashed(draw, points, color, width, dash):
+    """Draw a dashed polyline."""
+    on = True
+    remaining = dash
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        length = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+        pos = 0.0
+        while pos < length:
+            step = min(remaining, length - pos)
+            if on:
+                t0, t1 = pos / length, (pos + step) / length
+                draw.line([(x0 + (x1 - x0) * t0, y0 + (y1 - y0) * t0),
+                           (x0 + (x1 - x0) * t1, y0 + (y1 - y0) * t1)], fill=color, width=width)
+            pos += step
+            remaining -= step
+            if remaining <= 0:
+                on, remaining = not on, dash
+
+
+def _outline_points(geom, box, steps=48):
+    x0, y0, x1, y1 = box
+    if geom == "ellipse":
+        cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+        return [(cx + rx * math.cos(2 * math.pi * i / steps), cy + ry * math.sin(2 * math.pi * i / steps))
+                for i in range(steps + 1)]
+    return [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+
+
+def _wrap(text, font, width):
+    if width is None:
+        return [text]
+    lines, line = [], ""
+    for word in text.split(" "):
+        candidate = f"{line} {word}" if line else word
+        if line and font.getlength(candidate) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    lines.append(line)
+    return lines
+
+
+def _draw_text(draw, sp, box, scale, layout, master):
+    tx_body = sp.find("p:txBody", NS)
+    if tx_body is None:
+        return
+    body_pr = tx_body.find("a:bodyPr", NS)
+    attrs = dict(DEFAULT_BODY_PR)
+    anchor = "t"
+    wrap = True
+    ph = _placeholder(sp)
+    default_size = DEFAULT_SIZES.get(ph.get("type", "body"), 18) if ph is not None else 18
+    if ph is not None:
+        inherited = _find_placeholder(layout, ph)
+        inherited_pr = inherited.find("p:txBody/a:bodyPr", NS) if inherited is not None else None
+        if inherited_pr is not None:
+            anchor = inherited_pr.get("anchor", anchor)
+    if body_pr is not None:
+        anchor = body_pr.get("anchor", anchor)
+        wrap = body_pr.get("wrap", "square") != "none"
+        for key in attrs:
+            attrs[key] = int(body_pr.get(key, attrs[key]))
+
+    x0, y0, x1, y1 = box
+    left, top = x0 + attrs["lIns"] * scale, y0 + attrs["tIns"] * scale
+    right, bottom = x1 - attrs["rIns"] * scale, y1 - attrs["bIns"] * scale
+    px_per_pt = EMU_PER_POINT * scale
+
+    lines = []  # (text, font, colour, alignment, line height)
+    for p in tx_body.iterfind("a:p", NS):
+        p_pr = p.find("a:pPr", NS)
+        def_rpr = p_pr.find("a:defRPr", NS) if p_pr is not None else None
+        run_pr = p.find("a:r/a:rPr", NS)
+        props = [e for e in (run_pr, def_rpr) if e is not None]
+        size = next((int(e.get("sz")) / 100 for e in props if e.get("sz")), default_size)
+        bold = next((e.get("b") == "1" for e in props if e.get("b")), False)
+        color = next((c for c in map(_rgb, props) if c), DEFAULT_TEXT)
+        align = ALIGN.get(p_pr.get("algn", "l") if p_pr is not None else "l", "left")
+        font = get_font(max(1, round(size * px_per_pt)), bold)
+        text = "".join("\n" if child.tag == f"{{{NS['a']}}}br" else "".join(child.itertext())
+                       for child in p if child.tag in (f"{{{NS['a']}}}r", f"{{{NS['a']}}}br"))
+        for segment in text.split("\n"):
+            for line in _wrap(segment, font, (right - left) if wrap else None):
+                lines.append((line, font, color, align, size * 1.2 * px_per_pt))
+        spc_aft = p_pr.find("a:spcAft/a:spcPts", NS) if p_pr is not None else None
+        if spc_aft is not None and lines:
+            text, font, color, align, height = lines[-1]
+            lines[-1] = (text, font, color, align, height + int(spc_aft.get("val")) / 100 * px_per_pt)
+
+    total = sum(line[4] for line in lines)
+    y = {"ctr": (top + bottom - total) / 2, "b": bottom - total}.get(anchor, top)
+    for text, font, color, align, height in lines:
+        if text:
+            width = font.getlength(text)
+            x = {"center": (left + right - width) / 2, "right": right - width}.get(align, left)
+            draw.text((x, y), text, font=font, fill=color)
+        y += height
+
+
+def render_slide(slide_xml, layout_xml, master_xml, slide_size, width):
+    """Rasterize one slide to a PIL image `width` pixels wide."""
+    scale = width / slide_size[0]
+    height = max(1, round(slide_size[1] * scale))
+    slide = etree.fromstring(slide_xml)
+    layout = etree.fromstring(layout_xml) if layout_xml else None
+    master = etree.fromstring(master_xml) if master_xml else None
+
+    background = _rgb(slide.find("p:cSld/p:bg/p:bgPr", NS)) or (255, 255, 255)
+    image = Image.new("RGB", (width, height), background)
+    draw = ImageDraw.Draw(image)
+
+    for sp in slide.iterfind("p:cSld/p:spTree//p:sp", NS):
+        geometry = shape_geometry(sp, layout, master)
+        if geometry is None:
+            continue
+        x, y, cx, cy = (value * scale for value in geometry)
+        box = (x, y, x + cx, y + cy)
+        sp_pr = sp.find("p:spPr", NS)
+        prst = sp_pr.find("a:prstGeom", NS) if sp_pr is not None else None
+        geom = prst.get("prst") if prst is not None else "rect"
+
+        fill = _rgb(sp_pr)
+        if fill is None and sp_pr is not None and sp_pr.find("a:noFill", NS) is None \
+                and sp.find("p:style", NS) is not None:
+            fill = DEFAULT_SHAPE_FILL
+        ln = sp_pr.find("a:ln", NS) if sp_pr is not None else None
+        line_color = None
+        line_width = 1
+        dashed = False
+        if ln is not None and ln.find("a:noFill", NS) is None:
+            line_color = _rgb(ln) or (sp.find("p:style", NS) is not None and (56, 93, 138)) or None
+            line_width = max(1, round(int(ln.get("w", EMU_PER_POINT)) * scale))
+            dash = ln.find("a:prstDash", NS)
+            dashed = dash is not None and dash.get("val") != "solid"
+        elif ln is None and sp.find("p:style", NS) is not None:
+            line_color = (56, 93, 138)
+
+        if fill is None:
+            pass  # Pillow outlines unfilled shapes in white by default
+        elif geom == "ellipse":
+            draw.ellipse(box, fill=fill)
+        elif geom == "roundRect":
+            draw.rounded_rectangle(box, radius=min(cx, cy) * 0.1667, fill=fill)
+        else:
+            draw.rectangle(box, fill=fill)
+        if line_color:
+            if dashed:
+                _dashed(draw, _outline_points(geom, box), line_color, line_width, dash=max(3, line_width * 3))
+            elif geom == "ellipse":
+                draw.ellipse(box, outline=line_color, width=line_width)
+            else:
+                draw.rectangle(box, outline=line_color, width=line_width)
+
+        _draw_text(draw, sp, box, scale, layout, master)
+    return image
+
+
+# --- Caching, pool and contact sheet ---------------------------------------
+
+def thumbnail_key(slide_xml, layout_xml, master_xml, slide_size, width):
+    digest = hashlib.sha256(f"thumb/{RENDERER_VERSION}/{slide_size}/{width}\n".encode())
+    digest.update(hashlib.sha256(layout_xml).digest())
+    digest.update(hashlib.sha256(master_xml or b"").digest())
+    digest.update(slide_xml)
+    return digest.hexdigest()
+
+
+def _render_to_cache(args):
+    slide_xml, layout_xml, master_xml, slide_size, width, cache_path = args
+    image = render_slide(slide_xml, layout_xml, master_xml, slide_size, width)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    image.save(tmp_path, format="PNG")
+    os.replace(tmp_path, cache_path)
+    return cache_path
+
+
+def render_deck(path, width=320, jobs=None, cache_dir=CACHE_DIR, pool=None):
+    """Return one cached thumbnail path per slide, rendering only uncached slides."""
+    slide_size, slides = read_slides(path)
+    paths, tasks = [], []
+    for slide_xml, layout_xml, master_xml in slides:
+        key = thumbnail_key(slide_xml, layout_xml, master_xml, slide_size, width)
+        cache_path = os.path.join(cache_dir, key[:2], f"{key}.png")
+        paths.append(cache_path)
+        if not os.path.exists(cache_path):
+            tasks.append((slide_xml, layout_xml, master_xml, slide_size, width, cache_path))
+    if len(tasks) > 1:
+        if pool is not None:
+            list(pool.map(_render_to_cache, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(_render_to_cache, tasks))
+    else:
+        for task in tasks:
+            _render_to_cache(task)
+    return paths, len(tasks)
+
+
+def contact_sheet(thumbnails, columns=4, gap=12, label_height=18, background=(235, 235, 235)):
+    """Lay thumbnails out in a numbered grid."""
+    images = [Image.open(path) for path in thumbnails]
+    if not images:
+        return Image.new("RGB", (1, 1), background)
+    cell_w = max(image.width for image in images)
+    cell_h = max(image.height for image in images) + label_height
+    columns = max(1, min(columns, len(images)))
+    rows = (len(images) + columns - 1) // columns
+    sheet = Image.new("RGB", (gap + columns * (cell_w + gap), gap + rows * (cell_h + gap)), background)
+    draw = ImageDraw.Draw(sheet)
+    font = get_font(12)
+    for index, image in enumerate(images):
+        col, row = index % columns, index // columns
+        x, y = gap + col * (cell_w + gap), gap + row * (cell_h + gap)
+        sheet.paste(image, (x, y))
+        draw.rectangle((x - 1, y - 1, x + image.width, y + image.height), outline=(180, 180, 180))
+        draw.text((x, y + image.height + 3), f"{index + 1}", font=font, fill=(60, 60, 60))
+        image.close()
+    return sheet
+
+
+def main():
+    """Render thumbnails and a contact sheet for each deck."""
+    parser = argparse.ArgumentParser(description="Render PNG thumbnails and contact sheets for decks.")
+    parser.add_argument("decks", nargs="+", help=".pptx files")
+    parser.add_argument("-o", "--output-dir", default="thumbnails", help="output directory")
+    parser.add_argument("--width", type=int, default=320, help="thumbnail width in pixels")
+    parser.add_argument("--columns", type=int, default=4, help="contact sheet columns")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for deck in args.decks:
+            name = os.path.splitext(os.path.basename(deck))[0]
+            thumbnails, rendered = render_deck(deck, args.width, pool=pool)
+            deck_dir = os.path.join(args.output_dir, name)
+            os.makedirs(deck_dir, exist_ok=True)
+            for index, cached in enumerate(thumbnails, 1):
+                with open(cached, "rb") as src, open(os.path.join(deck_dir, f"slide-{index:02d}.png"), "wb") as dst:
+                    dst.write(src.read())
+            sheet_path = os.path.join(args.output_dir, f"{name}-contact.png")
+            contact_sheet(thumbnails, args.columns).save(sheet_path)
+            print(f"✓ {deck}: {len(thumbnails)} slides ({rendered} rendered, "
+                  f"{len(thumbnails) - rendered} cached) → {sheet_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Opt-in tracing for deck builds, with Chrome trace and flamegraph export.
+
+Records nested spans deck → slide → helper → phase, where a phase is one of
+the python-pptx operations the helpers spend their time in:
+
+    add_slide   Slides.add_slide
+    shapes      add_textbox / add_shape / add_picture / add_chart
+    text        setting text, adding or clearing paragraphs, deck_styles.add_paragraphs
+    styling     fonts, colours, fills, lines, alignment and spacing, deck_styles.apply_style
+    save        Presentation.save
+
+The deck_styles functions are also replaced in every loaded module that
+imported them by name.
+
+Nothing is installed until enable() is called: the helpers and python-pptx
+methods are wrapped in place and restored by disable(), so a build that never
+enables tracing runs exactly the code it would without this module. span()
+can also be used directly; while tracing is off it returns a shared no-op
+context manager.
+
+    python deck_trace.py create_presentation_v2.py --chrome trace.json --collapsed deck.folded
+    python deck_trace.py specs/characterlock_honest.json --chrome trace.json
+"""
+
+import argparse
+import functools
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from pptx.dml.color import ColorFormat
+from pptx.dml.fill import FillFormat
+from pptx.dml.line import LineFormat
+from pptx.presentation import Presentation as _Presentation
+from pptx.shapes.autoshape import Shape
+from pptx.shapes.shapetree import _BaseGroupShapes
+from pptx.slide import Slides
+from pptx.text.text import Font, TextFrame, _Paragraph
+
+import deck_styles
+
+# (class or module, attribute, phase); properties are wrapped on get and set
+PHASE_HOOKS = [
+    (Slides, "add_slide", "add_slide"),
+    (_BaseGroupShapes, "add_textbox", "shapes"),
+    (_BaseGroupShapes, "add_shape", "shapes"),
+    (_BaseGroupShapes, "add_picture", "shapes"),
+    (_BaseGroupShapes, "add_chart", "shapes"),
+    (TextFrame, "text", "text"),
+    (TextFrame, "add_paragraph", "text"),
+    (TextFrame, "clear", "text"),
+    (_Paragraph, "text", "text"),
+    (Shape, "text", "text"),
+    (_Paragraph, "font", "styling"),
+    (_Paragraph, "level", "styling"),
+    (_Paragraph, "alignment", "styling"),
+    (_Paragraph, "space_after", "styling"),
+    (TextFrame, "word_wrap", "styling"),
+    (TextFrame, "vertical_anchor", "styling"),
+    (Font, "size", "styling"),
+    (Font, "bold", "styling"),
+    (Font, "italic", "styling"),
+    (ColorFormat, "rgb", "styling"),
+    (FillFormat, "solid", "styling"),
+    (FillFormat, "background", "styling"),
+    (LineFormat, "width", "styling"),
+    (LineFormat, "dash_style", "styling"),
+    (_Presentation, "save", "save"),
+    (deck_styles, "add_paragraphs", "text"),
+    (deck_styles, "apply_style", "styling"),
+]
+
+HELPER_PREFIXES = ("create_", "add_", "set_")
+
+_enabled = False
+_stack = []     # open spans, innermost last
+_events = []    # (stack of names, category, start ns, duration ns, self ns)
+_patches = []   # (owner, attribute, original value)
+_slide_count = 0
+
+
+class _Span:
+    __slots__ = ("name", "category", "start", "child_time")
+
+    def __init__(self, name, category):
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.child_time = 0
+        _stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self.start
+        names = tuple(span.name for span in _stack)
+        _stack.pop()
+        if _stack:
+            _stack[-1].child_time += duration
+        _events.append((names, self.category, self.start, duration, duration - self.child_time))
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, category="custom"):
+    """Context manager recording a span; a shared no-op while tracing is off."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, category)
+
+
+def _in_phase():
+    return bool(_stack) and _stack[-1].category == "phase"
+
+
+def _phase_function(func, phase):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _in_phase():
+            return func(*args, **kwargs)
+        with _Span(phase, "phase"):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _phase_property(prop, phase):
+    fget = _phase_function(prop.fget, phase) if prop.fget else None
+    fset = _phase_function(prop.fset, phase) if prop.fset else None
+    return property(fget, fset, prop.fdel, prop.__doc__)
+
+
+def _open_slide_span():
+    """A helper called straight under the deck gets a slide span around it."""
+    return len(_stack) == 1 and _stack[0].category == "deck"
+
+
+def _helper_function(func):
+    creates_slide = func.__name__.startswith("create_")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _slide_count
+        if _open_slide_span():
+            if creates_slide:
+                _slide_count += 1
+            with _Span(f"slide {max(_slide_count, 1)}", "slide"):
+                with _Span(func.__name__, "helper"):
+                    return func(*args, **kwargs)
+        with _Span(func.__name__, "helper"):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _patch(owner, attribute, replacement):
+    _patches.append((owner, attribute, owner.__dict__[attribute] if isinstance(owner, type)
+                     else getattr(owner, attribute)))
+    setattr(owner, attribute, replacement)
+
+
+def instrument_module(module):
+    """Wrap a generator module's slide helpers in helper spans (requires enable())."""
+    for name, value in list(vars(module).items()):
+        if (name.startswith(HELPER_PREFIXES) and callable(value)
+                and getattr(value, "__module__", None) == module.__name__):
+            _patch(module, name, _helper_function(value))
+
+
+def enable():
+    """Install the phase hooks and start recording."""
+    global _enabled
+    if _enabled:
+        return
+    for owner, attribute, phase in PHASE_HOOKS:
+        original = owner.__dict__.get(attribute)
+        if isinstance(original, property):
+            _patch(owner, attribute, _phase_property(original, phase))
+        elif original is not None:
+            wrapper = _phase_function(original, phase)
+            _patch(owner, attribute, wrapper)
+            if not isinstance(owner, type):
+                # Helper modules bind module functions with from-imports
+                for module in list(sys.modules.values()):
+                    if module is not owner and getattr(module, "__dict__", {}).get(attribute) is original:
+                        _patch(module, attribute, wrapper)
+    _enabled = True
+
+
+def disable():
+    """Restore everything enable() and instrument_module() wrapped."""
+    global _enabled
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+    _enabled = False
+
+
+def reset():
+    """Forget all recorded spans."""
+    global _slide_count
+    _events.clear()
+    _slide_count = 0
+
+
+@contextmanager
+def deck(name):
+    """Span covering one deck build; helpers called inside get slide spans."""
+    global _slide_count
+    _slide_count = 0
+    with span(name, "deck"):
+        yield
+
+
+def chrome_trace():
+    """Recorded spans as a Chrome trace-event document (chrome://tracing, Perfetto)."""
+    pid = os.getpid()
+    events = [
+        {"name": names[-1], "cat": category, "ph": "X", "pid": pid, "tid": 0,
+         "ts": start / 1000, "dur": duration / 1000}
+        for names, category, start, duration, _ in _events
+    ]
+    events.sort(key=lambda event: (event["ts"], -event["dur"]))
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def collapsed_stacks():
+    """Recorded spans as collapsed stacks (self time in µs) for flamegraph.pl / speedscope."""
+    totals = defaultdict(int)
+    for names, _, _, _, self_time in _events:
+        totals[";".join(names)] += self_time
+    return [f"{stack} {ns // 1000}" for stack, ns in sorted(totals.items()) if ns >= 1000]
+
+
+def summary(category="helper"):
+    """Total time and call count per span name in one category, slowest first."""
+    totals = defaultdict(lambda: [0, 0])
+    for names, cat, _, duration, _ in _events:
+        if cat == category:
+            totals[names[-1]][0] += duration
+            totals[names[-1]][1] += 1
+    return sorted(((name, ns, calls) for name, (ns, calls) in totals.items()), key=lambda item: -item[1])
+
+
+def trace_target(path):
+    """Build a generator script or deck spec under tracing."""
+    name = os.path.basename(path)
+    if path.endswith((".json", ".yaml", ".yml")):
+        import deck_spec
+        plan = deck_spec.compile_spec(path)
+        instrument_module(deck_spec.helpers)
+        with deck(name):
+            prs = deck_spec.build_deck(plan)
+            prs.save(plan["output"])
+    else:
+        from build_all import load_module
+        module = load_module(path)
+        instrument_module(module)
+        with deck(name):
+            module.main()
+
+
+def main():
+    """Trace one deck build and export the spans."""
+    parser = argparse.ArgumentParser(description="Trace a deck build per slide, helper and phase.")
+    parser.add_argument("target", help="generator script (create_*.py) or deck spec")
+    parser.add_argument("--chrome", metavar="JSON", help="write Chrome trace-event JSON")
+    parser.add_argument("--collapsed", metavar="FILE", help="write collapsed stacks for flamegraphs")
+    args = parser.parse_args()
+
+    enable()
+    try:
+        trace_target(args.target)
+    finally:
+        disable()
+
+    if args.chrome:
+        with open(args.chrome, "w", encoding="utf-8") as f:
+            json.dump(chrome_trace(), f)
+        print(f"✓ Chrome trace: {args.chrome}")
+    if args.collapsed:
+        with open(args.collapsed, "w", encoding="utf-8") as f:
+            f.write("\n".join(collapsed_stacks()) + "\n")
+        print(f"✓ Collapsed stacks: {args.collapsed}")
+
+    for category in ("helper", "phase"):
+        print(f"\n{category.upper():<28} {'TOTAL':>10} {'CALLS':>7}")
+        for name, ns, calls in summary(category):
+            print(f"{name:<28} {ns / 1e6:>8.2f}ms {calls:>7}")
+
+
+if __name__ == "__main__":
+    main()
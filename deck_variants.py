@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Render several deck variants from one content model in a single pass.
+
+A deck spec with a "variants" list (see deck_spec.py) describes, for example,
+the original and HONEST claim sets, light and dark themes, and copies with or
+without source footnotes. The spec is compiled once. Each distinct slide
+across all variants is built once, or loaded from the incremental slide cache.
+Its serialized parts are then reused by every variant that shows it. The
+dark theme is applied to the serialized light slide as an XML rewrite, which
+needs no second python-pptx build.
+
+    python deck_variants.py specs/characterlock.json
+    python deck_variants.py specs/characterlock.json --only honest honest-dark
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from lxml import etree
+
+import deck_incremental
+import deck_spec
+from deck_package import write_package
+from deck_styles import DARK_THEME
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+
+def select_steps(plan, variant):
+    """The plan steps a variant shows, with footnotes dropped if it has none."""
+    steps = []
+    for step in plan["slides"]:
+        if step.get("claims") and variant["claims"] not in step["claims"]:
+            continue
+        if not variant["footnotes"] and step["footnote"]:
+            step = dict(step, footnote=None)
+        steps.append(step)
+    return steps
+
+
+def _hex(rgb):
+    return "%02X%02X%02X" % tuple(rgb)
+
+
+def _solid_fill(rgb):
+    fill = etree.Element(f"{{{NS_A}}}solidFill")
+    etree.SubElement(fill, f"{{{NS_A}}}srgbClr", val=_hex(rgb))
+    return fill
+
+
+def apply_dark_theme(slide_xml, theme=DARK_THEME):
+    """Rewrite a serialized light slide for a dark background.
+
+    Adds a solid background, swaps the light-deck accent colours and gives
+    every paragraph without an explicit colour the theme's text colour.
+    """
+    root = etree.fromstring(slide_xml)
+    c_sld = root.find(f"{{{NS_P}}}cSld")
+    for old in c_sld.findall(f"{{{NS_P}}}bg"):
+        c_sld.remove(old)
+    bg = etree.Element(f"{{{NS_P}}}bg")
+    bg_pr = etree.SubElement(bg, f"{{{NS_P}}}bgPr")
+    bg_pr.append(_solid_fill(theme["background"]))
+    etree.SubElement(bg_pr, f"{{{NS_A}}}effectLst")
+    c_sld.insert(0, bg)
+
+    swaps = {_hex(light): _hex(dark) for light, dark in theme["colors"].items()}
+    for color in root.iter(f"{{{NS_A}}}srgbClr"):
+        color.set("val", swaps.get(color.get("val"), color.get("val")))
+
+    for p in root.iter(f"{{{NS_A}}}p"):
+        p_pr = p.find(f"{{{NS_A}}}pPr")
+        if p_pr is None:
+            p_pr = etree.Element(f"{{{NS_A}}}pPr")
+            p.insert(0, p_pr)
+        def_rpr = p_pr.find(f"{{{NS_A}}}defRPr")
+        if def_rpr is None:
+            def_rpr = etree.SubElement(p_pr, f"{{{NS_A}}}defRPr")
+            ext_lst = p_pr.find(f"{{{NS_A}}}extLst")
+            if ext_lst is not None:
+                ext_lst.addprevious(def_rpr)
+        if def_rpr.find(f"{{{NS_A}}}solidFill") is None:
+            # solidFill goes after a:ln, before everything else in a:defRPr
+            ln = def_rpr.find(f"{{{NS_A}}}ln")
+            position = 0 if ln is None else list(def_rpr).index(ln) + 1
+            def_rpr.insert(position, _solid_fill(theme["text"]))
+
+    return etree.tostring(root, encoding="UTF-8", standalone=True)
+
+
+def variant_parts(plan, variant_name=None):
+    """(slide XML, rels XML) for every slide of a plan, or of one of its variants."""
+    steps = plan["slides"]
+    dark = False
+    if variant_name is not None:
+        variant = next(v for v in plan["variants"] if v["name"] == variant_name)
+        steps = select_steps(plan, variant)
+        dark = variant["theme"] == "dark"
+    parts, _ = deck_incremental.build_slides(steps)
+    if dark:
+        parts = [(apply_dark_theme(slide_xml), rels_xml) for slide_xml, rels_xml in parts]
+    return parts
+
+
+def render_variants(plan, output_dir=None, only=None):
+    """Render every (or only the named) variant of a compiled plan.
+
+    Returns (variant name, output file, slide count) per variant, and
+    (distinct slides built, slides served from cache, slide instances written).
+    """
+    variants = [v for v in plan["variants"] if not only or v["name"] in only]
+
+    # One content build: every distinct slide across all variants
+    selected = [select_steps(plan, variant) for variant in variants]
+    steps = [step for variant_steps in selected for step in variant_steps]
+    light, built = deck_incremental.build_slides(steps)
+    keys = [deck_incremental.slide_hash(step) for step in steps]
+
+    # N cheap serializations
+    dark = {}
+    results = []
+    written = 0
+    offset = 0
+    for variant, variant_steps in zip(variants, selected):
+        indices = range(offset, offset + len(variant_steps))
+        offset += len(variant_steps)
+        if variant["theme"] == "dark":
+            for i in indices:
+                if keys[i] not in dark:
+                    slide_xml, rels_xml = light[i]
+                    dark[keys[i]] = (apply_dark_theme(slide_xml), rels_xml)
+            parts = [dark[keys[i]] for i in indices]
+        else:
+            parts = [light[i] for i in indices]
+        output_file = variant["output"]
+        if output_dir:
+            output_file = os.path.join(output_dir, os.path.basename(output_file))
+        count = write_package(output_file, deck_incremental.base_parts(), parts)
+        written += count
+        results.append((variant["name"], output_file, count))
+    return results, (built, len(set(keys)) - built, written)
+
+
+def main():
+    """Render all variants of one or more deck specs."""
+    parser = argparse.ArgumentParser(description="Render deck variants from one content model.")
+    parser.add_argument("specs", nargs="+", help="deck spec files with a variants list")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="render only these variants")
+    args = parser.parse_args()
+
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    failures = 0
+    for path in args.specs:
+        start = time.perf_counter()
+        try:
+            plan = deck_spec.compile_spec(path)
+        except (OSError, deck_spec.SpecError) as exc:
+            print(f"✗ {exc}", file=sys.stderr)
+            failures += 1
+            continue
+        if not plan["variants"]:
+            print(f"✗ {path}: spec defines no variants", file=sys.stderr)
+            failures += 1
+            continue
+        unknown = [name for name in args.only or () if name not in {v["name"] for v in plan["variants"]}]
+        if unknown:
+            print(f"✗ {path}: no variant named {', '.join(map(repr, unknown))}", file=sys.stderr)
+            failures += 1
+            continue
+        results, (built, cached, written) = render_variants(plan, args.output_dir, args.only)
+        elapsed = (time.perf_counter() - start) * 1000
+        for name, output_file, count in results:
+            print(f"✓ {name:<20} → {output_file} ({count} slides)")
+        print(f"  {path}: built {built} distinct slides, {cached} from cache, "
+              f"wrote {written} slides in {len(results)} decks ({elapsed:.0f} ms)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
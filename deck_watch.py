@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Watch generator scripts and deck specs, and rebuild decks as they are saved.
+
+The interpreter, python-pptx and the base template stay loaded between
+builds. When a file changes, only the decks it affects are rebuilt:
+
+- an edited spec is rebuilt through the incremental slide cache
+  (deck_incremental / deck_variants), so only its changed slides are
+  regenerated;
+- an edited generator script is re-imported and its main() re-run against
+  the warm template instead of a fresh Presentation();
+- an edited shared module (styles, font metrics, the v2 helpers) is reloaded
+  with the shared modules built on it, names imported from them elsewhere
+  are rebound, and every spec and every generator that imports them is
+  rebuilt.
+
+    python deck_watch.py                      # all create_*.py and specs/*
+    python deck_watch.py specs/characterlock.json -o out/
+"""
+
+import argparse
+import ast
+import contextlib
+import glob
+import importlib
+import io
+import os
+import sys
+import time
+import types
+
+import build_all
+import deck_incremental
+import deck_spec
+import deck_variants
+import template_cache
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules whose edits affect other decks, in reload order
+SHARED_MODULES = ("deck_styles", "font_metrics", "deck_charts", "deck_images", "create_presentation",
+                  "create_presentation_v2", "create_dark_presentation", "deck_variants")
+
+SPEC_PATTERNS = ("specs/*.json", "specs/*.yaml", "specs/*.yml")
+
+
+def _imports(path):
+    """Top-level module names a script imports."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def _shared_dependents(modules):
+    """The given shared modules and every shared module that imports one of them, in reload order."""
+    stale = set(modules)
+    for name in SHARED_MODULES:  # dependencies come first, so one pass is enough
+        if stale & _imports(os.path.join(REPO_DIR, f"{name}.py")):
+            stale.add(name)
+    return [name for name in SHARED_MODULES if name in stale]
+
+
+def _rebind(old_namespaces):
+    """Point names other repo modules imported from reloaded modules at the new objects.
+
+    `from deck_styles import add_paragraphs` keeps the function object from
+    before the reload. A global is rebound when it is an object the old
+    module held, and either has the same name there or is a function or
+    class imported under another name.
+    """
+    replacements = {}
+    for name, namespace in old_namespaces.items():
+        new = vars(sys.modules[name])
+        for attr, value in namespace.items():
+            if not attr.startswith("__") and attr in new and new[attr] is not value:
+                replacements[id(value)] = (value, attr, new[attr])
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None) or ""
+        if module.__name__ in old_namespaces or not path.startswith(REPO_DIR + os.sep):
+            continue
+        for global_name, value in list(vars(module).items()):
+            match = replacements.get(id(value))
+            if match is not None and match[0] is value and (global_name == match[1]
+                                                            or isinstance(value, (type, types.FunctionType))):
+                setattr(module, global_name, match[2])
+
+
+def reload_shared(modules):
+    """Reload edited shared modules, the shared modules built on them, and rebind their importers.
+
+    Returns the names of the reloaded modules. The helper digest is dropped,
+    so slides are hashed against the reloaded code.
+    """
+    names = [name for name in _shared_dependents(modules) if name in sys.modules]
+    old_namespaces = {name: dict(vars(sys.modules[name])) for name in names}
+    for name in names:
+        importlib.reload(sys.modules[name])
+    _rebind(old_namespaces)
+    deck_incremental.invalidate_helpers()
+    return names
+
+
+def _module_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class DeckWatcher:
+    """Polls file modification times and rebuilds the affected decks."""
+
+    def __init__(self, generators, specs, output_dir=None):
+        self.generators = [os.path.abspath(path) for path in generators]
+        self.specs = [os.path.abspath(path) for path in specs]
+        self.output_dir = output_dir
+        self.shared = [os.path.join(REPO_DIR, f"{name}.py") for name in SHARED_MODULES]
+        self.mtimes = self.snapshot()
+
+    def watched(self):
+        return sorted(set(self.generators) | set(self.specs) | set(self.shared))
+
+    def snapshot(self):
+        mtimes = {}
+        for path in self.watched():
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
+
+    def poll(self, settle=0.05):
+        """Return the paths changed since the last poll, once editors have finished writing."""
+        current = self.snapshot()
+        if current == self.mtimes:
+            return []
+        # Editors often write in several steps; wait until the tree is quiet
+        while True:
+            time.sleep(settle)
+            settled = self.snapshot()
+            if settled == current:
+                break
+            current = settled
+        changed = [path for path in current if current[path] != self.mtimes.get(path)]
+        self.mtimes = current
+        return changed
+
+    def affected(self, changed):
+        """Generators and specs to rebuild for a set of changed paths."""
+        changed_modules = set(_shared_dependents({_module_name(path) for path in changed if path in self.shared}))
+        generators = [path for path in self.generators
+                      if path in changed or changed_modules & _imports(path)]
+        specs = list(self.specs) if changed_modules else [path for path in self.specs if path in changed]
+        return changed_modules, generators, specs
+
+    def build_generator(self, path):
+        """Re-run a generator script's main() against the warm template."""
+        module = build_all.load_module(path)
+        module.Presentation = template_cache.new_presentation
+        cwd = os.getcwd()
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            os.chdir(self.output_dir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                module.main()
+        finally:
+            os.chdir(cwd)
+        output_file = build_all.find_output_file(path) or "?"
+        if self.output_dir:
+            output_file = os.path.join(self.output_dir, output_file)
+        return f"{output_file} (all slides)"
+
+    def build_spec(self, path):
+        """Rebuild a spec deck, regenerating only its changed slides."""
+        plan = deck_spec.compile_spec(path)
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+        if plan["variants"]:
+            results, (built, _, written) = deck_variants.render_variants(plan, self.output_dir)
+            return f"{len(results)} variants (rebuilt {built} slides, wrote {written})"
+        output_file = plan["output"]
+        if self.output_dir:
+            output_file = os.path.join(self.output_dir, os.path.basename(output_file))
+        rebuilt, total = deck_incremental.build_incremental(plan, output_file)
+        return f"{output_file} (rebuilt {rebuilt}/{total} slides)"
+
+    def rebuild(self, changed):
+        """Rebuild everything affected by the changed paths; return the failure count."""
+        changed_modules, generators, specs = self.affected(changed)
+        failures = 0
+        if changed_modules:
+            try:
+                reload_shared(changed_modules)
+            except Exception as exc:  # a half-saved module; wait for the next save
+                print(f"✗ reload failed: {type(exc).__name__}: {exc}", file=sys.stderr)
+                return 1
+        for build, path in [(self.build_generator, g) for g in generators] + \
+                           [(self.build_spec, s) for s in specs]:
+            start = time.perf_counter()
+            try:
+                summary = build(path)
+            except Exception as exc:  # report and keep watching
+                print(f"✗ {os.path.relpath(path)}: {type(exc).__name__}: {exc}", file=sys.stderr)
+                failures += 1
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"✓ {os.path.relpath(path)} → {summary} in {elapsed:.0f} ms")
+        return failures
+
+    def run(self, interval=0.2):
+        """Poll until interrupted."""
+        print(f"Watching {len(self.watched())} files (Ctrl-C to stop)")
+        while True:
+            changed = self.poll()
+            if changed:
+                self.rebuild(changed)
+            time.sleep(interval)
+
+
+def main():
+    """Build once, then rebuild decks whenever their sources change."""
+    parser = argparse.ArgumentParser(description="Watch generators and specs and rebuild decks on save.")
+    parser.add_argument("paths", nargs="*",
+                        help="generator scripts and spec files (default: all create_*.py and specs/*)")
+    parser.add_argument("-o", "--output-dir", default=None,
+                        help="directory for generated decks (default: current directory)")
+    parser.add_argument("--interval", type=float, default=0.2, help="polling interval in seconds")
+    parser.add_argument("--no-initial", action="store_true", help="skip the initial full build")
+    args = parser.parse_args()
+
+    if args.paths:
+        generators = [p for p in args.paths if p.endswith(".py")]
+        specs = [p for p in args.paths if not p.endswith(".py")]
+    else:
+        generators = build_all.discover_generators()
+        specs = sorted(p for pattern in SPEC_PATTERNS for p in glob.glob(os.path.join(REPO_DIR, pattern)))
+
+    watcher = DeckWatcher(generators, specs, args.output_dir)
+    template_cache.base_presentation()  # warm before the first save
+    if not args.no_initial:
+        watcher.rebuild(watcher.generators + watcher.specs)
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
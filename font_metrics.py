@@ -0,0 +1,169 @@
+"""
+Cached font metrics for measuring and fitting slide text at build time.
+
+Glyph advances are read from the font once, at a large reference size, and
+kept as em fractions: a string's width at any point size is the sum of its
+advances times the size. Advance tables are cached per font, and word widths
+are cached per font across calls. Wrapping a paragraph at a new size only
+re-runs the greedy line breaker on the cached word widths, so fit_font_size()
+can try every size from the requested one downward in microseconds.
+
+Metrics ignore kerning and ligatures. The decks use the theme font
+(Calibri); when neither Calibri nor its metric-compatible substitute Carlito
+is installed, DejaVu Sans is used. DejaVu Sans is wider, so fitting errs
+toward smaller text.
+"""
+
+import functools
+
+from PIL import ImageFont
+
+EMU_PER_INCH = 914400
+EMU_PER_POINT = 12700
+
+# Font files tried, in order, for each typeface (Pillow also searches the system font directories)
+FONT_FILES = {
+    ("Calibri", False): ("calibri.ttf", "Carlito-Regular.ttf", "DejaVuSans.ttf"),
+    ("Calibri", True): ("calibrib.ttf", "Carlito-Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+DEFAULT_FONT = "Calibri"
+
+# Reference size the advance tables are measured at, in pixels per em
+_REFERENCE_SIZE = 2048
+
+# Characters measured up front: ASCII, Latin-1, general punctuation, arrows
+_PRELOADED = [range(0x20, 0x7F), range(0xA0, 0x100), range(0x2000, 0x2070), range(0x2190, 0x2200)]
+
+# python-pptx text-box insets: 0.1 in left/right, 0.05 in top/bottom
+DEFAULT_INSETS = (0.1, 0.05)
+LINE_SPACING = 1.2
+
+# Word-width cache entries kept per font before the cache is reset
+WORD_CACHE_LIMIT = 200000
+
+
+class _Advances(dict):
+    """Advance widths in ems, keyed by character; unseen characters are measured on demand."""
+
+    def __init__(self, font):
+        super().__init__()
+        self.font = font
+
+    def __missing__(self, char):
+        width = self[char] = self.font.getlength(char) / _REFERENCE_SIZE
+        return width
+
+
+class FontMetrics:
+    """Advance table and word-width cache for one font file."""
+
+    __slots__ = ("path", "advances", "_words")
+
+    def __init__(self, path):
+        font = ImageFont.truetype(path, _REFERENCE_SIZE, layout_engine=ImageFont.Layout.BASIC)
+        self.path = path
+        self.advances = _Advances(font)
+        for block in _PRELOADED:
+            for codepoint in block:
+                self.advances[chr(codepoint)]
+        self._words = {}
+
+    def em_width(self, text):
+        """Width of a string in ems (multiply by the point size for points)."""
+        width = self._words.get(text)
+        if width is None:
+            if len(self._words) >= WORD_CACHE_LIMIT:
+                self._words.clear()
+            width = self._words[text] = sum(map(self.advances.__getitem__, text))
+        return width
+
+    def measure(self, strings, size):
+        """Widths in points of many strings at one size."""
+        em_width = self.em_width
+        return [em_width(text) * size for text in strings]
+
+    def line_count(self, paragraph, width_pt, size):
+        """Number of lines a paragraph wraps to in a box width_pt wide."""
+        return sum(self._wrapped_lines(*self._word_widths(line), self.em_width(" "), width_pt / size)
+                   for line in paragraph.split("\n"))
+
+    def _word_widths(self, line):
+        words = line.split(" ")
+        return words, [self.em_width(word) for word in words]
+
+    def _wrapped_lines(self, words, widths, space, width_em):
+        """Greedy word wrap, in ems; a word wider than the box starts a new line and breaks between characters."""
+        lines = 1
+        used = -space
+        for word, width in zip(words, widths):
+            if used + space + width <= width_em:
+                used += space + width
+            elif width <= width_em:
+                lines += 1
+                used = width
+            else:
+                if used > 0:
+                    lines += 1
+                used = 0
+                for char in word:
+                    advance = self.advances[char]
+                    if used + advance > width_em and used > 0:
+                        lines += 1
+                        used = advance
+                    else:
+                        used += advance
+        return lines
+
+
+@functools.lru_cache(maxsize=None)
+def _load(path):
+    return FontMetrics(path)
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics(font=DEFAULT_FONT, bold=False):
+    """Cached metrics for a typeface, falling back through FONT_FILES."""
+    candidates = FONT_FILES.get((font, bool(bold)), (font,)) + FONT_FILES[(DEFAULT_FONT, bool(bold))]
+    for path in candidates:
+        try:
+            return _load(path)
+        except OSError:
+            continue
+    raise OSError(f"no usable font file for {font!r} (tried {', '.join(candidates)})")
+
+
+def text_width(text, size, bold=False, font=DEFAULT_FONT):
+    """Width of one line of text in points."""
+    return get_metrics(font, bold).em_width(text) * size
+
+
+def measure(strings, size, bold=False, font=DEFAULT_FONT):
+    """Widths in points of many strings at one size."""
+    return get_metrics(font, bold).measure(strings, size)
+
+
+def fit_font_size(paragraphs, width, height, max_size, min_size=8, bold=False, font=DEFAULT_FONT,
+                  space_after=0, insets=DEFAULT_INSETS, step=1):
+    """Largest font size, from max_size down in `step` points, at which the text fits the box.
+
+    paragraphs is a string or a list of paragraph strings; width and height are
+    the box size in inches; space_after is paragraph spacing in points. Returns
+    min_size (or max_size, if that is smaller) when nothing larger fits.
+    """
+    if isinstance(paragraphs, str):
+        paragraphs = [paragraphs]
+    metrics = get_metrics(font, bold)
+    space = metrics.em_width(" ")
+    width_pt = (width - 2 * insets[0]) * 72
+    height_pt = (height - 2 * insets[1]) * 72
+    # Word widths are measured once; each candidate size only re-wraps them
+    lines = [metrics._word_widths(line) for paragraph in paragraphs for line in paragraph.split("\n")]
+    spacing = space_after * max(len(paragraphs) - 1, 0)
+
+    size = max_size
+    while size > min_size:
+        line_total = sum(metrics._wrapped_lines(words, widths, space, width_pt / size) for words, widths in lines)
+        if line_total * size * LINE_SPACING + spacing <= height_pt:
+            return size
+        size -= step
+    return min(min_size, max_size)
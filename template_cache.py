@@ -0,0 +1,61 @@
+"""
+Per-process cache of the parsed 10x7.5 in base template.
+
+Presentation() unzips and parses the bundled default template on every call,
+which dominates the build time of small decks. The cache parses it once per
+process and hands out new presentations by deep-copying the cached one. The
+slide masters, layouts, theme and binary parts are never modified by the slide
+helpers, so clones share those parts with the cached base instead of copying
+them; only the presentation part, package and document properties are copied.
+"""
+
+import copy
+
+from pptx import Presentation
+from pptx.util import Inches
+
+# Parts that clones share with the cached base (read-only by contract)
+SHARED_PART_PREFIXES = (
+    "/ppt/slideMasters/",
+    "/ppt/slideLayouts/",
+    "/ppt/theme/",
+    "/ppt/printerSettings/",
+    "/docProps/thumbnail",
+)
+
+_base = None
+_shared_parts = ()
+
+
+def load_base_presentation():
+    """Parse a fresh 10x7.5 in presentation from the default template."""
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    return prs
+
+
+def base_presentation():
+    """Return the cached base presentation, parsing it on first use."""
+    global _base, _shared_parts
+    if _base is None:
+        _base = load_base_presentation()
+        _shared_parts = tuple(
+            part for part in _base.part.package.iter_parts()
+            if str(part.partname).startswith(SHARED_PART_PREFIXES)
+        )
+    return _base
+
+
+def new_presentation():
+    """Return a new, empty 10x7.5 in presentation cloned from the cache."""
+    base = base_presentation()
+    memo = {id(part): part for part in _shared_parts}
+    return copy.deepcopy(base, memo)
+
+
+def clear():
+    """Drop the cached base so the next call re-parses the template."""
+    global _base, _shared_parts
+    _base = None
+    _shared_parts = ()
@@ -0,0 +1,28 @@
+"""
+Fitting and wrapping text with font_metrics.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import font_metrics
+
+
+def test_fit_never_exceeds_max_size():
+    assert font_metrics.fit_font_size("hi", 4, 1, 6) == 6
+
+
+def test_over_wide_word_wraps_between_characters():
+    metrics = font_metrics.get_metrics()
+    word = "x" * 400
+    width_pt = metrics.em_width(word) * 12 / 10
+    assert metrics.line_count(word, width_pt, 12) >= 10
+    assert font_metrics.fit_font_size(word, 1, 0.3, 12) == 8
+
+
+def test_over_wide_word_starts_a_new_line():
+    metrics = font_metrics.get_metrics()
+    width_pt = metrics.em_width("x" * 10) * 12
+    assert metrics.line_count("a " + "x" * 15, width_pt, 12) == 3
@@ -0,0 +1,42 @@
+"""
+Builder code generated by deck_import from untrusted decks.
+"""
+
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deck_import
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _rename_shape(source, target, old, new):
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as out:
+        for info in src.infolist():
+            blob = src.read(info.filename)
+            if info.filename.startswith("ppt/slides/slide"):
+                blob = blob.replace(old, new)
+            out.writestr(info, blob)
+
+
+def test_shape_name_cannot_inject_code(tmp_path):
+    marker = tmp_path / "pwned"
+    evil = tmp_path / "evil.pptx"
+    payload = f'Oval 11&#10;open(&quot;{marker}&quot;, &quot;w&quot;).write(&quot;1&quot;)'.encode()
+    _rename_shape(os.path.join(REPO_DIR, "CharacterLock_Dark_Theme.pptx"), evil, b'name="Oval 11"',
+                  b'name="' + payload + b'"')
+    results = list(deck_import.import_deck(str(evil), builder=True))
+    assert not marker.exists()
+    code = [line for result in results for line in result["code"]]
+    assert not any(line.startswith("open(") for line in "\n".join(code).splitlines())
+
+
+@pytest.mark.parametrize("source", ['open("x", "w")', "import os", "slide.__class__", 'prs.save("x")'])
+def test_builder_code_is_restricted(source):
+    with pytest.raises(ValueError):
+        deck_import.compile_builder([source])
@@ -0,0 +1,41 @@
+"""
+The PPTX backend of deck_ir: cached parts for unchanged slides, generated XML for edited ones.
+"""
+
+import os
+import sys
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import deck_incremental
+import deck_ir
+import deck_spec
+
+SPEC = os.path.join(ROOT, "specs", "characterlock_honest.json")
+
+
+def _slides(path):
+    with zipfile.ZipFile(path) as z:
+        return [z.read(name) for name in sorted(n for n in z.namelist() if n.startswith("ppt/slides/slide"))]
+
+
+def test_unedited_deck_matches_incremental_build(tmp_path):
+    plan = deck_spec.compile_spec(SPEC)
+    deck_ir.write_pptx(deck_ir.build_ir(plan), str(tmp_path / "ir.pptx"))
+    deck_incremental.build_incremental(plan, str(tmp_path / "inc.pptx"))
+    assert _slides(tmp_path / "ir.pptx") == _slides(tmp_path / "inc.pptx")
+
+
+def test_ir_edits_reach_the_pptx(tmp_path):
+    deck = deck_ir.build_ir(deck_spec.compile_spec(SPEC))
+    shape = next(shape for shape in deck.slides[1].shapes if shape.text is not None)
+    shape.text.paragraphs[0].runs[0].text = "Edited in the IR"
+    shape.fill = (1, 2, 3)
+    deck_ir.write_pptx(deck, str(tmp_path / "edited.pptx"))
+    lowered = deck_ir.lower_file(str(tmp_path / "edited.pptx"))
+    assert len(lowered.slides) == len(deck.slides)
+    edited = next(s for s in lowered.slides[1].shapes if s.name == shape.name)
+    assert edited.text.text == shape.text.text and edited.fill == (1, 2, 3)
+    assert deck_ir.fingerprint(lowered.slides[0].shapes) == deck_ir.fingerprint(deck.slides[0].shapes)
@@ -0,0 +1,45 @@
+"""
+Shrinking localized text frames that overflow (deck_localize).
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import deck_incremental
+import deck_localize
+from deck_ir import slide_context
+
+TITLE = "1. The Problem: AI Character Inconsistency"
+# One 161-character German compound word, with no space to wrap at
+COMPOUND = ("Donaudampfschifffahrtselektrizitätenhauptbetriebswerkbauunterbeamtengesellschafts"
+            "vorstandsvorsitzendenstellvertreterinnenausbildungsverordnungsentwurfsberatungen")
+STEP = {"helper": "create_content_slide", "kwargs": {"title": TITLE, "content_items": ["Item"]},
+        "footnote": None, "claims": None}
+
+
+def test_long_compound_title_is_shrunk(tmp_path):
+    localized, _ = deck_localize.localize_steps([STEP], {TITLE: COMPOUND})
+    cache_dir = str(tmp_path / "slides")
+    (source_xml, _), = deck_incremental.build_slides([STEP], cache_dir=cache_dir)[0]
+    (slide_xml, rels_xml), = deck_incremental.build_slides(localized, cache_dir=cache_dir)[0]
+    context = slide_context(rels_xml, deck_incremental.base_parts(), {})
+    _, changes = deck_localize.fit_slide(slide_xml, source_xml, *context)
+    assert [name for name, _, _ in changes] == ["Title 1"]
+    assert changes[0][1] < 100
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]"])
+def test_malformed_memory_is_a_value_error(tmp_path, content):
+    (tmp_path / "de.json").write_text(content, encoding="utf-8")
+    with pytest.raises(ValueError, match="de.json"):
+        deck_localize.load_memory("de", str(tmp_path))
+
+
+def test_memory_ignores_untranslated_keys(tmp_path):
+    (tmp_path / "de.json").write_text(json.dumps({TITLE: "Titel", "Item": None}), encoding="utf-8")
+    assert deck_localize.load_memory("de", str(tmp_path)) == {TITLE: "Titel"}
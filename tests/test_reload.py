@@ -0,0 +1,48 @@
+"""
+Reloading shared helper modules in a long-lived process (deck_watch, deck_daemon).
+"""
+
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Builds one slide, edits deck_styles.add_paragraphs to upper-case its text, reloads and rebuilds
+SCRIPT = textwrap.dedent("""
+    import sys
+    import deck_incremental
+    import deck_watch
+
+    STEP = {"helper": "create_content_slide", "kwargs": {"title": "T", "content_items": ["lower case"]},
+            "footnote": None, "claims": None}
+
+    def build():
+        (slide_xml, _), = deck_incremental.build_slides([STEP], cache_dir="cache")[0]
+        return slide_xml
+
+    before = build()
+    with open("deck_styles.py", encoding="utf-8") as f:
+        source = f.read()
+    source = source.replace("_runs_xml(line)}", "_runs_xml(line.upper())}")
+    with open("deck_styles.py", "w", encoding="utf-8") as f:
+        f.write(source)
+    reloaded = deck_watch.reload_shared(["deck_styles"])
+    after = build()
+    print(",".join(reloaded))
+    print(b"lower case" in before, b"LOWER CASE" in after)
+""")
+
+
+def test_reload_rebuilds_with_edited_helper(tmp_path):
+    for path in glob.glob(os.path.join(REPO_DIR, "*.py")):
+        shutil.copy(path, tmp_path)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run([sys.executable, "-c", SCRIPT], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, check=True)
+    reloaded, checks = result.stdout.splitlines()
+    assert "create_presentation_v2" in reloaded.split(",")
+    assert checks == "True True"
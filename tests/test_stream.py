@@ -0,0 +1,41 @@
+"""
+Streaming chart slides (deck_stream) and the bounded related-part registry (deck_package).
+"""
+
+import io
+import json
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+
+import deck_package
+import deck_spec
+import deck_stream
+
+
+def test_streamed_chart_keeps_its_workbook(tmp_path):
+    (tmp_path / "scores.csv").write_text("step,score\n1,0.5\n2,0.9\n", encoding="utf-8")
+    (tmp_path / "spec.json").write_text(json.dumps({"output": "c.pptx", "slides": [
+        {"type": "chart", "title": "Scores", "data": "scores.csv"}]}), encoding="utf-8")
+    out = io.BytesIO()
+    deck_stream.build_deck_streaming(deck_spec.compile_spec(str(tmp_path / "spec.json")), out)
+    names = zipfile.ZipFile(out).namelist()
+    assert any(name.startswith("ppt/charts/_rels/") for name in names)
+    chart, = [shape.chart for shape in Presentation(out).slides[0].shapes if shape.has_chart]
+    assert chart.part.chart_workbook.xlsx_part is not None
+
+
+def test_related_parts_are_bounded():
+    parts = deck_package._RelatedParts(10)
+    parts["a"] = (b"12345", "image/png", None)
+    parts["b"] = (b"12345", "image/png", None)
+    parts["a"]  # a is now the most recently used
+    parts["c"] = (b"1", "image/png", None)
+    assert list(parts) == ["a", "c"] and parts.size == 6
+    parts.loader = {"b": (b"12345", "image/png", None)}.get
+    assert parts["b"][0] == b"12345"
+    assert list(parts) == ["c", "b"]